@@ -0,0 +1,533 @@
+from datalab.BitVector import BitVector, _pack, _unpack
+from datalab.Matrix import Matrix
+
+from datalab.utils import *
+
+# positions of set bits of every byte value
+_BYTE_BITS = tuple(tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256))
+
+
+def _positions(bits: int, size: int) -> Iterator[int]:
+    # Positions of set bits. Zero bytes are skipped by itertools.compress in C,
+    # so sparse rows cost O(number of non-zero bytes) Python steps.
+    data = bits.to_bytes((size + 7) // 8, "little")
+
+    for byte_index in itertools.compress(range(len(data)), data):
+        offset = 8 * byte_index
+
+        for bit in _BYTE_BITS[data[byte_index]]:
+            yield offset + bit
+
+
+class BitMatrix:
+    """Boolean (logical) matrix stored as packed bits.
+
+    Every row is an arbitrary-precision integer with column j as bit j, so the matrix takes one bit
+    per element, element-wise logical operations process machine words at once and counting uses
+    population count (`int.bit_count`).
+
+    Matrix of dtype bool keeps its list storage, so packing only happens on explicit conversion
+    (`Matrix.to_bit_matrix` or this constructor); `to_matrix` converts back.
+
+    Parameters
+    ----------
+    object : Iterable or tuple[int, int]
+        Rows (Matrix, BitVectors or iterables of truthy/falsy values), or shape (rows, columns).
+    fill : bool, optional
+        Value of all elements when shape is given. Default False.
+
+    Example
+    -------
+    >>> mask = BitMatrix([[1, 0], [1, 1]])
+    >>> (mask & ~BitMatrix([[0, 0], [1, 0]])).to_list()
+    [[True, False], [False, True]]"""
+
+    def __init__(self, object: Union[Iterable, tuple[int, int]], fill: bool = False) -> None:
+        if (
+            isinstance(object, tuple)
+            and len(object) == 2
+            and all(isinstance(item, int) and not isinstance(item, bool) for item in object)
+        ):
+            rows, columns = object
+
+            if rows < 0 or columns < 0:
+                raise ValueError("BitMatrix shape must not be negative")
+
+            row = (1 << columns) - 1 if fill else 0
+            self.__rows = [row] * rows
+            self.__columns = columns
+
+        else:
+            lines = object.to_list() if isinstance(object, Matrix) else object
+            packed = [
+                (line.bits, line.size) if isinstance(line, BitVector) else _pack(line)
+                for line in lines
+            ]
+            sizes = {size for _, size in packed}
+
+            if len(sizes) > 1:
+                raise ValueError("All rows of BitMatrix must have the same length")
+
+            self.__rows = [bits for bits, _ in packed]
+            self.__columns = sizes.pop() if sizes else 0
+
+    @classmethod
+    def _from_rows(cls, rows: list[int], columns: int) -> Self:
+        """Wraps list of integers with already masked row bits into a new matrix without copying it"""
+
+        matrix = cls.__new__(cls)
+        matrix.__rows = rows
+        matrix.__columns = columns
+
+        return matrix
+
+    @property
+    def rows(self) -> int:
+        """Number of rows"""
+
+        return len(self.__rows)
+
+    @property
+    def columns(self) -> int:
+        """Number of columns"""
+
+        return self.__columns
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Shape of the matrix (rows, columns)"""
+
+        return len(self.__rows), self.__columns
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes needed for the packed elements"""
+
+        return len(self.__rows) * ((self.__columns + 7) // 8)
+
+    @property
+    def _mask(self) -> int:
+        return (1 << self.__columns) - 1
+
+    def _position(self, row: int, column: int) -> tuple[int, int]:
+        if not isinstance(row, int) or not isinstance(column, int):
+            raise TypeError("The index you are referring to must be of the form: object[int, int]")
+
+        if not -len(self.__rows) <= row < len(self.__rows):
+            raise IndexError(f"BitMatrix has {len(self.__rows)} rows, you cannot appeal to {row} row")
+
+        if not -self.__columns <= column < self.__columns:
+            raise IndexError(
+                f"BitMatrix has {self.__columns} columns, you cannot appeal to {column} column"
+            )
+
+        return row, column % self.__columns
+
+    def get(self, row: int, column: int) -> bool:
+        """Returns the element at the specified row and column.
+
+        Raises
+        ------
+        TypeError
+            If indexes are not ints.
+        IndexError
+            If indexes are out of matrix's range."""
+
+        row, column = self._position(row, column)
+
+        return bool(self.__rows[row] >> column & 1)
+
+    def __getitem__(self, position: Union[int, tuple[int, int]]) -> Union[bool, BitVector]:
+        if isinstance(position, tuple):
+            return self.get(*position)
+
+        return self.get_row(position)
+
+    def set(self, row: int, column: int, value: Any) -> None:
+        """Sets the element at the specified row and column to truth value of the given value.
+
+        Raises
+        ------
+        TypeError
+            If indexes are not ints.
+        IndexError
+            If indexes are out of matrix's range."""
+
+        row, column = self._position(row, column)
+
+        if value:
+            self.__rows[row] |= 1 << column
+        else:
+            self.__rows[row] &= ~(1 << column)
+
+    def __setitem__(self, position: tuple[int, int], value: Any) -> None:
+        self.set(*position, value)
+
+    def get_row(self, row: int) -> BitVector:
+        """Returns a copy of the row as BitVector"""
+
+        if not isinstance(row, int):
+            raise TypeError("Row index must be an int")
+
+        if not -len(self.__rows) <= row < len(self.__rows):
+            raise IndexError(f"BitMatrix has {len(self.__rows)} rows, you cannot appeal to {row} row")
+
+        return BitVector._from_bits(self.__rows[row], self.__columns)
+
+    def _operand(self, other: Union[Self, Iterable]) -> list[int]:
+        if not isinstance(other, BitMatrix):
+            other = BitMatrix(other)
+
+        if other.shape != self.shape:
+            raise ArithmeticError("Cannot combine bit matrices with different shapes")
+
+        return other.__rows
+
+    def logical_and(self, other: Union[Self, Iterable]) -> Self:
+        """Element-wise logical and, computed word by word"""
+
+        rows = [a & b for a, b in zip(self.__rows, self._operand(other))]
+
+        return BitMatrix._from_rows(rows, self.__columns)
+
+    def logical_or(self, other: Union[Self, Iterable]) -> Self:
+        """Element-wise logical or, computed word by word"""
+
+        rows = [a | b for a, b in zip(self.__rows, self._operand(other))]
+
+        return BitMatrix._from_rows(rows, self.__columns)
+
+    def logical_xor(self, other: Union[Self, Iterable]) -> Self:
+        """Element-wise exclusive or, computed word by word"""
+
+        rows = [a ^ b for a, b in zip(self.__rows, self._operand(other))]
+
+        return BitMatrix._from_rows(rows, self.__columns)
+
+    def logical_not(self) -> Self:
+        """Element-wise negation, computed word by word"""
+
+        mask = self._mask
+
+        return BitMatrix._from_rows([row ^ mask for row in self.__rows], self.__columns)
+
+    def __and__(self, other: Union[Self, Iterable]) -> Self:
+        return self.logical_and(other)
+
+    def __or__(self, other: Union[Self, Iterable]) -> Self:
+        return self.logical_or(other)
+
+    def __xor__(self, other: Union[Self, Iterable]) -> Self:
+        return self.logical_xor(other)
+
+    def __invert__(self) -> Self:
+        return self.logical_not()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BitMatrix):
+            return NotImplemented
+
+        return self.__columns == other.__columns and self.__rows == other.__rows
+
+    __hash__ = None
+
+    def _boolean_product(self, other: Self) -> list[int]:
+        # Method of Four Russians over bytes: rows of other are grouped by 8, for every group
+        # OR-combinations of its rows are tabulated (lazily, only for byte values which occur),
+        # then every product row ORs one table entry per non-zero byte of the row of self.
+        inner = other.__rows
+        tables = {}
+
+        def combination(group: int, byte: int) -> int:
+            table = tables.setdefault(group, {0: 0})
+            value = table.get(byte)
+
+            if value is None:
+                lowest = byte & -byte
+                value = combination(group, byte ^ lowest) | inner[8 * group + lowest.bit_length() - 1]
+                table[byte] = value
+
+            return value
+
+        size = (self.__columns + 7) // 8
+        rows = []
+
+        for row in self.__rows:
+            data = row.to_bytes(size, "little")
+            result = 0
+
+            for group in itertools.compress(range(size), data):
+                result |= combination(group, data[group])
+
+            rows.append(result)
+
+        return rows
+
+    def multiplication(self, other: Union[Self, Matrix, Iterable]) -> Self:
+        """Boolean matrix product: element (i, j) is True if row i of self and column j of other
+        have True at a common position.
+
+        Rows are combined word-parallel as big integers with the method of Four Russians, so the cost
+        is proportional to the number of non-zero bytes of self times the row length of other in words.
+
+        Raises
+        ------
+        ArithmeticError
+            If the number of columns of self differs from the number of rows of other.
+
+        Example
+        -------
+        >>> (BitMatrix([[0, 1], [0, 0]]) * BitMatrix([[0, 0], [1, 0]])).to_list()
+        [[True, False], [False, False]]"""
+
+        if not isinstance(other, BitMatrix):
+            other = BitMatrix(other)
+
+        if self.__columns != len(other.__rows):
+            raise ArithmeticError("Cannot multiply matrices with incompatible dimensions")
+
+        return BitMatrix._from_rows(self._boolean_product(other), other.__columns)
+
+    def __mul__(self, other: Union[Self, Matrix, Iterable]) -> Self:
+        return self.multiplication(other)
+
+    def __matmul__(self, other: Union[Self, Matrix, Iterable]) -> Self:
+        return self.multiplication(other)
+
+    def transpose(self) -> Self:
+        """Returns transposed matrix"""
+
+        columns = [0] * self.__columns
+
+        for i, row in enumerate(self.__rows):
+            bit = 1 << i
+
+            for j in _positions(row, self.__columns):
+                columns[j] |= bit
+
+        return BitMatrix._from_rows(columns, len(self.__rows))
+
+    def _check_square(self) -> None:
+        if len(self.__rows) != self.__columns:
+            raise ArithmeticError("Adjacency matrix must be square")
+
+    def reachable(self, source: int) -> BitVector:
+        """Nodes reachable from source by a path of at least one edge, the matrix being an adjacency
+        matrix of a directed graph (True at (i, j) for edge i -> j).
+
+        Breadth-first search with bit sets as frontiers, every row is ORed at most once.
+
+        Raises
+        ------
+        ArithmeticError
+            If the matrix is not square.
+        IndexError
+            If source is out of range."""
+
+        self._check_square()
+        rows = self.__rows
+        size = self.__columns
+        frontier = self.get_row(source).bits
+        reached = 0
+
+        while frontier:
+            reached |= frontier
+            expansion = 0
+
+            for node in _positions(frontier, size):
+                expansion |= rows[node]
+
+            frontier = expansion & ~reached
+
+        return BitVector._from_bits(reached, size)
+
+    def transitive_closure(
+        self,
+        reflexive: bool = False,
+        method: Literal["auto", "scc", "squaring"] = "auto",
+    ) -> Self:
+        """Transitive closure of the relation (directed graph) given by the square matrix.
+
+        Element (i, j) of the result is True if j is reachable from i by a path of at least one edge
+        (or if i == j, when reflexive).
+
+        "scc" method condenses strongly connected components (Tarjan's algorithm) and then ORs reachability
+        bit sets of components in reverse topological order, every edge costs one big integer OR. It is
+        the default ("auto") and handles graphs with tens of thousands of nodes. "squaring" repeats
+        R = R | R * R with the boolean product until nothing changes (O(log n) products), which suits
+        small dense relations.
+
+        Parameters
+        ----------
+        reflexive : bool, optional
+            Include the identity (reflexive-transitive closure). Default False.
+        method : {"auto", "scc", "squaring"}, optional
+            Algorithm, default "auto".
+
+        Raises
+        ------
+        ArithmeticError
+            If the matrix is not square.
+        ValueError
+            If method is unknown.
+
+        Example
+        -------
+        >>> BitMatrix([[0, 1, 0], [0, 0, 1], [0, 0, 0]]).transitive_closure().to_list()
+        [[False, True, True], [False, False, True], [False, False, False]]"""
+
+        self._check_square()
+
+        if method not in ("auto", "scc", "squaring"):
+            raise ValueError(f'Unknown method "{method}", use "auto", "scc" or "squaring"')
+
+        if method == "squaring":
+            closure = self.copy()
+
+            while True:
+                rows = [a | b for a, b in zip(closure.__rows, closure._boolean_product(closure))]
+
+                if rows == closure.__rows:
+                    break
+
+                closure = BitMatrix._from_rows(rows, self.__columns)
+
+            rows = closure.__rows
+
+        else:
+            rows = self._scc_closure()
+
+        if reflexive:
+            rows = [row | 1 << i for i, row in enumerate(rows)]
+
+        return BitMatrix._from_rows(rows, self.__columns)
+
+    def _scc_closure(self) -> list[int]:
+        size = self.__columns
+        successors = [list(_positions(row, size)) for row in self.__rows]
+
+        # iterative Tarjan's algorithm, components are emitted in reverse topological order
+        index = [-1] * size
+        lowlink = [0] * size
+        on_stack = [False] * size
+        component = [-1] * size
+        stack, components = [], []
+        counter = 0
+
+        for root in range(size):
+            if index[root] != -1:
+                continue
+
+            work = [(root, 0)]
+
+            while work:
+                node, edge = work[-1]
+
+                if edge == 0:
+                    index[node] = lowlink[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack[node] = True
+
+                descended = False
+                adjacent = successors[node]
+
+                while edge < len(adjacent):
+                    target = adjacent[edge]
+                    edge += 1
+
+                    if index[target] == -1:
+                        work[-1] = (node, edge)
+                        work.append((target, 0))
+                        descended = True
+                        break
+
+                    if on_stack[target]:
+                        lowlink[node] = min(lowlink[node], index[target])
+
+                if descended:
+                    continue
+
+                work.pop()
+
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                if lowlink[node] == index[node]:
+                    members = []
+
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component[member] = len(components)
+                        members.append(member)
+
+                        if member == node:
+                            break
+
+                    components.append(members)
+
+        # closed[c]: members of component c together with everything reachable from it
+        reach = [0] * len(components)
+        closed = [0] * len(components)
+
+        for c, members in enumerate(components):
+            own = 0
+
+            for member in members:
+                own |= 1 << member
+
+            result = 0
+
+            for member in members:
+                for target in successors[member]:
+                    result |= own if component[target] == c else closed[component[target]]
+
+            reach[c] = result
+            closed[c] = own | result
+
+        return [reach[component[node]] for node in range(size)]
+
+    def count_non_zeros(self) -> int:
+        """Counts True elements (population count)"""
+
+        return sum(row.bit_count() for row in self.__rows)
+
+    def count_zeros(self) -> int:
+        """Counts False elements"""
+
+        return len(self.__rows) * self.__columns - self.count_non_zeros()
+
+    def is_empty(self) -> bool:
+        """Checks if all elements are False"""
+
+        return not any(self.__rows)
+
+    def is_full(self) -> bool:
+        """Checks if all elements are True"""
+
+        mask = self._mask
+
+        return all(row == mask for row in self.__rows)
+
+    def to_list(self) -> list[list[bool]]:
+        """Converts the matrix to a Python list of lists of bools"""
+
+        return [_unpack(row, self.__columns) for row in self.__rows]
+
+    def to_matrix(self) -> Matrix:
+        """Converts the matrix to a bool Matrix"""
+
+        return Matrix._from_data(self.to_list(), bool, columns=self.__columns)
+
+    def copy(self) -> Self:
+        """Creates a copy of the matrix"""
+
+        return BitMatrix._from_rows(list(self.__rows), self.__columns)
+
+    def __repr__(self) -> str:
+        return f"BitMatrix({self.to_list()})"
+
+    def __str__(self) -> str:
+        return str(self.to_matrix())
@@ -0,0 +1,259 @@
+from datalab.Vector import Vector
+
+from datalab.utils import *
+
+
+def _pack(values: Iterable) -> tuple[int, int]:
+    # Bits of an arbitrary-precision int, element i is bit i.
+    digits = "".join(["1" if value else "0" for value in values])
+
+    return (int(digits[::-1], 2) if digits else 0), len(digits)
+
+
+def _unpack(bits: int, size: int) -> list[bool]:
+    return list(map("1".__eq__, format(bits, f"0{size}b")[::-1])) if size else []
+
+
+class BitVector:
+    """Boolean vector stored as packed bits.
+
+    Elements are bits of a single arbitrary-precision integer, so the vector takes one bit per element
+    instead of one object reference, logical operations process machine words at once and counting uses
+    population count (`int.bit_count`).
+
+    Vector of dtype bool keeps its list storage, so packing only happens on explicit conversion
+    (`Vector.to_bit_vector` or this constructor); `to_vector` converts back.
+
+    Parameters
+    ----------
+    object : Iterable or int
+        Iterable of truthy/falsy values, or size of the vector.
+    fill : bool, optional
+        Value of all elements when size is given. Default False.
+
+    Example
+    -------
+    >>> mask = BitVector([True, False, True]) & BitVector([True, True, False])
+    >>> mask.to_list(), mask.count_non_zeros()
+    ([True, False, False], 1)"""
+
+    def __init__(self, object: Union[Iterable, int], fill: bool = False) -> None:
+        if isinstance(object, int) and not isinstance(object, bool):
+            if object < 0:
+                raise ValueError("BitVector size must not be negative")
+
+            self.__size = object
+            self.__bits = (1 << object) - 1 if fill else 0
+
+        else:
+            values = object.to_list() if isinstance(object, Vector) else object
+            self.__bits, self.__size = _pack(values)
+
+    @classmethod
+    def _from_bits(cls, bits: int, size: int) -> Self:
+        """Wraps integer with already masked bits into a new vector"""
+
+        vector = cls.__new__(cls)
+        vector.__bits = bits
+        vector.__size = size
+
+        return vector
+
+    @property
+    def bits(self) -> int:
+        """Packed elements, element i is bit i"""
+
+        return self.__bits
+
+    @property
+    def size(self) -> int:
+        """Number of elements"""
+
+        return self.__size
+
+    def __len__(self) -> int:
+        return self.__size
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes needed for the packed elements"""
+
+        return (self.__size + 7) // 8
+
+    @property
+    def _mask(self) -> int:
+        return (1 << self.__size) - 1
+
+    def _position(self, index: int) -> int:
+        if not isinstance(index, int):
+            raise TypeError("Index value must be an int")
+
+        if not -self.__size <= index < self.__size:
+            raise IndexError(
+                f"BitVector has {self.__size} elements, you cannot appeal to {index} element"
+            )
+
+        return index % self.__size
+
+    def get(self, index: int) -> bool:
+        """Returns the element at the specified index.
+
+        Raises
+        ------
+        TypeError
+            If index parameter is not an int.
+        IndexError
+            If index parameter is out of vector's range."""
+
+        return bool(self.__bits >> self._position(index) & 1)
+
+    def __getitem__(self, index: int) -> bool:
+        return self.get(index)
+
+    def set(self, index: int, value: Any) -> None:
+        """Sets the element at the specified index to truth value of the given value.
+
+        Raises
+        ------
+        TypeError
+            If index parameter is not an int.
+        IndexError
+            If index parameter is out of vector's range."""
+
+        bit = 1 << self._position(index)
+
+        if value:
+            self.__bits |= bit
+        else:
+            self.__bits &= ~bit
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        self.set(index, value)
+
+    def _operand(self, other: Union[Self, Iterable]) -> int:
+        if not isinstance(other, BitVector):
+            other = BitVector(other)
+
+        if other.__size != self.__size:
+            raise ArithmeticError("Cannot combine bit vectors with different sizes")
+
+        return other.__bits
+
+    def logical_and(self, other: Union[Self, Iterable]) -> Self:
+        """Element-wise logical and, computed word by word"""
+
+        return BitVector._from_bits(self.__bits & self._operand(other), self.__size)
+
+    def logical_or(self, other: Union[Self, Iterable]) -> Self:
+        """Element-wise logical or, computed word by word"""
+
+        return BitVector._from_bits(self.__bits | self._operand(other), self.__size)
+
+    def logical_xor(self, other: Union[Self, Iterable]) -> Self:
+        """Element-wise exclusive or, computed word by word"""
+
+        return BitVector._from_bits(self.__bits ^ self._operand(other), self.__size)
+
+    def logical_not(self) -> Self:
+        """Element-wise negation, computed word by word"""
+
+        return BitVector._from_bits(self.__bits ^ self._mask, self.__size)
+
+    def __and__(self, other: Union[Self, Iterable]) -> Self:
+        return self.logical_and(other)
+
+    def __or__(self, other: Union[Self, Iterable]) -> Self:
+        return self.logical_or(other)
+
+    def __xor__(self, other: Union[Self, Iterable]) -> Self:
+        return self.logical_xor(other)
+
+    def __invert__(self) -> Self:
+        return self.logical_not()
+
+    def __iand__(self, other: Union[Self, Iterable]) -> Self:
+        self.__bits &= self._operand(other)
+
+        return self
+
+    def __ior__(self, other: Union[Self, Iterable]) -> Self:
+        self.__bits |= self._operand(other)
+
+        return self
+
+    def __ixor__(self, other: Union[Self, Iterable]) -> Self:
+        self.__bits ^= self._operand(other)
+
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BitVector):
+            return NotImplemented
+
+        return self.__size == other.__size and self.__bits == other.__bits
+
+    def __hash__(self) -> int:
+        return hash((self.__bits, self.__size))
+
+    def count_non_zeros(self) -> int:
+        """Counts True elements (population count)"""
+
+        return self.__bits.bit_count()
+
+    def count_zeros(self) -> int:
+        """Counts False elements"""
+
+        return self.__size - self.__bits.bit_count()
+
+    def is_empty(self) -> bool:
+        """Checks if all elements are False"""
+
+        return not self.__bits
+
+    def is_full(self) -> bool:
+        """Checks if all elements are True"""
+
+        return self.__bits == self._mask
+
+    def nonzero(self) -> list[int]:
+        """Positions of True elements in ascending order"""
+
+        bits, positions = self.__bits, []
+
+        while bits:
+            lowest = bits & -bits
+            positions.append(lowest.bit_length() - 1)
+            bits ^= lowest
+
+        return positions
+
+    def select(self, object: Iterable) -> list:
+        """Elements of object (Vector, list, ...) at positions of True elements, e.g. rows passing a filter"""
+
+        values = object.to_list() if isinstance(object, Vector) else object
+
+        if len(values) != self.__size:
+            raise ArithmeticError("Mask and object must have the same size")
+
+        return list(itertools.compress(values, self.to_list()))
+
+    def to_list(self) -> list[bool]:
+        """Converts the vector to a Python list of bools"""
+
+        return _unpack(self.__bits, self.__size)
+
+    def to_vector(self) -> Vector:
+        """Converts the vector to a bool Vector"""
+
+        return Vector._from_data(self.to_list(), bool)
+
+    def copy(self) -> Self:
+        """Creates a copy of the vector"""
+
+        return BitVector._from_bits(self.__bits, self.__size)
+
+    def __repr__(self) -> str:
+        return f"BitVector('{format(self.__bits, f'0{self.__size}b')[::-1] if self.__size else ''}')"
+
+    def __str__(self) -> str:
+        return str(self.to_vector())
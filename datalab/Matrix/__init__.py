@@ -1,7 +1,22 @@
 from datalab.utils import *
+from datalab.Vector import Vector
+from datalab.stat.func.covariance import RunningCovariance
 
 
 class Matrix:
+    strassen_threshold: int = 128
+    """Minimal size of every dimension for which matrix product switches to Strassen-Winograd recursion"""
+
+    covariance_block: int = 4096
+    """Number of rows accumulated at once by `cov` and `corr`, bounds their temporary memory"""
+
+    qr_block_rows: int = 4096
+    """Number of rows processed at once by the blocked (tall-skinny) QR used in least squares"""
+
+    # Structures derived from the data (e.g. summed-area table), notified about every change of elements.
+    __listeners: tuple = ()
+    __summed_area_table = None
+
     @overload
     def __init__(
         self,
@@ -94,6 +109,38 @@ def __init__(
         self.__precision = 4
         self.__supported_types = int, float, str, bool
     
+    @classmethod
+    def _from_data(
+        cls,
+        data: list[list[Union[int, float, str, bool]]],
+        dtype: type,
+        columns: Optional[int] = None,
+    ) -> Self:
+        """Wraps already validated rows into a new matrix without copying or converting them"""
+
+        matrix = cls.__new__(cls)
+
+        matrix.__rows = len(data)
+        matrix.__columns = len(data[0]) if data else (columns or 0)
+        matrix.__dtype = dtype
+        matrix.__data = data
+        matrix.__precision = 4
+        matrix.__supported_types = int, float, str, bool
+
+        return matrix
+
+    def _attach(self, listener: Any) -> None:
+        # Listener must provide _on_set((row, column), old, new) called after change of a single element
+        # and _on_reset() called after bulk change of the data or shape.
+        self.__listeners = (*self.__listeners, listener)
+
+    def _detach(self, listener: Any) -> None:
+        self.__listeners = tuple(item for item in self.__listeners if item is not listener)
+
+    def _notify_reset(self) -> None:
+        for listener in self.__listeners:
+            listener._on_reset()
+
     def _initialize_data_structure(
         self,
         object: Optional[Iterable] = None,
@@ -191,7 +238,7 @@ def __str__(self) -> str:
                                     f"{splited_value[0]}.{splited_value[1]}"
                                 )
 
-                elif self.dtype == int:
+                elif self.dtype in (int, Fraction):
                     formatted_value = str(value)
 
                 elif self.dtype == bool:
@@ -367,7 +414,7 @@ def multiplication(
         Parameters
         ----------
         object : int or float or str or bool or Iterable
-            The object to multiply with the matrix. It can be another Matrix, a scalar value (int, float, str, or bool),
+            The object to multiply with the matrix. It can be another Matrix, a Vector, a scalar value (int, float, str, or bool),
             a list or tuple representing a matrix, or a scalar value.
 
         Returns
@@ -388,8 +435,62 @@ def multiplication(
         If the provided object is a Matrix, the method performs matrix multiplication. 
         If it is a scalar value, the method multiplies the value with each element of the matrix. 
         If the object is a list or tuple, it should represent a matrix, and element-wise multiplication is performed.
+
+        Product of two numeric (int or float) matrices is computed by the dot product kernel, or, when every
+        dimension is at least `Matrix.strassen_threshold`, by Strassen-Winograd recursion. The recursion is exact
+        for int matrices, for float matrices it may differ from the classic product by rounding errors.
+        If the object is a Vector, matrix-vector product is returned as a Vector.
+        Product of two bool matrices is the boolean product, computed on bit-packed rows (see `BitMatrix`).
         """
+
+        if isinstance(object, Vector):
+            if self.columns != object.size:
+                raise ArithmeticError(
+                    "Cannot multiply matrix and vector with incompatible dimensions"
+                )
+
+            if self.dtype not in (int, float, bool) or object.dtype not in (int, float, bool):
+                raise TypeError("Matrix-vector product is only defined for numeric dtypes")
+
+            dtype = float if float in (self.dtype, object.dtype) else int
+
+            return Vector._from_data(
+                list(map(dtype, self._matvec(object.to_list()))), dtype
+            )
         
+        if (
+            isinstance(object, Matrix)
+            and self.dtype in (int, float)
+            and object.dtype in (int, float)
+        ):
+            if self.columns != object.rows:
+                raise ArithmeticError(
+                    "Cannot multiply matrices with incompatible dimensions"
+                )
+
+            dtype = float if float in (self.dtype, object.dtype) else int
+
+            return Matrix._from_data(
+                self._matrix_product(self.__data, object.__data, object.columns, dtype),
+                dtype,
+                columns=object.columns,
+            )
+
+        if isinstance(object, Matrix) and self.dtype == bool and object.dtype == bool:
+            if self.columns != object.rows:
+                raise ArithmeticError(
+                    "Cannot multiply matrices with incompatible dimensions"
+                )
+
+            if not self.columns:
+                return Matrix._from_data(
+                    [[False] * object.columns for _ in self.__data], bool, columns=object.columns
+                )
+
+            from datalab.BitMatrix import BitMatrix
+
+            return (BitMatrix(self.__data) * BitMatrix(object.__data)).to_matrix()
+
         buffer = self.deep_copy()
 
         if isinstance(object, Matrix):
@@ -425,6 +526,94 @@ def multiplication(
 
         return buffer
     
+    def _matrix_product(self, A: list, B: list, columns: int = 0, dtype: type = int) -> list:
+        # With empty inner dimension B has no rows to take the width from, so the caller passes
+        # number of columns and dtype of the zero result.
+        if not A or not B:
+            return [[dtype(0)] * columns for _ in A]
+
+        if min(len(A), len(B), len(B[0])) >= self.strassen_threshold:
+            return self._strassen_product(A, B)
+
+        return self._kernel_product(A, B)
+
+    def _kernel_product(self, A: list, B: list) -> list:
+        columns = list(zip(*B))
+        mul = operator.mul
+
+        return [[sum(map(mul, row, column)) for column in columns] for row in A]
+
+    def _strassen_product(self, A: list, B: list) -> list:
+        rows, inner, columns = len(A), len(B), len(B[0])
+
+        if min(rows, inner, columns) < self.strassen_threshold:
+            return self._kernel_product(A, B)
+
+        # Odd dimensions are padded with a single zero row/column, which is cheaper than padding
+        # the whole matrix up to the next power of two and does not change the product.
+        if rows % 2 or inner % 2:
+            A = [row + [0] * (inner % 2) for row in A]
+
+            if rows % 2:
+                A.append([0] * (inner + inner % 2))
+
+        if inner % 2 or columns % 2:
+            B = [row + [0] * (columns % 2) for row in B]
+
+            if inner % 2:
+                B.append([0] * (columns + columns % 2))
+
+        m, k, n = (rows + 1) // 2, (inner + 1) // 2, (columns + 1) // 2
+
+        def split(X: list, h: int, w: int) -> tuple[list, list, list, list]:
+            return (
+                [row[:w] for row in X[:h]],
+                [row[w:] for row in X[:h]],
+                [row[:w] for row in X[h:]],
+                [row[w:] for row in X[h:]],
+            )
+
+        def add(X: list, Y: list) -> list:
+            return [list(map(operator.add, x, y)) for x, y in zip(X, Y)]
+
+        def sub(X: list, Y: list) -> list:
+            return [list(map(operator.sub, x, y)) for x, y in zip(X, Y)]
+
+        A11, A12, A21, A22 = split(A, m, k)
+        B11, B12, B21, B22 = split(B, k, n)
+
+        S1 = add(A21, A22)
+        S2 = sub(S1, A11)
+        S3 = sub(A11, A21)
+        S4 = sub(A12, S2)
+
+        T1 = sub(B12, B11)
+        T2 = sub(B22, T1)
+        T3 = sub(B22, B12)
+        T4 = sub(T2, B21)
+
+        P1 = self._strassen_product(A11, B11)
+        P2 = self._strassen_product(A12, B21)
+        P3 = self._strassen_product(S4, B22)
+        P4 = self._strassen_product(A22, T4)
+        P5 = self._strassen_product(S1, T1)
+        P6 = self._strassen_product(S2, T2)
+        P7 = self._strassen_product(S3, T3)
+
+        U2 = add(P1, P6)
+        U3 = add(U2, P7)
+        U4 = add(U2, P5)
+
+        C11 = add(P1, P2)
+        C12 = add(U4, P3)
+        C21 = sub(U3, P4)
+        C22 = add(U3, P5)
+
+        result = [left + right for left, right in zip(C11, C12)]
+        result += [left + right for left, right in zip(C21, C22)]
+
+        return [row[:columns] for row in result[:rows]]
+
     def __pow__(
         self,
         exponent: int,
@@ -590,6 +779,15 @@ def set(
                 f"Matrix has {self.columns} rows, you cannot appeal to {column} column"
             )
 
+        if self.__listeners:
+            old = self.__data[row][column]
+            self.__data[row][column] = value
+
+            for listener in self.__listeners:
+                listener._on_set((row % self.rows, column % self.columns), old, value)
+
+            return
+
         self.__data[row][column] = value
 
     def __getitem__(
@@ -814,6 +1012,7 @@ def reshape(
     
     def _adjust_dimensions(self) -> None:
         buffer = self.copy()
+        listeners, self.__listeners = self.__listeners, ()
         
         self._fill_data(fill=self._empty_element())
 
@@ -824,6 +1023,9 @@ def _adjust_dimensions(self) -> None:
                 except IndexError:
                     break
 
+        self.__listeners = listeners
+        self._notify_reset()
+
     @property
     def dtype(self) -> type:
         """Store element's current type"""
@@ -860,11 +1062,11 @@ def change_dtype(
                 f"dtype property must take one of this values: {self.__supported_types}"
             )
 
+        converted = [[convert(element, value) for element in row] for row in self.__data]
+
         self.__dtype = value
-        
-        self.replace(
-            [[convert(element, value) for element in row] for row in self.__data]
-        )
+        self.__data[:] = converted
+        self._notify_reset()
 
         return self
 
@@ -986,6 +1188,7 @@ def get_determinant(self) -> Union[int, float]:
         """Calculate the determinant of the matrix
         
         Determinant is only defined for square matrices.
+        For int and bool matrices it is calculated exactly by fraction-free Bareiss elimination in O(n³).
         
         Raises
         ------
@@ -995,6 +1198,17 @@ def get_determinant(self) -> Union[int, float]:
         if not self.is_square():
             raise ArithmeticError("Determinant is only defined for square matrices.")
 
+        if self.dtype in (int, bool):
+            if self.rows == 0:
+                return 1
+
+            echelon, rank, sign = self._bareiss_elimination(
+                [[int(element) for element in row] for row in self.__data],
+                operator.floordiv,
+            )
+
+            return sign * echelon[-1][-1] if rank == self.rows else 0
+
         match self.number_of_elements():
             case 1:
                 result = self[0, 0]
@@ -1016,6 +1230,127 @@ def get_determinant(self) -> Union[int, float]:
 
         return result
 
+    def _bareiss_elimination(
+        self,
+        data: list,
+        divide: Callable,
+    ) -> tuple[list, int, int]:
+        # Fraction-free row echelon form. Every entry stays a minor of the original matrix, so
+        # divisions by the previous pivot are exact (floordiv for ints, truediv for Fractions).
+        rows, columns = len(data), len(data[0]) if data else 0
+        previous, sign, rank = 1, 1, 0
+
+        for column in range(columns):
+            if rank == rows:
+                break
+
+            pivot_row = next((i for i in range(rank, rows) if data[i][column]), None)
+
+            if pivot_row is None:
+                continue
+
+            if pivot_row != rank:
+                data[rank], data[pivot_row] = data[pivot_row], data[rank]
+                sign = -sign
+
+            pivot_line = data[rank]
+            pivot = pivot_line[column]
+
+            for line in data[rank + 1 :]:
+                factor = line[column]
+
+                for j in range(column + 1, columns):
+                    line[j] = divide(pivot * line[j] - factor * pivot_line[j], previous)
+
+                line[column] = 0
+
+            previous = pivot
+            rank += 1
+
+        return data, rank, sign
+
+    @property
+    def rank(self) -> int:
+        """The rank of the matrix
+        
+        Rank is the maximal number of linearly independent rows (or columns)."""
+
+        return self.get_rank()
+
+    def get_rank(self) -> int:
+        """Calculate the rank of the matrix
+
+        Rank is calculated exactly by fraction-free Bareiss elimination in O(n³).
+        Float elements are treated as the exact binary values they store.
+
+        Raises
+        ------
+        TypeError
+            If matrix dtype is not int, float or bool."""
+
+        if self.dtype in (int, bool):
+            data = [[int(element) for element in row] for row in self.__data]
+            divide = operator.floordiv
+
+        elif self.dtype == float:
+            data = [[Fraction(element) for element in row] for row in self.__data]
+            divide = operator.truediv
+
+        else:
+            raise TypeError("Rank is only defined for int, float and bool matrices.")
+
+        return self._bareiss_elimination(data, divide)[1]
+
+    def cov(self, ddof: int = 1) -> Self:
+        """Calculates covariance matrix of the columns (variables), rows are observations.
+
+        Means and co-moments are accumulated over blocks of `covariance_block` rows, so only one block
+        is copied to floats at a time. For data processed chunk by chunk use `datalab.stat.RunningCovariance`
+        directly.
+
+        Parameters
+        ----------
+        ddof : int, optional
+            Delta degrees of freedom, divisor is rows - ddof. Default 1 (sample covariance).
+
+        Raises
+        ------
+        TypeError
+            If matrix dtype is not int, float or bool.
+        ArithmeticError
+            If there are not more rows than ddof."""
+
+        if self.dtype not in (int, float, bool):
+            raise TypeError("Covariance is only defined for int, float and bool matrices.")
+
+        return self._running_covariance().covariance(ddof)
+
+    def corr(self) -> Self:
+        """Calculates Pearson correlation matrix of the columns (variables), rows are observations.
+
+        Correlations with a constant column are NaN.
+
+        Raises
+        ------
+        TypeError
+            If matrix dtype is not int, float or bool.
+        ArithmeticError
+            If there are less than two rows."""
+
+        if self.dtype not in (int, float, bool):
+            raise TypeError("Correlation is only defined for int, float and bool matrices.")
+
+        return self._running_covariance().correlation()
+
+    def _running_covariance(self) -> RunningCovariance:
+        accumulator = RunningCovariance(self.columns)
+        block = max(1, self.covariance_block)
+
+        for start in range(0, len(self.__data), block):
+            accumulator.update(self.__data[start : start + block])
+
+        return accumulator
+
     @property
     def trace(self) -> Union[int, float]:
         """Calculates the trace of a square matrix.
@@ -1094,10 +1429,17 @@ def transpose(self) -> Self:
 
         return self
 
-    def inverse(self) -> Self:
+    def inverse(self, exact: bool = False) -> Self:
         """Calculates the inverse of a square matrix.
         
         The matrix must be square and non-singular (invertible) to have an inverse.
+        Inverse of int and bool matrices is calculated by fraction-free Gauss-Jordan elimination in O(n³).
+
+        Parameters
+        ----------
+        exact : bool, optional
+            If True, the result has `fractions.Fraction` dtype and holds exact values. Default False,
+            which returns float matrix.
 
         Raises
         ------
@@ -1108,6 +1450,18 @@ def inverse(self) -> Self:
         if not self.is_square():
             raise ArithmeticError("Inverse is only defined for square matrices.")
 
+        if exact or self.dtype in (int, bool):
+            inverse = self._exact_inverse()
+
+            if exact:
+                return Matrix._from_data(inverse, Fraction, columns=self.columns)
+
+            return Matrix._from_data(
+                [[float(element) for element in row] for row in inverse],
+                float,
+                columns=self.columns,
+            )
+
         determinant = self.determinant
 
         if determinant == 0:
@@ -1117,6 +1471,59 @@ def inverse(self) -> Self:
 
         return adjugate * (1 / determinant)
 
+    def _exact_inverse(self) -> list[list[Fraction]]:
+        if self.dtype in (int, bool):
+            data = [[int(element) for element in row] for row in self.__data]
+            divide = operator.floordiv
+
+        elif self.dtype == float:
+            data = [[Fraction(element) for element in row] for row in self.__data]
+            divide = operator.truediv
+
+        else:
+            raise TypeError("Exact inverse is only defined for int, float and bool matrices.")
+
+        size = self.rows
+
+        for i, row in enumerate(data):
+            row.extend(1 if i == j else 0 for j in range(size))
+
+        previous = 1
+
+        # Fraction-free Gauss-Jordan: after the last step the left half is d·I and the right half
+        # is d·A⁻¹, where d is the last pivot (determinant up to sign).
+        for k in range(size):
+            pivot_row = next((i for i in range(k, size) if data[i][k]), None)
+
+            if pivot_row is None:
+                raise ArithmeticError("Matrix is singular and does not have an inverse.")
+
+            data[k], data[pivot_row] = data[pivot_row], data[k]
+
+            pivot_line = data[k]
+            pivot = pivot_line[k]
+
+            for i, line in enumerate(data):
+                if i == k:
+                    continue
+
+                factor = line[k]
+
+                for j in range(k + 1, 2 * size):
+                    line[j] = divide(pivot * line[j] - factor * pivot_line[j], previous)
+
+                line[k] = 0
+
+                if i < k:
+                    line[i] = divide(pivot * line[i], previous)
+
+            previous = pivot
+
+        return [
+            [Fraction(element) / row[i] for element in row[size:]]
+            for i, row in enumerate(data)
+        ]
+
     def adjugate(self) -> Self:
         """Calculates the adjugate of the matrix.
 
@@ -1191,7 +1598,7 @@ def submatrix(self, rows_index: Iterable, columns_index: Iterable) -> Self:
         Matrix
             The submatrix with the specified ranges of rows and columns."""
 
-        submatrix = Matrix((len(rows_index), len(column_index)))
+        submatrix = Matrix((len(rows_index), len(columns_index)), dtype=self.dtype)
 
         for i, row_index in enumerate(rows_index):
             for j, column_index in enumerate(columns_index):
@@ -1199,6 +1606,891 @@ def submatrix(self, rows_index: Iterable, columns_index: Iterable) -> Self:
 
         return submatrix
 
+    @staticmethod
+    def _householder(columns: list, steps: int) -> list:
+        # Works in place on column-major data, leaving R in the upper triangle of the first `steps`
+        # columns and applying every reflector to all remaining columns as well.
+        reflectors = []
+        mul = operator.mul
+
+        for k in range(steps):
+            column = columns[k]
+            x = column[k:]
+            norm = math.hypot(*x)
+
+            if norm == 0.0:
+                reflectors.append(None)
+                continue
+
+            alpha = -norm if x[0] >= 0 else norm
+            x[0] -= alpha
+            beta = 1.0 / (alpha * -x[0])
+
+            column[k:] = [alpha] + [0.0] * (len(x) - 1)
+
+            for other in columns[k + 1 :]:
+                tail = other[k:]
+                scale = beta * sum(map(mul, x, tail))
+
+                if scale:
+                    other[k:] = [t - scale * v for t, v in zip(tail, x)]
+
+            reflectors.append((x, beta))
+
+        return reflectors
+
+    @staticmethod
+    def _orthogonal_factor(reflectors: list, rows: int, size: int) -> list:
+        # Accumulates Q = H_0 * H_1 * ... applied to first `size` columns of identity (column-major).
+        columns = [[1.0 if i == j else 0.0 for i in range(rows)] for j in range(size)]
+        mul = operator.mul
+
+        for k in reversed(range(len(reflectors))):
+            if reflectors[k] is None:
+                continue
+
+            v, beta = reflectors[k]
+
+            for column in columns[k:]:
+                tail = column[k:]
+                scale = beta * sum(map(mul, v, tail))
+
+                if scale:
+                    column[k:] = [t - scale * x for t, x in zip(tail, v)]
+
+        return columns
+
+    @staticmethod
+    def _orthonormal_basis(columns: list) -> list:
+        # Orthonormal basis (column-major) of the space spanned by given columns, via Householder QR.
+        rows = len(columns[0]) if columns else 0
+        size = min(rows, len(columns))
+
+        reflectors = Matrix._householder([list(column) for column in columns], size)
+
+        return Matrix._orthogonal_factor(reflectors, rows, size)
+
+    def _triangularize(self, data: list, width: int) -> list:
+        columns = [list(map(float, column)) for column in zip(*data)]
+        steps = min(len(data), width)
+
+        self._householder(columns, steps)
+
+        return [list(row) for row in zip(*columns)][:steps]
+
+    def qr(self, complete: bool = False) -> tuple[Self, Self]:
+        """Calculates QR decomposition of the matrix using Householder reflections.
+
+        Parameters
+        ----------
+        complete : bool, optional
+            If True, Q is square (rows x rows) and R has the same shape as the matrix.
+            By default reduced decomposition is returned: Q has min(rows, columns) columns.
+
+        Returns
+        -------
+        tuple[Matrix, Matrix]
+            Orthogonal matrix Q and upper triangular matrix R (both float), such that Q * R equals the matrix.
+
+        Raises
+        ------
+        TypeError
+            If matrix dtype is not int, float or bool."""
+
+        if self.dtype not in (int, float, bool):
+            raise TypeError("QR decomposition is only defined for int, float and bool matrices.")
+
+        rows, columns = self.shape
+        size = rows if complete else min(rows, columns)
+
+        data = [list(map(float, column)) for column in zip(*self.__data)]
+        reflectors = self._householder(data, min(rows, columns))
+
+        q_columns = self._orthogonal_factor(reflectors, rows, size)
+
+        Q = Matrix._from_data(
+            [list(row) for row in zip(*q_columns)], float, columns=size
+        )
+        R = Matrix._from_data(
+            [
+                [data[j][i] if j >= i else 0.0 for j in range(columns)]
+                for i in range(size)
+            ],
+            float,
+            columns=columns,
+        )
+
+        return Q, R
+
+    def lstsq(
+        self,
+        b: Union[Vector, Iterable],
+        block_rows: Optional[int] = None,
+    ) -> Union[Vector, Self]:
+        """Solves the least squares problem: finds x minimizing ||A * x - b||.
+
+        The augmented matrix [A | b] is reduced to triangular form by Householder QR in blocks of
+        `block_rows` rows, so Q is never formed and tall-skinny problems need memory only for one block.
+
+        Parameters
+        ----------
+        b : Vector or Iterable or Matrix
+            Right-hand side. Vector, list or tuple of size equal to number of rows,
+            or Matrix with the same number of rows for many right-hand sides.
+        block_rows : int, optional
+            Number of rows reduced at once. Default `Matrix.qr_block_rows`.
+
+        Returns
+        -------
+        Vector or Matrix
+            Least squares solution, Matrix if b was a Matrix.
+
+        Raises
+        ------
+        ArithmeticError
+            If the matrix has less rows than columns, sizes do not match or matrix is rank deficient.
+        TypeError
+            If matrix dtype is not int, float or bool."""
+
+        if self.dtype not in (int, float, bool):
+            raise TypeError("Least squares is only defined for int, float and bool matrices.")
+
+        if isinstance(b, Matrix):
+            rhs = b.__data
+        else:
+            rhs = [[item] for item in b]
+
+        if len(rhs) != self.rows:
+            raise ArithmeticError("Right-hand side must have as many rows as the matrix")
+
+        if self.rows < self.columns:
+            raise ArithmeticError("Least squares requires at least as many rows as columns")
+
+        block_rows = max(block_rows or self.qr_block_rows, 1)
+        width = self.columns + (len(rhs[0]) if rhs else 0)
+
+        R = []
+
+        for start in range(0, self.rows, block_rows):
+            chunk = [
+                row + right
+                for row, right in zip(
+                    self.__data[start : start + block_rows],
+                    rhs[start : start + block_rows],
+                )
+            ]
+            R = self._triangularize(R + chunk, width)
+
+        size = self.columns
+        diagonal = [abs(R[i][i]) for i in range(size)]
+
+        if size and min(diagonal) <= max(diagonal) * size * sys.float_info.epsilon:
+            raise ArithmeticError("Matrix is rank deficient, least squares solution is not unique")
+
+        solution = [[0.0] * (width - size) for _ in range(size)]
+
+        for i in reversed(range(size)):
+            row = R[i]
+
+            for j in range(width - size):
+                value = row[size + j]
+
+                for k in range(i + 1, size):
+                    value -= row[k] * solution[k][j]
+
+                solution[i][j] = value / row[i]
+
+        if isinstance(b, Matrix):
+            return Matrix._from_data(solution, float, columns=width - size)
+
+        return Vector([row[0] for row in solution], dtype=float)
+
+    def cholesky(self) -> Self:
+        """Calculates Cholesky factorization of a symmetric positive definite matrix.
+
+        Only the lower triangle (with diagonal) of the matrix is read, upper triangle is assumed symmetric.
+
+        Returns
+        -------
+        Matrix
+            Lower triangular float matrix L, such that L * L^T equals the matrix.
+            It can be reused to solve many systems with `cho_solve`.
+
+        Raises
+        ------
+        ArithmeticError
+            If the matrix is not square or it is not positive definite.
+        TypeError
+            If matrix dtype is not int, float or bool."""
+
+        if not self.is_square():
+            raise ArithmeticError("Cholesky factorization is only defined for square matrices.")
+
+        if self.dtype not in (int, float, bool):
+            raise TypeError("Cholesky factorization is only defined for int, float and bool matrices.")
+
+        data = self.__data
+        size = self.rows
+
+        if any(data[i][i] <= 0 for i in range(size)):
+            raise ArithmeticError("Matrix is not positive definite")
+
+        mul = operator.mul
+        factor = []
+
+        for i in range(size):
+            row = data[i]
+            line = []
+
+            for j in range(i):
+                line.append(
+                    (row[j] - sum(map(mul, line, factor[j]))) / factor[j][j]
+                )
+
+            pivot = row[i] - sum(map(mul, line, line))
+
+            if pivot <= 0:
+                raise ArithmeticError("Matrix is not positive definite")
+
+            line.append(math.sqrt(pivot))
+            factor.append(line)
+
+        for line in factor:
+            line.extend([0.0] * (size - len(line)))
+
+        return Matrix._from_data(factor, float, columns=size)
+
+    def cho_solve(
+        self,
+        b: Union[Vector, Iterable],
+    ) -> Union[Vector, Self]:
+        """Solves the system A * x = b, where the matrix is the Cholesky factor L of A (A = L * L^T).
+
+        Only the lower triangle of the matrix is read, so the result of `cholesky` can be passed directly
+        and reused for any number of right-hand sides.
+
+        Parameters
+        ----------
+        b : Vector or Iterable or Matrix
+            Right-hand side. Vector, list or tuple of size equal to number of rows,
+            or Matrix with the same number of rows for many right-hand sides.
+
+        Returns
+        -------
+        Vector or Matrix
+            Solution of the system, Matrix if b was a Matrix.
+
+        Raises
+        ------
+        ArithmeticError
+            If the matrix is not square or sizes do not match."""
+
+        if not self.is_square():
+            raise ArithmeticError("Cholesky factor must be a square matrix.")
+
+        if isinstance(b, Matrix):
+            rhs = [list(map(float, column)) for column in zip(*b.__data)]
+            rows = b.rows
+        else:
+            rhs = [list(map(float, b))]
+            rows = len(rhs[0])
+
+        if rows != self.rows:
+            raise ArithmeticError("Right-hand side must have as many rows as the matrix")
+
+        factor = self.__data
+        size = self.rows
+        mul = operator.mul
+
+        for x in rhs:
+            for i in range(size):
+                x[i] = (x[i] - sum(map(mul, factor[i][:i], x[:i]))) / factor[i][i]
+
+            for i in reversed(range(size)):
+                value = x[i]
+
+                for k in range(i + 1, size):
+                    value -= factor[k][i] * x[k]
+
+                x[i] = value / factor[i][i]
+
+        if isinstance(b, Matrix):
+            return Matrix._from_data(
+                [list(row) for row in zip(*rhs)], float, columns=b.columns
+            )
+
+        return Vector(rhs[0], dtype=float)
+
+    def _tridiagonalize(self) -> tuple[list, list, list]:
+        # Householder reduction of the symmetric matrix (lower triangle) to tridiagonal form T = Q^T * A * Q.
+        # Returns diagonal, subdiagonal (padded with 0 to full length) and Q as list of columns.
+        size = self.rows
+        data = self.__data
+        A = [
+            [float(data[i][j] if j <= i else data[j][i]) for j in range(size)]
+            for i in range(size)
+        ]
+        Q = [[1.0 if i == j else 0.0 for j in range(size)] for i in range(size)]
+        mul = operator.mul
+
+        for k in range(size - 2):
+            x = [A[i][k] for i in range(k + 1, size)]
+            norm = math.hypot(*x)
+
+            if norm == 0.0 or norm == abs(x[0]) and all(item == 0.0 for item in x[1:]):
+                continue
+
+            alpha = -norm if x[0] >= 0 else norm
+            x[0] -= alpha
+            beta = 1.0 / (alpha * -x[0])
+
+            block = [row[k + 1 :] for row in A[k + 1 :]]
+            p = [beta * sum(map(mul, row, x)) for row in block]
+            half = 0.5 * beta * sum(map(mul, p, x))
+            w = [a - half * b for a, b in zip(p, x)]
+
+            for a, (row, v_a, w_a) in enumerate(zip(A[k + 1 :], x, w)):
+                row[k + 1 :] = [
+                    item - v_a * w_b - w_a * v_b
+                    for item, v_b, w_b in zip(block[a], x, w)
+                ]
+                row[k] = 0.0
+
+            for j in range(k + 1, size):
+                A[k][j] = 0.0
+
+            A[k + 1][k] = A[k][k + 1] = alpha
+
+            for row in Q:
+                tail = row[k + 1 :]
+                scale = beta * sum(map(mul, tail, x))
+
+                if scale:
+                    row[k + 1 :] = [t - scale * v for t, v in zip(tail, x)]
+
+        diagonal = [A[i][i] for i in range(size)]
+        subdiagonal = [A[i + 1][i] for i in range(size - 1)] + [0.0]
+
+        return diagonal, subdiagonal, [list(column) for column in zip(*Q)]
+
+    @staticmethod
+    def _tridiagonal_eigen(
+        diagonal: list,
+        subdiagonal: list,
+        vectors: Optional[list] = None,
+    ) -> None:
+        # Implicitly shifted QL iterations with Wilkinson shift, in place. Eigenvalues end up in `diagonal`,
+        # plane rotations are accumulated in `vectors` (list of columns), if given.
+        size = len(diagonal)
+        d, e = diagonal, subdiagonal
+
+        for l in range(size):
+            iterations = 0
+
+            while True:
+                m = l
+
+                while m < size - 1:
+                    if abs(e[m]) <= sys.float_info.epsilon * (abs(d[m]) + abs(d[m + 1])):
+                        break
+                    m += 1
+
+                if m == l:
+                    break
+
+                iterations += 1
+
+                if iterations > 60:
+                    raise ArithmeticError("Eigenvalue iteration did not converge")
+
+                g = (d[l + 1] - d[l]) / (2.0 * e[l])
+                r = math.hypot(g, 1.0)
+                g = d[m] - d[l] + e[l] / (g + math.copysign(r, g))
+                s = c = 1.0
+                p = 0.0
+                i = m - 1
+                underflow = False
+
+                while i >= l:
+                    f = s * e[i]
+                    b = c * e[i]
+                    r = math.hypot(f, g)
+                    e[i + 1] = r
+
+                    if r == 0.0:
+                        d[i + 1] -= p
+                        e[m] = 0.0
+                        underflow = True
+                        break
+
+                    s = f / r
+                    c = g / r
+                    g = d[i + 1] - p
+                    r = (d[i] - g) * s + 2.0 * c * b
+                    p = s * r
+                    d[i + 1] = g + p
+                    g = c * r - b
+
+                    if vectors is not None:
+                        first, second = vectors[i], vectors[i + 1]
+                        vectors[i + 1] = [s * a + c * b for a, b in zip(first, second)]
+                        vectors[i] = [c * a - s * b for a, b in zip(first, second)]
+
+                    i -= 1
+
+                if not underflow:
+                    d[l] -= p
+                    e[l] = g
+                    e[m] = 0.0
+
+    def eigh(self) -> tuple[Vector, Self]:
+        """Calculates eigenvalues and eigenvectors of a symmetric matrix.
+
+        The matrix is reduced to tridiagonal form by Householder reflections and then diagonalized
+        by implicitly shifted QL/QR iterations. Only the lower triangle (with diagonal) of the matrix is read.
+
+        Returns
+        -------
+        tuple[Vector, Matrix]
+            Eigenvalues in ascending order and float matrix with corresponding (normalized) eigenvectors in columns.
+
+        Raises
+        ------
+        ArithmeticError
+            If the matrix is not square.
+        TypeError
+            If matrix dtype is not int, float or bool."""
+
+        if not self.is_square():
+            raise ArithmeticError("Eigen decomposition is only defined for square matrices.")
+
+        if self.dtype not in (int, float, bool):
+            raise TypeError("Eigen decomposition is only defined for int, float and bool matrices.")
+
+        diagonal, subdiagonal, vectors = self._tridiagonalize()
+        self._tridiagonal_eigen(diagonal, subdiagonal, vectors)
+
+        order = sorted(range(self.rows), key=diagonal.__getitem__)
+
+        return (
+            Vector([diagonal[i] for i in order], dtype=float),
+            Matrix._from_data(
+                [list(row) for row in zip(*(vectors[i] for i in order))],
+                float,
+                columns=self.columns,
+            ),
+        )
+
+    def _matvec(self, x: Iterable) -> list:
+        mul = operator.mul
+
+        return [sum(map(mul, row, x)) for row in self.__data]
+
+    def eig_top_k(
+        self,
+        k: int,
+        method: Literal["lanczos", "power"] = "lanczos",
+        tolerance: float = 1e-10,
+        max_iterations: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> tuple[Vector, Self]:
+        """Calculates k dominant (largest in magnitude) eigenpairs of the matrix.
+
+        Only matrix-vector products are used, so it is suited for large matrices. Lanczos iteration
+        requires symmetric matrix, power (subspace) iteration also finds dominant eigenpair (k=1) of
+        non-symmetric matrices with a real dominant eigenvalue, e.g. stochastic PageRank matrices.
+        See also `datalab.eig_top_k` for a matrix-free variant.
+
+        Parameters
+        ----------
+        k : int
+            Number of eigenpairs to compute.
+        method : {"lanczos", "power"}, optional
+            Iteration used, default "lanczos".
+        tolerance : float, optional
+            Relative residual norm at which eigenpair is considered converged. Default 1e-10.
+        max_iterations : int, optional
+            Maximal number of iterations (Lanczos steps or power iterations).
+        seed : int, optional
+            Seed for the random starting vectors.
+
+        Returns
+        -------
+        tuple[Vector, Matrix]
+            Eigenvalues ordered by decreasing magnitude and float matrix with eigenvectors in columns.
+
+        Raises
+        ------
+        ArithmeticError
+            If the matrix is not square.
+        ValueError
+            If k is not in range from 1 to number of rows, or method is unknown."""
+
+        if not self.is_square():
+            raise ArithmeticError("Eigen decomposition is only defined for square matrices.")
+
+        return self._eig_top_k(
+            self._matvec, self.rows, k, method, tolerance, max_iterations, seed
+        )
+
+    @staticmethod
+    def _eig_top_k(
+        matvec: Callable[[list], Iterable],
+        size: int,
+        k: int,
+        method: str,
+        tolerance: float,
+        max_iterations: Optional[int],
+        seed: Optional[int],
+    ) -> tuple[Vector, Self]:
+        if not isinstance(k, int) or not 0 < k <= size:
+            raise ValueError("Number of eigenpairs must be in range from 1 to matrix size")
+
+        generator = random.Random(seed)
+
+        if method == "lanczos":
+            values, vectors = Matrix._lanczos(
+                matvec, size, k, tolerance, max_iterations or 10 * size, generator
+            )
+        elif method == "power":
+            values, vectors = Matrix._subspace_iteration(
+                matvec, size, k, tolerance, max_iterations or 1000, generator
+            )
+        else:
+            raise ValueError(f'Unknown method "{method}", use "lanczos" or "power"')
+
+        return (
+            Vector(values, dtype=float),
+            Matrix._from_data([list(row) for row in zip(*vectors)], float, columns=k),
+        )
+
+    @staticmethod
+    def _lanczos(
+        matvec: Callable[[list], Iterable],
+        size: int,
+        k: int,
+        tolerance: float,
+        max_iterations: int,
+        generator: random.Random,
+    ) -> tuple[list, list]:
+        mul = operator.mul
+
+        def orthogonalize(w: list, basis: list) -> list:
+            # Full reorthogonalization, repeated twice to keep the basis orthogonal in floating point.
+            for _ in range(2):
+                for q in basis:
+                    scale = sum(map(mul, w, q))
+                    w = [a - scale * b for a, b in zip(w, q)]
+            return w
+
+        def unit(w: list) -> list:
+            norm = math.hypot(*w)
+            return [item / norm for item in w]
+
+        basis = [unit([generator.gauss(0.0, 1.0) for _ in range(size)])]
+        alphas, betas = [], []
+
+        while True:
+            q = basis[-1]
+            w = list(map(float, matvec(q)))
+            alphas.append(sum(map(mul, w, q)))
+            w = orthogonalize(w, basis)
+            beta = math.hypot(*w)
+
+            steps = len(basis)
+            exhausted = steps == size or steps >= max_iterations
+            invariant = beta <= sys.float_info.epsilon * max(abs(item) for item in alphas)
+
+            if steps >= k and (exhausted or not invariant and steps % 5 == 0):
+                diagonal, subdiagonal = list(alphas), betas + [0.0]
+                vectors = [[1.0 if i == j else 0.0 for i in range(steps)] for j in range(steps)]
+                Matrix._tridiagonal_eigen(diagonal, subdiagonal, vectors)
+
+                order = sorted(range(steps), key=lambda i: -abs(diagonal[i]))[:k]
+                scale = max(abs(diagonal[order[0]]), sys.float_info.min)
+
+                if exhausted or all(
+                    abs(beta * vectors[i][-1]) <= tolerance * scale for i in order
+                ):
+                    ritz = []
+
+                    for i in order:
+                        vector = [0.0] * size
+                        for q, coefficient in zip(basis, vectors[i]):
+                            vector = [a + coefficient * b for a, b in zip(vector, q)]
+                        ritz.append(vector)
+
+                    return [diagonal[i] for i in order], ritz
+
+            if invariant:
+                # Krylov space is exhausted, continue from a fresh direction orthogonal to it
+                w = orthogonalize([generator.gauss(0.0, 1.0) for _ in range(size)], basis)
+                betas.append(0.0)
+            else:
+                betas.append(beta)
+
+            basis.append(unit(w))
+
+    @staticmethod
+    def _subspace_iteration(
+        matvec: Callable[[list], Iterable],
+        size: int,
+        k: int,
+        tolerance: float,
+        max_iterations: int,
+        generator: random.Random,
+    ) -> tuple[list, list]:
+        mul = operator.mul
+
+        def combine(vectors: list, coefficients: list) -> list:
+            result = [0.0] * size
+            for vector, coefficient in zip(vectors, coefficients):
+                result = [a + coefficient * b for a, b in zip(result, vector)]
+            return result
+
+        block = Matrix._orthonormal_basis(
+            [[generator.gauss(0.0, 1.0) for _ in range(size)] for _ in range(k)]
+        )
+
+        for _ in range(max_iterations):
+            images = [list(map(float, matvec(x))) for x in block]
+
+            # Rayleigh-Ritz on the current block
+            projected = [[sum(map(mul, x, y)) for y in images] for x in block]
+            diagonal = [projected[i][i] for i in range(k)]
+            subdiagonal = [0.0] * k
+
+            if k > 1:
+                reduced = Matrix._from_data(
+                    [
+                        [(projected[i][j] + projected[j][i]) / 2 for j in range(k)]
+                        for i in range(k)
+                    ],
+                    float,
+                )
+                diagonal, subdiagonal, rotation = reduced._tridiagonalize()
+                Matrix._tridiagonal_eigen(diagonal, subdiagonal, rotation)
+            else:
+                rotation = [[1.0]]
+
+            order = sorted(range(k), key=lambda i: -abs(diagonal[i]))
+            ritz = [combine(block, rotation[i]) for i in order]
+            images = [combine(images, rotation[i]) for i in order]
+            values = [diagonal[i] for i in order]
+            scale = max(abs(values[0]), sys.float_info.min)
+
+            if all(
+                math.hypot(*(a - value * b for a, b in zip(image, x))) <= tolerance * scale
+                for value, image, x in zip(values, images, ritz)
+            ):
+                return values, ritz
+
+            block = Matrix._orthonormal_basis(images)
+
+        return values, ritz
+
+    @staticmethod
+    def _jacobi_svd(columns: list) -> tuple[list, list, list]:
+        # One-sided (Hestenes) Jacobi on the columns of a square matrix. Returns columns of U and V
+        # and singular values, ordered by decreasing singular value.
+        size = len(columns)
+        rows = len(columns[0]) if columns else 0
+        G = [list(map(float, column)) for column in columns]
+        V = [[1.0 if i == j else 0.0 for i in range(size)] for j in range(size)]
+        mul = operator.mul
+        epsilon = sys.float_info.epsilon
+
+        for _ in range(60):
+            rotated = False
+
+            for p in range(size - 1):
+                for q in range(p + 1, size):
+                    gp, gq = G[p], G[q]
+                    alpha = sum(map(mul, gp, gp))
+                    beta = sum(map(mul, gq, gq))
+                    gamma = sum(map(mul, gp, gq))
+
+                    if abs(gamma) <= epsilon * math.sqrt(alpha * beta):
+                        continue
+
+                    rotated = True
+                    zeta = (beta - alpha) / (2.0 * gamma)
+                    t = math.copysign(1.0, zeta) / (abs(zeta) + math.hypot(1.0, zeta))
+                    c = 1.0 / math.hypot(1.0, t)
+                    s = c * t
+
+                    G[p] = [c * a - s * b for a, b in zip(gp, gq)]
+                    G[q] = [s * a + c * b for a, b in zip(gp, gq)]
+
+                    vp, vq = V[p], V[q]
+                    V[p] = [c * a - s * b for a, b in zip(vp, vq)]
+                    V[q] = [s * a + c * b for a, b in zip(vp, vq)]
+
+            if not rotated:
+                break
+
+        sigma = [math.hypot(*column) for column in G]
+        order = sorted(range(size), key=lambda i: -sigma[i])
+        tiny = (sigma[order[0]] if size else 0.0) * max(size, rows) * epsilon
+
+        U = []
+
+        for i in order:
+            if sigma[i] > tiny:
+                U.append([item / sigma[i] for item in G[i]])
+                continue
+
+            # Null direction (singular values are sorted, so all others are already in U),
+            # complete U with a unit vector orthogonal to the columns found so far
+            for j in range(rows):
+                candidate = [1.0 if row == j else 0.0 for row in range(rows)]
+
+                for _ in range(2):
+                    for u in U:
+                        scale = sum(map(mul, candidate, u))
+                        candidate = [a - scale * b for a, b in zip(candidate, u)]
+
+                norm = math.hypot(*candidate)
+
+                if norm > 0.5:
+                    U.append([item / norm for item in candidate])
+                    break
+
+        return U, [sigma[i] for i in order], [V[i] for i in order]
+
+    def svd(self, full: bool = False) -> tuple[Self, Vector, Self]:
+        """Calculates singular value decomposition of the matrix.
+
+        Matrix is first reduced by Householder QR, then the triangular factor is diagonalized by one-sided Jacobi rotations.
+        Intended for small and medium matrices, see `randomized_svd` for low-rank approximation of large ones.
+
+        Parameters
+        ----------
+        full : bool, optional
+            If True, U and V^T are square (rows x rows and columns x columns). By default reduced (thin)
+            decomposition is returned, where U has min(rows, columns) columns.
+
+        Returns
+        -------
+        tuple[Matrix, Vector, Matrix]
+            Float matrices U and V^T, and singular values in decreasing order, such that U * diag(S) * V^T equals the matrix.
+
+        Raises
+        ------
+        TypeError
+            If matrix dtype is not int, float or bool."""
+
+        if self.dtype not in (int, float, bool):
+            raise TypeError("SVD is only defined for int, float and bool matrices.")
+
+        rows, columns = self.shape
+
+        if rows < columns:
+            U, S, Vt = Matrix._from_data(
+                [list(column) for column in zip(*self.__data)], self.dtype, columns=rows
+            ).svd(full)
+
+            return (
+                Matrix._from_data([list(row) for row in zip(*Vt.__data)], float, columns=Vt.rows),
+                S,
+                Matrix._from_data([list(row) for row in zip(*U.__data)], float, columns=U.rows),
+            )
+
+        Q, R = self.qr(complete=full)
+
+        u_columns, sigma, v_columns = self._jacobi_svd(
+            [list(column) for column in zip(*R.__data[:columns])]
+        )
+
+        U = self._matrix_product(
+            [row[:columns] for row in Q.__data],
+            [list(row) for row in zip(*u_columns)],
+        )
+
+        if full:
+            U = [left + row[columns:] for left, row in zip(U, Q.__data)]
+
+        return (
+            Matrix._from_data(U, float, columns=Q.columns),
+            Vector(sigma, dtype=float),
+            Matrix._from_data(v_columns, float, columns=columns),
+        )
+
+    def randomized_svd(
+        self,
+        k: int,
+        oversample: int = 10,
+        power_iters: int = 2,
+        seed: Optional[int] = None,
+    ) -> tuple[Self, Vector, Self]:
+        """Calculates truncated (rank k) singular value decomposition with randomized range finder.
+
+        Range of the matrix is sampled by product with a random Gaussian matrix of k + oversample columns,
+        refined by power iterations and orthonormalized with QR. The matrix is then projected on that
+        basis and the small projection is decomposed exactly. Besides the matrix itself, memory used
+        scales with (rows + columns) * (k + oversample).
+
+        Parameters
+        ----------
+        k : int
+            Number of singular triplets to compute.
+        oversample : int, optional
+            Number of additional random samples improving accuracy. Default 10.
+        power_iters : int, optional
+            Number of power iterations, useful when singular values decay slowly. Default 2.
+        seed : int, optional
+            Seed for the random test matrix.
+
+        Returns
+        -------
+        tuple[Matrix, Vector, Matrix]
+            Float matrices U (rows x k) and V^T (k x columns), and k largest singular values in decreasing order.
+
+        Raises
+        ------
+        ValueError
+            If k is not in range from 1 to min(rows, columns).
+        TypeError
+            If matrix dtype is not int, float or bool."""
+
+        if self.dtype not in (int, float, bool):
+            raise TypeError("SVD is only defined for int, float and bool matrices.")
+
+        rows, columns = self.shape
+
+        if not isinstance(k, int) or not 0 < k <= min(rows, columns):
+            raise ValueError("Rank of decomposition must be in range from 1 to min(rows, columns)")
+
+        samples = min(k + max(oversample, 0), rows, columns)
+        generator = random.Random(seed)
+        data = self.__data
+
+        def transposed(X: list) -> list:
+            return [list(row) for row in zip(*X)]
+
+        omega = [[generator.gauss(0.0, 1.0) for _ in range(samples)] for _ in range(columns)]
+        basis = self._orthonormal_basis(transposed(self._matrix_product(data, omega)))
+
+        for _ in range(power_iters):
+            # basis columns are rows of Q^T, so Q^T * A gives (A^T * Q)^T directly
+            basis = self._orthonormal_basis(self._matrix_product(basis, data))
+            basis = self._orthonormal_basis(
+                transposed(self._matrix_product(data, transposed(basis)))
+            )
+
+        projection = Matrix._from_data(
+            self._matrix_product(basis, data), float, columns=columns
+        )
+        U, S, Vt = projection.svd()
+
+        U = self._matrix_product(transposed(basis), [row[:k] for row in U.__data])
+
+        return (
+            Matrix._from_data(U, float, columns=k),
+            Vector(S.to_list()[:k], dtype=float),
+            Matrix._from_data(Vt.__data[:k], float, columns=columns),
+        )
+
     def to_lower_triangular(self) -> Self:
         """Converts the matrix to lower triangular form.
 
@@ -1233,6 +2525,95 @@ def to_logical_matrix(self) -> Self:
 
         return self
 
+    def to_bit_matrix(self) -> "BitMatrix":
+        """Converts the matrix to BitMatrix, elements packed as bits by their truth values.
+
+        Unlike `to_logical_matrix`, the matrix itself is not changed and the result takes one bit per element."""
+
+        from datalab.BitMatrix import BitMatrix
+
+        return BitMatrix(self.__data)
+
+    def summed_area_table(self, mode: Literal["auto", "static", "fenwick"] = "auto") -> "SummedAreaTable":
+        """Returns summed-area table of the matrix for O(1) sums and means of rectangular regions.
+
+        The table is attached to the matrix and updated on every `set`. In "auto" mode it answers queries
+        in O(1) until the first change of an element, then it switches to a 2D Fenwick tree with
+        O(log(rows) * log(columns)) updates and queries. See `datalab.index.SummedAreaTable`.
+
+        Parameters
+        ----------
+        mode : {"auto", "static", "fenwick"}, optional
+            Update strategy, default "auto".
+
+        Returns
+        -------
+        SummedAreaTable
+            Table of the matrix (the existing one if already created with the same mode)."""
+
+        from datalab.index.prefix import SummedAreaTable
+
+        table = self.__summed_area_table
+
+        if table is None or table.requested_mode != mode:
+            if table is not None:
+                table.detach()
+
+            self.__summed_area_table = SummedAreaTable(self, mode)
+
+        return self.__summed_area_table
+
+    def sort_rows(
+        self,
+        by: Optional[Union[int, Iterable[int]]] = None,
+        reverse: bool = False,
+    ) -> Self:
+        """Sorts rows of the matrix in place (stable sort).
+
+        Parameters
+        ----------
+        by : int or Iterable[int], optional
+            Index of the key column, or indexes of columns compared lexicographically.
+            By default whole rows are compared.
+        reverse : bool, optional
+            Sort in descending order. Default False.
+
+        Returns
+        -------
+        Matrix
+            This matrix with sorted rows.
+
+        Raises
+        ------
+        ValueError
+            If `by` is an empty sequence.
+        IndexError
+            If some column index is out of range.
+
+        Example
+        -------
+        >>> matrix([[2, 7], [1, 8], [2, 6]]).sort_rows(by=0).to_list()
+        [[1, 8], [2, 7], [2, 6]]"""
+
+        if by is None:
+            self.__data.sort(reverse=reverse)
+            self._notify_reset()
+
+            return self
+
+        columns = [by] if isinstance(by, int) else list(by)
+
+        if not columns:
+            raise ValueError("At least one key column must be given, use by=None to compare whole rows")
+
+        if any(not -self.columns <= column < self.columns for column in columns):
+            raise IndexError(f"Matrix has {self.columns} columns")
+
+        self.__data.sort(key=operator.itemgetter(*columns), reverse=reverse)
+        self._notify_reset()
+
+        return self
+
     def to_list(self) -> list[list[Union[int, float, str, bool]]]:
         """Converts the matrix to a Python list"""
 
@@ -1251,7 +2632,12 @@ def to_set(self):
     def copy(self) -> Self:
         """Creates a copy of the matrix"""
 
-        return copy.copy(self)
+        matrix = copy.copy(self)
+        matrix.__data = [list(row) for row in self.__data]
+        matrix.__listeners = ()
+        matrix.__summed_area_table = None
+
+        return matrix
 
     def deep_copy(self) -> Self:
         """Creates a deep copy of the matrix"""
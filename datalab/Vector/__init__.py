@@ -2,6 +2,13 @@
 
 
 class Vector:
+    # Structures derived from the data (e.g. hash index), notified about every change of elements.
+    __listeners: tuple = ()
+    __hash_index = None
+    __prefix_index = None
+    __range_index = None
+    __sorted = False
+
     @overload
     def __init__(
         self,
@@ -50,6 +57,38 @@ def __init__(
         self.__supported_types = int, float, str, bool
         self.__precision = 4
     
+    @classmethod
+    def _from_data(
+        cls,
+        data: list[Union[int, float, str, bool]],
+        dtype: type,
+    ) -> Self:
+        """Wraps already validated list into a new vector without copying or converting it"""
+
+        vector = cls.__new__(cls)
+
+        vector.__size = len(data)
+        vector.__dtype = dtype
+        vector.__data = data
+        vector.__supported_types = int, float, str, bool
+        vector.__precision = 4
+
+        return vector
+
+    def _attach(self, listener: Any) -> None:
+        # Listener must provide _on_set(index, old, new) called after change of a single element
+        # and _on_reset() called after bulk change of the data.
+        self.__listeners = (*self.__listeners, listener)
+
+    def _detach(self, listener: Any) -> None:
+        self.__listeners = tuple(item for item in self.__listeners if item is not listener)
+
+    def _notify_reset(self) -> None:
+        self.__sorted = False
+
+        for listener in self.__listeners:
+            listener._on_reset()
+
     def _initialize_data_structure(
         self,
         object: Optional[Iterable] = None,
@@ -274,7 +313,7 @@ def multiplication(
         Parameters
         ----------
         object : int or float or str or bool or Iterable
-            The object to multiply with the vector. It can be a scalar value (int, float, str, or bool), another Vector, or an iterable object with compatible length.
+            The object to multiply with the vector. It can be a scalar value (int, float, str, or bool), another Vector, a Matrix, or an iterable object with compatible length.
 
         Returns
         -------
@@ -284,9 +323,36 @@ def multiplication(
         Raises
         ------
         ArithmeticError
-            If the object is a Vector or iterable with a different length than the vector.
+            If the object is a Vector or iterable with a different length than the vector,
+            or a Matrix with number of rows different than the vector size.
         TypeError
-            If the object is an invalid operand for vector multiplication."""
+            If the object is an invalid operand for vector multiplication.
+
+        Notes
+        -----
+        If the object is a Matrix, the vector is treated as a row vector and vector-matrix product is returned.
+        Matrix rows are streamed once, each scaled by the corresponding vector element and accumulated."""
+
+        from datalab.Matrix import Matrix
+
+        if isinstance(object, Matrix):
+            if self.size != object.rows:
+                raise ArithmeticError(
+                    "Cannot multiply vector and matrix with incompatible dimensions"
+                )
+
+            if self.dtype not in (int, float, bool) or object.dtype not in (int, float, bool):
+                raise TypeError("Vector-matrix product is only defined for numeric dtypes")
+
+            result = [0] * object.columns
+
+            for scale, row in zip(self.__data, object.to_list()):
+                if scale:
+                    result = [total + scale * item for total, item in zip(result, row)]
+
+            dtype = float if float in (self.dtype, object.dtype) else int
+
+            return Vector._from_data(list(map(dtype, result)), dtype)
 
         buffer = self.deep_copy()
 
@@ -402,6 +468,28 @@ def set(
                 f"Vector has {self.size} elements, you cannot appeal to {index} element"
             )
 
+        if self.__sorted:
+            position = index % self.size
+            data = self.__data
+
+            neighbours = data[max(position - 1, 0):position] + data[position + 1:position + 2]
+
+            # values of different types (e.g. after a failed conversion) are not known to keep the order
+            if any(type(item) is not type(value) for item in neighbours) or (
+                position and value < data[position - 1]
+                or position < self.size - 1 and data[position + 1] < value
+            ):
+                self.__sorted = False
+
+        if self.__listeners:
+            old = self.__data[index]
+            self.__data[index] = value
+
+            for listener in self.__listeners:
+                listener._on_set(index % self.size, old, value)
+
+            return
+
         self.__data[index] = value
 
     def __getitem__(
@@ -523,7 +611,7 @@ def magnitude(self) -> float:
         Object's magnitude is the displayed result of an ordering (or ranking) of the class of objects to which it belongs.
         """
 
-        return sum(a * a for a in self) ** (1 / 2)
+        return math.hypot(*self.__data)
 
     @property
     def size(self) -> int:
@@ -555,10 +643,14 @@ def change_size(
             raise TypeError("Vector size must be an integer")
 
         buffer = self.copy()
+        listeners, self.__listeners = self.__listeners, ()
 
         self.__size = new_size
         self._fill_data(buffer)
 
+        self.__listeners = listeners
+        self._notify_reset()
+
         return self
 
     def __len__(self) -> int:
@@ -604,10 +696,11 @@ def change_dtype(self, new_dtype: type) -> Self:
                 f"You must choose one of this types: {self.__supported_types}",
             )
 
-        self.__dtype = new_dtype
+        converted = [convert(item, new_dtype) for item in self.__data]
 
-        for index, item in enumerate(self):
-            self.set(index, convert(item, new_dtype))
+        self.__dtype = new_dtype
+        self.__data[:] = converted
+        self._notify_reset()
 
         return self
 
@@ -635,7 +728,7 @@ def distance_to(self, other: Self) -> float:
                 "Cannot calculate distance for vectors with different sizes."
             )
 
-        return (sum((a - b) ** 2 for a, b in zip(self, other))) ** (1 / 2)
+        return math.dist(self.__data, other.to_list())
 
     def dot_product(self, other: Self) -> Union[int, float]:
         """Computes the dot product between the vector and another vector.
@@ -668,7 +761,7 @@ def dot_product(self, other: Self) -> Union[int, float]:
                 "Cannot compute dot product for vectors with other dtypes than int and float"
             )
 
-        return sum(a * b for a, b in zip(self, other))
+        return sum(map(operator.mul, self.__data, other.to_list()))
 
     def cross_product(self, other: Self) -> Self:
         """Computes the cross product between the vector and another 3-dimensional vector.
@@ -702,10 +795,20 @@ def cross_product(self, other: Self) -> Self:
             ]
         )
 
-    def normalize(self) -> Self:
-        """Returns a normalized version of the vector (a unit vector in the same direction)."""
+    def normalize(self, in_place: bool = False) -> Self:
+        """Returns a normalized version of the vector (a unit vector in the same direction).
+
+        Parameters
+        ----------
+        in_place : bool, optional
+            If True, the vector itself is normalized (its dtype becomes float) and returned. Default False."""
 
-        return self.deep_copy().scale(1 / self.magnitude)
+        factor = 1 / self.magnitude
+
+        if in_place:
+            return self.scal(factor)
+
+        return Vector._from_data([item * factor for item in self.__data], float)
 
     def scale(self, factor: Union[int, float]) -> Self:
         """Scales the vector by multiplying each element by the given factor.
@@ -728,7 +831,127 @@ def scale(self, factor: Union[int, float]) -> Self:
         if not isinstance(factor, (int, float)):
             raise TypeError("Scale factor must be int or float")
 
-        return self.deep_copy() * factor
+        # Only numeric storage holds the raw products; other dtypes convert them element by element.
+        if self.dtype not in (int, float):
+            return self.deep_copy() * factor
+
+        dtype = float if isinstance(factor, float) else self.dtype
+
+        return Vector._from_data([item * factor for item in self.__data], dtype)
+
+    def _operand_data(self, object: Union[Self, Iterable], name: str) -> list:
+        data = object.to_list() if isinstance(object, Vector) else object
+
+        if not isinstance(data, (list, tuple)):
+            raise TypeError(f"{name} operand must be a Vector, list or tuple")
+
+        if len(data) != self.size:
+            raise ArithmeticError(f"Cannot compute {name} for vectors with different sizes")
+
+        return data
+
+    def _promote_to(self, *values: Union[int, float, Self, Iterable]) -> None:
+        if self.dtype not in (int, float):
+            raise TypeError("In-place arithmetic is only supported for int and float vectors")
+
+        if self.dtype == int and any(
+            isinstance(value, float)
+            or isinstance(value, Vector) and value.dtype == float
+            or isinstance(value, (list, tuple)) and any(isinstance(item, float) for item in value)
+            for value in values
+        ):
+            self.__dtype = float
+
+    def axpy(self, alpha: Union[int, float], x: Union[Self, Iterable]) -> Self:
+        """Adds scaled vector to this vector in place (y = alpha * x + y).
+
+        Computed in a single pass without temporary vectors. Int vector becomes float if any operand is float.
+
+        Parameters
+        ----------
+        alpha : int or float
+            Scale factor of x.
+        x : Vector or Iterable
+            Vector, list or tuple of the same size.
+
+        Returns
+        -------
+        Vector
+            This vector after update.
+
+        Raises
+        ------
+        ArithmeticError
+            If x has different size than the vector.
+        TypeError
+            If the vector or x is not numeric."""
+
+        data = self._operand_data(x, "axpy")
+        self._promote_to(alpha, x)
+
+        self.__data[:] = [y + alpha * item for y, item in zip(self.__data, data)]
+        self._notify_reset()
+
+        return self
+
+    def scal(self, alpha: Union[int, float]) -> Self:
+        """Scales the vector in place (x = alpha * x).
+
+        Parameters
+        ----------
+        alpha : int or float
+            Scale factor.
+
+        Returns
+        -------
+        Vector
+            This vector after update.
+
+        Raises
+        ------
+        TypeError
+            If the vector or alpha is not numeric."""
+
+        if not isinstance(alpha, (int, float)):
+            raise TypeError("Scale factor must be int or float")
+
+        self._promote_to(alpha)
+
+        self.__data[:] = [alpha * item for item in self.__data]
+        self._notify_reset()
+
+        return self
+
+    def fma(self, x: Union[Self, Iterable], y: Union[Self, Iterable]) -> Self:
+        """Adds element-wise product of two vectors to this vector in place (z = x * y + z).
+
+        Parameters
+        ----------
+        x, y : Vector or Iterable
+            Vectors, lists or tuples of the same size.
+
+        Returns
+        -------
+        Vector
+            This vector after update.
+
+        Raises
+        ------
+        ArithmeticError
+            If x or y has different size than the vector.
+        TypeError
+            If any vector is not numeric."""
+
+        first = self._operand_data(x, "fma")
+        second = self._operand_data(y, "fma")
+        self._promote_to(x, y)
+
+        self.__data[:] = [
+            z + a * b for z, a, b in zip(self.__data, first, second)
+        ]
+        self._notify_reset()
+
+        return self
 
     def sum(self) -> Union[int, float, str]:
         """Calculates the sum of all elements in the Vector.
@@ -759,8 +982,66 @@ def sum(self) -> Union[int, float, str]:
 
         return result
 
+    def rolling(self, window: int) -> "Rolling":
+        """Creates sliding windows over the Vector for moving statistics.
+
+        Parameters
+        ----------
+        window : int
+            Number of elements in a window.
+
+        Returns
+        -------
+        Rolling
+            Object with sum, mean, var, std, min and max methods, each computed in O(n) and returning
+            a Vector with a value for every full window.
+
+        Raises
+        ------
+        ValueError
+            If window is not a positive integer.
+        TypeError
+            If dtype is not int, float or bool.
+
+        Example
+        -------
+        >>> vector([1, 2, 3, 4]).rolling(2).mean().to_list()
+        [1.5, 2.5, 3.5]"""
+
+        from datalab.stat.func.rolling import Rolling
+
+        return Rolling(self, window)
+
+    def ewma(
+        self,
+        alpha: Optional[float] = None,
+        span: Optional[float] = None,
+        halflife: Optional[float] = None,
+        adjust: bool = True,
+    ) -> Self:
+        """Calculates exponentially weighted moving average, see `datalab.stat.ewma` for parameters.
+
+        Returns
+        -------
+        Vector
+            Float Vector with the average after every element.
+
+        Raises
+        ------
+        TypeError
+            If dtype is not int, float or bool."""
+
+        from datalab.stat.func.rolling import ewma
+
+        if self.dtype not in (int, float, bool):
+            raise TypeError("Moving average is only defined for int, float and bool vectors")
+
+        return Vector._from_data(list(ewma(self.__data, alpha, span, halflife, adjust)), float)
+
     def max_value(self) -> Union[int, float, str, bool]:
-        """Linear search algorithm for maximal value in the Vector.
+        """Finds maximal value in the Vector.
+
+        O(1) for a sorted Vector (see `is_sorted`), a single linear scan otherwise.
 
         Returns
         -------
@@ -775,29 +1056,15 @@ def max_value(self) -> Union[int, float, str, bool]:
         if self.size == 0:
             raise ValueError("Vector without size, cannot have a maximum element")
 
-        elif self.size == 1:
-            return self[0]
-
-        elif self.size == 2:
-            if self[0] > self[1]:
-                return self[0]
-            else:
-                return self[1]
-
-        elif self.is_empty():
-            return self[0]
+        if self.__sorted:
+            return self.__data[-1]
 
-        else:
-            current_max = self[0]
-
-            for item in self:
-                if item > current_max:
-                    current_max = item
-
-            return current_max
+        return max(self.__data)
 
     def min_value(self) -> Union[int, float, str, bool]:
-        """Linear search algorithm for minimal value in the Vector.
+        """Finds minimal value in the Vector.
+
+        O(1) for a sorted Vector (see `is_sorted`), a single linear scan otherwise.
 
         Returns
         -------
@@ -812,62 +1079,368 @@ def min_value(self) -> Union[int, float, str, bool]:
         if self.size == 0:
             raise ValueError("Vector without size, cannot have a minimum element")
 
-        elif self.size == 1:
-            return self[0]
+        if self.__sorted:
+            return self.__data[0]
 
-        elif self.size == 2:
-            if self[0] < self[1]:
-                return self[0]
-            else:
-                return self[1]
+        return min(self.__data)
+
+    @property
+    def is_sorted(self) -> bool:
+        """Whether elements are in ascending order.
 
-        elif self.is_empty():
-            return self[0]
+        The flag is tracked: `sort` sets it, changes which break the order clear it. When it is not set,
+        the order is checked by a linear scan and the flag is set if the Vector turns out to be sorted."""
 
-        else:
-            current_min = self[0]
+        if not self.__sorted:
+            data = self.__data
+            self.__sorted = all(map(operator.le, data, itertools.islice(data, 1, None)))
 
-            for item in self:
-                if item < current_min:
-                    current_min = item
+        return self.__sorted
 
-            return current_min
+    def sort(self, reverse: bool = False) -> Self:
+        """Sorts elements in place (stable sort).
+
+        Parameters
+        ----------
+        reverse : bool, optional
+            Sort in descending order. Default False.
+
+        Returns
+        -------
+        Vector
+            This Vector, sorted."""
+
+        self.__data.sort(reverse=reverse)
+        self._notify_reset()
+        self.__sorted = not reverse or self.size < 2
+
+        return self
+
+    def argsort(self, reverse: bool = False) -> Self:
+        """Returns positions which would sort the Vector (stable: equal elements keep their order).
+
+        Parameters
+        ----------
+        reverse : bool, optional
+            Order of positions for descending sort. Default False.
+
+        Returns
+        -------
+        Vector
+            Int Vector of positions.
+
+        Example
+        -------
+        >>> vector([30, 10, 20]).argsort().to_list()
+        [1, 2, 0]"""
+
+        if self.__sorted and not reverse:
+            return Vector._from_data(list(range(self.size)), int)
+
+        return Vector._from_data(
+            sorted(range(self.size), key=self.__data.__getitem__, reverse=reverse), int
+        )
+
+    def _check_sorted(self) -> None:
+        if not self.is_sorted:
+            raise ValueError("Vector must be sorted in ascending order, use sort method")
+
+    def searchsorted(
+        self,
+        value: Union[int, float, str, bool, Iterable],
+        side: Literal["left", "right"] = "left",
+    ) -> Union[int, Self]:
+        """Finds positions where values should be inserted to keep the sorted Vector in order.
+
+        Every lookup is a binary search, O(log n).
+
+        Parameters
+        ----------
+        value : int or float or str or bool or Iterable
+            Searched value, or Vector/list of values.
+        side : {"left", "right"}, optional
+            For equal elements, "left" gives position of the first of them, "right" the position after the last.
+            Default "left".
+
+        Returns
+        -------
+        int or Vector
+            Position, or int Vector of positions for multiple values.
+
+        Raises
+        ------
+        ValueError
+            If the Vector is not sorted in ascending order or side is unknown.
+
+        Example
+        -------
+        >>> vector([1, 2, 2, 5]).searchsorted(2, side="right")
+        3"""
+
+        if side not in ("left", "right"):
+            raise ValueError(f'Unknown side "{side}", use "left" or "right"')
+
+        self._check_sorted()
+
+        search = functools.partial(
+            bisect.bisect_left if side == "left" else bisect.bisect_right, self.__data
+        )
+
+        if isinstance(value, (int, float, str, bool)):
+            return search(value)
+
+        values = value.to_list() if isinstance(value, Vector) else value
+
+        return Vector._from_data(list(map(search, values)), int)
+
+    def between(
+        self,
+        low: Union[int, float, str, bool],
+        high: Union[int, float, str, bool],
+    ) -> Self:
+        """Selects elements in the closed range [low, high], keeping their order.
+
+        For a sorted Vector the range is located by two binary searches and sliced, O(log n + k),
+        otherwise elements are filtered in a linear scan.
+
+        Returns
+        -------
+        Vector
+            Vector with selected elements."""
+
+        data = self.__data
+
+        if self.__sorted:
+            selected = data[bisect.bisect_left(data, low):bisect.bisect_right(data, high)]
+        else:
+            selected = [item for item in data if low <= item <= high]
+
+        return Vector._from_data(selected, self.dtype)
 
     def is_empty(self) -> bool:
         """Checks if the Vector is empty (fullfiled with empty elements)"""
 
-        empty_element = self._empty_element()
-
-        for item in self:
-            if item != empty_element:
-                return False
+        if self.dtype == bool:
+            return not any(self.__data)
 
-        return True
+        return self.__data.count(self._empty_element()) == self.size
 
     def is_full(self) -> bool:
         """Check if the Vector is full (no element is empty)"""
 
-        empty_element = self._empty_element()
+        if self.dtype == bool:
+            return all(self.__data)
 
-        for item in self:
-            if item == empty_element:
-                return False
+        return self._empty_element() not in self.__data
 
-        return True
+    def to_bit_vector(self) -> "BitVector":
+        """Converts the Vector to BitVector, elements packed as bits by their truth values"""
+
+        from datalab.BitVector import BitVector
+
+        return BitVector(self.__data)
+
+    def create_index(self) -> "HashIndex":
+        """Creates hash index (value -> positions) maintained on every change of the Vector.
+
+        With the index `index_of`, `in` and `value_counts` lookups cost O(1) instead of a linear scan,
+        at the price of memory for positions and a dictionary update in every `set`.
+
+        Returns
+        -------
+        HashIndex
+            Index of the Vector (the existing one if already created)."""
+
+        from datalab.index.hash import HashIndex
+
+        if self.__hash_index is None:
+            self.__hash_index = HashIndex(self)
+
+        return self.__hash_index
+
+    def drop_index(self) -> None:
+        """Removes hash index of the Vector"""
+
+        if self.__hash_index is not None:
+            self.__hash_index.detach()
+            self.__hash_index = None
+
+    @property
+    def has_index(self) -> bool:
+        """Whether the Vector has a hash index"""
+
+        return self.__hash_index is not None
+
+    def prefix_index(self, mode: Literal["auto", "static", "fenwick"] = "auto") -> "PrefixSumIndex":
+        """Returns prefix-sum index of the Vector for O(1) sums and means of index ranges.
+
+        The index is attached to the Vector and updated on every `set`. In "auto" mode it answers queries
+        in O(1) until the first change of an element, then it switches to a Fenwick tree with O(log n)
+        updates and queries. See `datalab.index.PrefixSumIndex`.
+
+        Parameters
+        ----------
+        mode : {"auto", "static", "fenwick"}, optional
+            Update strategy, default "auto".
+
+        Returns
+        -------
+        PrefixSumIndex
+            Index of the Vector (the existing one if already created with the same mode)."""
+
+        from datalab.index.prefix import PrefixSumIndex
+
+        index = self.__prefix_index
+
+        if index is None or index.requested_mode != mode:
+            if index is not None:
+                index.detach()
+
+            self.__prefix_index = PrefixSumIndex(self, mode)
+
+        return self.__prefix_index
+
+    def range_index(self, mode: Literal["auto", "sparse", "segment"] = "auto") -> "RangeQueryIndex":
+        """Returns range minimum/maximum index of the Vector.
+
+        The index is attached to the Vector and updated on every `set`. In "auto" mode queries use
+        sparse tables (O(1)) until the first change of an element, then segment trees with O(log n)
+        point updates and queries. See `datalab.index.RangeQueryIndex`.
+
+        Parameters
+        ----------
+        mode : {"auto", "sparse", "segment"}, optional
+            Structure used, default "auto".
+
+        Returns
+        -------
+        RangeQueryIndex
+            Index of the Vector (the existing one if already created with the same mode)."""
+
+        from datalab.index.range_query import RangeQueryIndex
+
+        index = self.__range_index
+
+        if index is None or index.requested_mode != mode:
+            if index is not None:
+                index.detach()
+
+            self.__range_index = RangeQueryIndex(self, mode)
+
+        return self.__range_index
+
+    def __contains__(self, value: Any) -> bool:
+        if self.__hash_index is not None:
+            return value in self.__hash_index
+
+        return value in self.__data
+
+    def index_of(self, value: Union[int, float, str, bool]) -> int:
+        """Returns position of the first occurrence of value.
+
+        O(1) if the Vector has hash index (see `create_index`), linear scan otherwise.
+
+        Raises
+        ------
+        ValueError
+            If value is not present."""
+
+        if self.__hash_index is None:
+            return self.__data.index(value)
+
+        position = self.__hash_index.first(value)
+
+        if position is None:
+            raise ValueError(f"{value!r} is not in Vector")
+
+        return position
+
+    def isin(self, values: Iterable) -> Self:
+        """Checks for every element whether it is present in values.
+
+        Parameters
+        ----------
+        values : Iterable
+            Tested values (Vector, list, set, ...).
+
+        Returns
+        -------
+        Vector
+            Bool Vector of the same size."""
+
+        values = values.to_set() if isinstance(values, Vector) else set(values)
+
+        return Vector._from_data([item in values for item in self.__data], bool)
+
+    def value_counts(self) -> dict[Union[int, float, str, bool], int]:
+        """Counts occurrences of distinct values.
+
+        Returns
+        -------
+        dict
+            Number of occurrences of every distinct value, ordered from the most frequent."""
+
+        if self.__hash_index is not None:
+            counts = self.__hash_index.counts()
+        else:
+            counts = collections.Counter(self.__data)
+
+        return dict(sorted(counts.items(), key=operator.itemgetter(1), reverse=True))
+
+    def unique(
+        self,
+        return_counts: bool = False,
+        return_inverse: bool = False,
+    ) -> Union[Self, tuple[Self, ...]]:
+        """Finds sorted distinct values of the Vector.
+
+        Distinct values are found by hashing (or taken from the hash index), only they are sorted.
+
+        Parameters
+        ----------
+        return_counts : bool, optional
+            Also return number of occurrences of every distinct value. Default False.
+        return_inverse : bool, optional
+            Also return positions of elements in the distinct values, so that unique[inverse[i]] equals
+            the i-th element. Default False.
+
+        Returns
+        -------
+        Vector or tuple[Vector, ...]
+            Distinct values, followed by inverse and counts (int Vectors) if requested.
+
+        Example
+        -------
+        >>> values, counts = vector([3, 1, 3, 2]).unique(return_counts=True)
+        >>> values.to_list(), counts.to_list()
+        ([1, 2, 3], [1, 1, 2])"""
+
+        if self.__hash_index is not None:
+            counts = self.__hash_index.counts()
+        else:
+            counts = collections.Counter(self.__data)
+
+        values = sorted(counts)
+        result = [Vector._from_data(values, self.dtype)]
+
+        if return_inverse:
+            ranks = {value: i for i, value in enumerate(values)}
+            result.append(Vector._from_data([ranks[item] for item in self.__data], int))
+
+        if return_counts:
+            result.append(Vector._from_data([counts[value] for value in values], int))
+
+        return result[0] if len(result) == 1 else tuple(result)
 
     def count_zeros(self) -> int:
         """Counts the number of empty elements in the Vector"""
 
-        empty_element = self._empty_element()
-
-        return sum(1 for element in self if element == empty_element)
+        return self.__data.count(self._empty_element())
 
     def count_non_zeros(self) -> int:
         """Counts the number of non empty elements in the Vector"""
 
-        empty_element = self._empty_element()
-
-        return sum(1 for element in self if element != empty_element)
+        return self.size - self.__data.count(self._empty_element())
 
     def equals(self, other: Self, only_data: bool = False) -> bool:
         """Checks if the Vector is equal to another Vector.
@@ -944,7 +1517,14 @@ def to_set(self):
     def copy(self) -> Self:
         """Creates a copy of the vector"""
 
-        return copy.copy(self)
+        vector = copy.copy(self)
+        vector.__data = list(self.__data)
+        vector.__listeners = ()
+        vector.__hash_index = None
+        vector.__prefix_index = None
+        vector.__range_index = None
+
+        return vector
 
     def deep_copy(self) -> Self:
         """Creates a deep copy of the vector"""
@@ -1,4 +1,8 @@
 from datalab import stat
+from datalab import metrics
+from datalab import index
+from datalab import cluster
+from datalab import decomposition
 
 from datalab.functions import (
     zeros_matrix,
@@ -8,4 +12,15 @@
     identity,
     matrix,
     vector,
+    bit_vector,
+    bit_matrix,
+    eig_top_k,
+    axpy,
+    scal,
+    fma,
+    lincomb,
+)
+
+from datalab.metrics.distance import (
+    pairwise,
 )
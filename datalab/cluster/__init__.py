@@ -0,0 +1,3 @@
+from datalab.cluster.k_means import (
+    kmeans,
+)
@@ -0,0 +1,366 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from datalab.Matrix import Matrix
+from datalab.Vector import Vector
+from datalab.metrics.distance import _distance_block, _norms
+
+from datalab.utils import *
+
+_worker_points: tuple = ()
+
+
+def _initialize_worker(points: list, norms: list) -> None:
+    global _worker_points
+
+    _worker_points = points, norms
+
+
+def _assign_block(task: tuple[int, int, list, list]) -> list:
+    start, end, centroids, centroid_norms = task
+    points, norms = _worker_points
+
+    return _distance_block(
+        points[start:end], norms[start:end], centroids, centroid_norms, "euclidean", 1, 256
+    )
+
+
+class _Assignment:
+    # Assigns points to the nearest centroid with the blocked distance kernel, optionally in worker processes
+    # which receive the points only once.
+
+    def __init__(self, points: list, workers: Optional[int], block_size: int = 4096) -> None:
+        self.points = points
+        self.norms = _norms(points)
+        self.blocks = [
+            (start, min(start + block_size, len(points)))
+            for start in range(0, len(points), block_size)
+        ]
+        self.executor = None
+
+        if workers is not None and workers > 1 and len(self.blocks) > 1:
+            self.executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_initialize_worker,
+                initargs=(points, self.norms),
+            )
+
+    def __call__(self, centroids: list) -> tuple[list[int], list[float]]:
+        centroid_norms = _norms(centroids)
+        tasks = [(start, end, centroids, centroid_norms) for start, end in self.blocks]
+
+        if self.executor is None:
+            results = [
+                _distance_block(
+                    self.points[start:end], self.norms[start:end],
+                    centroids, centroid_norms, "euclidean", 1, 256,
+                )
+                for start, end, _, _ in tasks
+            ]
+        else:
+            results = self.executor.map(_assign_block, tasks)
+
+        labels, distances = [], []
+
+        for result in results:
+            for (distance, label), in result:
+                labels.append(label)
+                distances.append(distance * distance)
+
+        return labels, distances
+
+    def close(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown()
+
+
+def _initial_centroids(
+    points: list,
+    k: int,
+    init: str,
+    generator: random.Random,
+) -> list[list[float]]:
+    if init == "random":
+        return [list(point) for point in generator.sample(points, k)]
+
+    # k-means++: every next centroid is sampled with probability proportional to squared distance
+    # to the nearest centroid chosen so far
+    centroids = [list(generator.choice(points))]
+    closest = [math.dist(point, centroids[0]) ** 2 for point in points]
+
+    while len(centroids) < k:
+        total = math.fsum(closest)
+
+        if total == 0.0:
+            index = generator.randrange(len(points))
+        else:
+            index = bisect.bisect_left(
+                list(itertools.accumulate(closest)), generator.uniform(0.0, total)
+            )
+            index = min(index, len(points) - 1)
+
+        centroids.append(list(points[index]))
+        closest = [
+            min(best, math.dist(point, centroids[-1]) ** 2)
+            for best, point in zip(closest, points)
+        ]
+
+    return centroids
+
+
+def _update_centroids(
+    points: list,
+    labels: list[int],
+    distances: list[float],
+    centroids: list,
+) -> list[list[float]]:
+    # Per-cluster column sums in one pass over the rows. Empty cluster takes the point
+    # farthest from its current centroid.
+    dimension = len(points[0])
+    sums = [[0.0] * dimension for _ in centroids]
+    counts = [0] * len(centroids)
+
+    for point, label in zip(points, labels):
+        counts[label] += 1
+        sums[label] = list(map(operator.add, sums[label], point))
+
+    result = []
+    farthest = iter(
+        heapq.nlargest(counts.count(0), range(len(points)), key=distances.__getitem__)
+        if 0 in counts
+        else ()
+    )
+
+    for total, count in zip(sums, counts):
+        if count:
+            result.append([item / count for item in total])
+        else:
+            result.append(list(points[next(farthest)]))
+
+    return result
+
+
+def _lloyd(
+    points: list,
+    centroids: list,
+    max_iter: int,
+    threshold: float,
+    assign: _Assignment,
+) -> tuple[list, list[int], float]:
+    for _ in range(max_iter):
+        labels, distances = assign(centroids)
+        updated = _update_centroids(points, labels, distances, centroids)
+        shift = math.fsum(math.dist(a, b) ** 2 for a, b in zip(updated, centroids))
+        centroids = updated
+
+        if shift <= threshold:
+            break
+
+    labels, distances = assign(centroids)
+
+    return centroids, labels, math.fsum(distances)
+
+
+def _elkan(
+    points: list,
+    centroids: list,
+    max_iter: int,
+    threshold: float,
+) -> tuple[list, list[int], float]:
+    # Lloyd iterations with triangle inequality pruning: upper bound of the distance to own centroid and
+    # lower bounds of distances to all others let most point-centroid distances be skipped.
+    k = len(centroids)
+    dist = math.dist
+
+    lower = [[dist(point, centroid) for centroid in centroids] for point in points]
+    labels = [min(range(k), key=row.__getitem__) for row in lower]
+    upper = [row[label] for row, label in zip(lower, labels)]
+
+    for _ in range(max_iter):
+        between = [[dist(a, b) for b in centroids] for a in centroids]
+        half_nearest = [
+            min((between[c][o] for o in range(k) if o != c), default=math.inf) / 2
+            for c in range(k)
+        ]
+
+        for i, point in enumerate(points):
+            label = labels[i]
+
+            if upper[i] <= half_nearest[label]:
+                continue
+
+            tight = False
+            bounds = lower[i]
+
+            for c in range(k):
+                if c == label or upper[i] <= bounds[c] or upper[i] <= between[label][c] / 2:
+                    continue
+
+                if not tight:
+                    upper[i] = bounds[label] = dist(point, centroids[label])
+                    tight = True
+
+                    if upper[i] <= bounds[c] or upper[i] <= between[label][c] / 2:
+                        continue
+
+                bounds[c] = dist(point, centroids[c])
+
+                if bounds[c] < upper[i]:
+                    label = c
+                    upper[i] = bounds[c]
+
+            labels[i] = label
+
+        updated = _update_centroids(points, labels, [u * u for u in upper], centroids)
+        moved = [dist(a, b) for a, b in zip(updated, centroids)]
+        centroids = updated
+
+        for i, bounds in enumerate(lower):
+            lower[i] = [max(bound - shift, 0.0) for bound, shift in zip(bounds, moved)]
+            upper[i] += moved[labels[i]]
+
+        if math.fsum(shift * shift for shift in moved) <= threshold:
+            break
+
+    labels = [min(range(k), key=lambda c: dist(point, centroids[c])) for point in points]
+    inertia = math.fsum(dist(point, centroids[label]) ** 2 for point, label in zip(points, labels))
+
+    return centroids, labels, inertia
+
+
+def _minibatch(
+    points: list,
+    centroids: list,
+    max_iter: int,
+    threshold: float,
+    batch_size: int,
+    generator: random.Random,
+    assign: _Assignment,
+) -> tuple[list, list[int], float]:
+    counts = [0] * len(centroids)
+
+    for _ in range(max_iter):
+        batch = generator.sample(points, min(batch_size, len(points)))
+        labels, _ = _Assignment(batch, None)(centroids)
+        previous = [list(centroid) for centroid in centroids]
+
+        for point, label in zip(batch, labels):
+            counts[label] += 1
+            rate = 1.0 / counts[label]
+            centroids[label] = [
+                c + rate * (x - c) for c, x in zip(centroids[label], point)
+            ]
+
+        if math.fsum(math.dist(a, b) ** 2 for a, b in zip(centroids, previous)) <= threshold:
+            break
+
+    labels, distances = assign(centroids)
+
+    return centroids, labels, math.fsum(distances)
+
+
+def kmeans(
+    X: Union[Matrix, Iterable],
+    k: int,
+    init: Literal["k-means++", "random"] = "k-means++",
+    n_init: int = 1,
+    max_iter: int = 300,
+    tol: float = 1e-4,
+    algorithm: Literal["lloyd", "elkan", "minibatch"] = "lloyd",
+    batch_size: int = 1024,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> tuple[Matrix, Vector, float]:
+    """Clusters rows of the matrix with k-means.
+
+    Parameters
+    ----------
+    X : Matrix or Iterable
+        Matrix with points in rows (a list of Vectors or lists is also accepted).
+    k : int
+        Number of clusters.
+    init : {"k-means++", "random"}, optional
+        Initialization of centroids, default "k-means++".
+    n_init : int, optional
+        Number of runs with different initial centroids, the best (lowest inertia) is returned. Default 1.
+    max_iter : int, optional
+        Maximal number of iterations of a single run, default 300.
+    tol : float, optional
+        Run stops when sum of squared centroid shifts is lower than tol times mean variance of features.
+        Default 1e-4.
+    algorithm : {"lloyd", "elkan", "minibatch"}, optional
+        "lloyd" assigns all points with the blocked distance kernel in every iteration,
+        "elkan" skips distance evaluations using triangle inequality bounds,
+        "minibatch" updates centroids from random batches of `batch_size` points. Default "lloyd".
+    batch_size : int, optional
+        Size of batches for "minibatch" algorithm, default 1024.
+    workers : int, optional
+        Number of processes used for assignment of all points ("lloyd" and "minibatch").
+    seed : int, optional
+        Seed for the random initialization.
+
+    Returns
+    -------
+    tuple[Matrix, Vector, float]
+        Float matrix with centroids in rows, int vector with cluster of every point and inertia
+        (sum of squared distances of points to their centroids).
+
+    Raises
+    ------
+    ValueError
+        If k is not in range from 1 to number of points, or init or algorithm is unknown.
+
+    Example
+    -------
+    >>> centroids, labels, inertia = kmeans(matrix([[0, 0], [0, 1], [10, 10], [10, 11]]), 2, seed=0)
+    >>> labels[0] == labels[1] != labels[2] == labels[3]
+    True"""
+
+    if init not in ("k-means++", "random"):
+        raise ValueError(f'Unknown init "{init}", use "k-means++" or "random"')
+
+    if algorithm not in ("lloyd", "elkan", "minibatch"):
+        raise ValueError(f'Unknown algorithm "{algorithm}", use "lloyd", "elkan" or "minibatch"')
+
+    points = [list(map(float, row)) for row in as_rows(X, "K-means clustering")]
+
+    if not isinstance(k, int) or not 0 < k <= len(points):
+        raise ValueError("Number of clusters must be in range from 1 to number of points")
+
+    dimension = len(points[0])
+    count = len(points)
+    means = [math.fsum(column) / count for column in zip(*points)]
+    variance = math.fsum(
+        (item - mean) ** 2 for point in points for item, mean in zip(point, means)
+    ) / (count * max(dimension, 1))
+    threshold = tol * variance
+
+    generator = random.Random(seed)
+    assign = _Assignment(points, workers) if algorithm != "elkan" else None
+    best = None
+
+    try:
+        for _ in range(max(n_init, 1)):
+            centroids = _initial_centroids(points, k, init, generator)
+
+            if algorithm == "lloyd":
+                result = _lloyd(points, centroids, max_iter, threshold, assign)
+            elif algorithm == "elkan":
+                result = _elkan(points, centroids, max_iter, threshold)
+            else:
+                result = _minibatch(
+                    points, centroids, max_iter, threshold, batch_size, generator, assign
+                )
+
+            if best is None or result[2] < best[2]:
+                best = result
+    finally:
+        if assign is not None:
+            assign.close()
+
+    centroids, labels, inertia = best
+
+    return (
+        Matrix._from_data(centroids, float, columns=dimension),
+        Vector._from_data(labels, int),
+        inertia,
+    )
@@ -0,0 +1,3 @@
+from datalab.decomposition.pca import (
+    PCA,
+)
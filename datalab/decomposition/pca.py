@@ -0,0 +1,272 @@
+from datalab.Matrix import Matrix
+from datalab.Vector import Vector
+from datalab.stat.func.covariance import RunningCovariance
+
+from datalab.utils import *
+
+
+class PCA:
+    """Principal component analysis.
+
+    Fitting accumulates means and covariance of the features in a single pass over the rows
+    (see `datalab.stat.RunningCovariance`), so data can be fitted chunk by chunk with `partial_fit`,
+    e.g. while streaming it from disk. Components are the leading eigenvectors of the covariance matrix,
+    they are computed lazily when first needed after the data changed.
+
+    Parameters
+    ----------
+    n_components : int, optional
+        Number of kept components, by default all features.
+    method : {"auto", "cov-eigh", "randomized"}, optional
+        "cov-eigh" fully diagonalizes covariance matrix, "randomized" computes only leading components
+        with randomized range finder (see `Matrix.randomized_svd`). "auto" uses "randomized" for more
+        than 500 features when less than 80 % of components is kept. Default "auto".
+    oversample : int, optional
+        Oversampling of the randomized method, default 10.
+    power_iters : int, optional
+        Power iterations of the randomized method, default 2.
+    seed : int, optional
+        Seed of the randomized method.
+
+    Example
+    -------
+    >>> pca = PCA(1).fit(matrix([[0, 0], [1, 1], [2, 2]]))
+    >>> pca.transform(vector([3, 3])).to_list()
+    [2.82842712474619]"""
+
+    def __init__(
+        self,
+        n_components: Optional[int] = None,
+        method: Literal["auto", "cov-eigh", "randomized"] = "auto",
+        oversample: int = 10,
+        power_iters: int = 2,
+        seed: Optional[int] = None,
+    ) -> None:
+        if method not in ("auto", "cov-eigh", "randomized"):
+            raise ValueError(f'Unknown method "{method}", use "auto", "cov-eigh" or "randomized"')
+
+        if n_components is not None and (not isinstance(n_components, int) or n_components < 1):
+            raise ValueError("Number of components must be a positive integer")
+
+        self.__n_components = n_components
+        self.__method = method
+        self.__oversample = oversample
+        self.__power_iters = power_iters
+        self.__seed = seed
+        self.__accumulator = RunningCovariance()
+        self.__fitted = False
+
+    @property
+    def n_components(self) -> int:
+        """Number of kept components"""
+
+        self._check_fitted()
+
+        return len(self.__components)
+
+    @property
+    def n_samples_seen(self) -> int:
+        """Number of rows the model was fitted on"""
+
+        return self.__accumulator.count
+
+    @property
+    def mean(self) -> Vector:
+        """Means of the features"""
+
+        self._check_fitted()
+
+        return Vector._from_data(list(self.__mean), float)
+
+    @property
+    def components(self) -> Matrix:
+        """Float matrix with principal axes (unit vectors) in rows, ordered by decreasing explained variance"""
+
+        self._check_fitted()
+
+        return Matrix._from_data(
+            [list(row) for row in self.__components], float, columns=len(self.__mean)
+        )
+
+    @property
+    def explained_variance(self) -> Vector:
+        """Variances of the data along the components"""
+
+        self._check_fitted()
+
+        return Vector._from_data(list(self.__variance), float)
+
+    @property
+    def explained_variance_ratio(self) -> Vector:
+        """Fractions of total variance explained by the components"""
+
+        self._check_fitted()
+
+        total = self.__total_variance
+
+        return Vector._from_data(
+            [variance / total if total else 0.0 for variance in self.__variance], float
+        )
+
+    def fit(self, X: Union[Matrix, Iterable]) -> Self:
+        """Fits the model on rows of X, previous fit is discarded.
+
+        Parameters
+        ----------
+        X : Matrix or Iterable
+            Matrix with observations in rows (a list of Vectors or lists is also accepted).
+
+        Returns
+        -------
+        PCA
+            Fitted model.
+
+        Raises
+        ------
+        ArithmeticError
+            If there are less than two rows."""
+
+        self.__accumulator = RunningCovariance()
+
+        return self.partial_fit(X)._solve()
+
+    def partial_fit(self, X: Union[Matrix, Iterable]) -> Self:
+        """Adds chunk of rows to the fitted data.
+
+        Parameters
+        ----------
+        X : Matrix or Iterable
+            Matrix with observations in rows (a list of Vectors or lists is also accepted).
+
+        Returns
+        -------
+        PCA
+            This model.
+
+        Raises
+        ------
+        ArithmeticError
+            If rows have different number of features than already fitted data."""
+
+        self.__accumulator.update(as_rows(X, "PCA"))
+        self.__fitted = False
+
+        return self
+
+    def _check_fitted(self) -> None:
+        if not self.__fitted:
+            self._solve()
+
+    def _solve(self) -> Self:
+        covariance = self.__accumulator.covariance()
+        dimension = covariance.rows
+        k = dimension if self.__n_components is None else self.__n_components
+
+        if k > dimension:
+            raise ValueError("Number of components can not exceed number of features")
+
+        method = self.__method
+
+        if method == "auto":
+            method = "randomized" if dimension > 500 and k < 0.8 * dimension else "cov-eigh"
+
+        if method == "cov-eigh":
+            values, vectors = covariance.eigh()
+            values = values.to_list()[::-1][:k]
+            components = [list(column) for column in zip(*vectors.to_list())][::-1][:k]
+        else:
+            # covariance is symmetric positive semi-definite, its singular pairs are its eigenpairs
+            _, values, components = covariance.randomized_svd(
+                k, self.__oversample, self.__power_iters, self.__seed
+            )
+            values, components = values.to_list(), components.to_list()
+
+        for component in components:
+            # deterministic orientation, the largest coordinate of every axis is positive
+            if max(component, key=abs) < 0:
+                component[:] = [-item for item in component]
+
+        self.__mean = self.__accumulator.mean.to_list()
+        self.__components = components
+        self.__variance = [max(value, 0.0) for value in values]
+        self.__total_variance = math.fsum(covariance[i, i] for i in range(dimension))
+        self.__fitted = True
+
+        return self
+
+    def transform(self, X: Union[Matrix, Vector, Iterable]) -> Union[Matrix, Vector]:
+        """Projects rows of X (or a single Vector) onto the principal components.
+
+        Centering is folded into the projection, so all rows are transformed by a single matrix product.
+
+        Parameters
+        ----------
+        X : Matrix or Vector or Iterable
+            Matrix with observations in rows (a list of Vectors or lists is also accepted), or a single Vector.
+
+        Returns
+        -------
+        Matrix or Vector
+            Float matrix with coordinates of rows in the components, or a Vector for Vector input.
+
+        Raises
+        ------
+        ArithmeticError
+            If number of features does not match fitted data."""
+
+        self._check_fitted()
+
+        single = isinstance(X, Vector)
+        rows = [X.to_list()] if single else as_rows(X, "PCA")
+
+        if any(len(row) != len(self.__mean) for row in rows):
+            raise ArithmeticError("Number of features does not match fitted data")
+
+        mul = operator.mul
+        offset = [sum(map(mul, self.__mean, component)) for component in self.__components]
+        projection = Matrix._from_data(
+            [list(column) for column in zip(*self.__components)], float, columns=len(offset)
+        )
+        scores = (Matrix._from_data(rows, float, columns=len(self.__mean)) * projection).to_list()
+        scores = [[item - shift for item, shift in zip(row, offset)] for row in scores]
+
+        if single:
+            return Vector._from_data(scores[0], float)
+
+        return Matrix._from_data(scores, float, columns=len(offset))
+
+    def fit_transform(self, X: Union[Matrix, Iterable]) -> Matrix:
+        """Fits the model on rows of X and returns their projection onto the components."""
+
+        return self.fit(X).transform(X)
+
+    def inverse_transform(self, Y: Union[Matrix, Vector, Iterable]) -> Union[Matrix, Vector]:
+        """Maps coordinates in the components back to the feature space.
+
+        Parameters
+        ----------
+        Y : Matrix or Vector or Iterable
+            Matrix with component coordinates in rows, or a single Vector.
+
+        Returns
+        -------
+        Matrix or Vector
+            Float matrix with reconstructed rows, or a Vector for Vector input."""
+
+        self._check_fitted()
+
+        single = isinstance(Y, Vector)
+        rows = [Y.to_list()] if single else as_rows(Y, "PCA")
+
+        if any(len(row) != len(self.__components) for row in rows):
+            raise ArithmeticError("Number of coordinates does not match number of components")
+
+        data = (
+            Matrix._from_data(rows, float, columns=len(self.__components)) * self.components
+        ).to_list()
+        data = [[item + m for item, m in zip(row, self.__mean)] for row in data]
+
+        if single:
+            return Vector._from_data(data[0], float)
+
+        return Matrix._from_data(data, float, columns=len(self.__mean))
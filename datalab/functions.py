@@ -1,3 +1,5 @@
+from datalab.BitMatrix import BitMatrix
+from datalab.BitVector import BitVector
 from datalab.Matrix import Matrix
 from datalab.Vector import Vector
 
@@ -109,6 +111,48 @@ def vector(
 ) -> Vector:
     return Vector(arg1, dtype=dtype, fill=fill)
 
+def bit_vector(
+    object: Union[Iterable, int],
+    fill: bool = False,
+) -> BitVector:
+    """Creates a boolean vector stored as packed bits
+
+    Parameters
+    ----------
+    object : Iterable or int
+        Iterable of truthy/falsy values (e.g. a Vector), or size of the vector.
+    fill : bool, optional
+        Value of all elements when size is given. Default is False.
+
+    Returns
+    -------
+    BitVector
+        The packed boolean vector."""
+
+    return BitVector(object, fill=fill)
+
+
+def bit_matrix(
+    object: Union[Iterable, tuple[int, int]],
+    fill: bool = False,
+) -> BitMatrix:
+    """Creates a boolean matrix stored as packed bits
+
+    Parameters
+    ----------
+    object : Iterable or tuple[int, int]
+        Rows of truthy/falsy values (e.g. a Matrix), or shape (rows, columns).
+    fill : bool, optional
+        Value of all elements when shape is given. Default is False.
+
+    Returns
+    -------
+    BitMatrix
+        The packed boolean matrix."""
+
+    return BitMatrix(object, fill=fill)
+
+
 @overload
 def zeros_matrix(rows: int, columns: int, dtype: Union[int, float] = int) -> Matrix:
     """Creates a matrix filled with zeros of the specified shape
@@ -421,3 +465,166 @@ def identity(
 
     else:
         raise TypeError("Wrong parameters in Matrix initialization")
+
+
+def eig_top_k(
+    matvec: Callable[[list], Iterable],
+    size: int,
+    k: int,
+    method: Literal["lanczos", "power"] = "lanczos",
+    tolerance: float = 1e-10,
+    max_iterations: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> tuple[Vector, Matrix]:
+    """Calculates k dominant (largest in magnitude) eigenpairs of a linear operator given only by its matrix-vector product.
+
+    Matrix-free variant of `Matrix.eig_top_k`, the operator is never stored, so it may be too large to build as a Matrix.
+
+    Parameters
+    ----------
+    matvec : Callable[[list], Iterable]
+        Function returning product of the operator and a vector (list of floats of length size).
+    size : int
+        Dimension of the operator.
+    k : int
+        Number of eigenpairs to compute.
+    method : {"lanczos", "power"}, optional
+        Iteration used, "lanczos" (default) requires symmetric operator.
+    tolerance : float, optional
+        Relative residual norm at which eigenpair is considered converged. Default 1e-10.
+    max_iterations : int, optional
+        Maximal number of iterations.
+    seed : int, optional
+        Seed for the random starting vectors.
+
+    Returns
+    -------
+    tuple[Vector, Matrix]
+        Eigenvalues ordered by decreasing magnitude and float matrix with eigenvectors in columns.
+
+    Example
+    -------
+    >>> values, vectors = eig_top_k(lambda x: [2 * x[0], x[1]], 2, 1)
+    >>> values[0]
+    2.0"""
+
+    return Matrix._eig_top_k(
+        matvec, size, k, method, tolerance, max_iterations, seed
+    )
+
+
+def axpy(
+    a: Union[int, float],
+    x: Union[Vector, Iterable],
+    y: Vector,
+) -> Vector:
+    """Computes y = a * x + y in place, in a single pass.
+
+    Parameters
+    ----------
+    a : int or float
+        Scale factor of x.
+    x : Vector or Iterable
+        Vector, list or tuple of the same size as y.
+    y : Vector
+        Vector updated in place.
+
+    Returns
+    -------
+    Vector
+        Updated vector y.
+
+    Example
+    -------
+    >>> y = vector([1.0, 1.0])
+    >>> axpy(2, [1, 2], y).to_list()
+    [3.0, 5.0]"""
+
+    return y.axpy(a, x)
+
+
+def scal(a: Union[int, float], x: Vector) -> Vector:
+    """Computes x = a * x in place.
+
+    Parameters
+    ----------
+    a : int or float
+        Scale factor.
+    x : Vector
+        Vector updated in place.
+
+    Returns
+    -------
+    Vector
+        Updated vector x."""
+
+    return x.scal(a)
+
+
+def fma(
+    x: Union[Vector, Iterable],
+    y: Union[Vector, Iterable],
+    z: Vector,
+) -> Vector:
+    """Computes z = x * y + z (element-wise) in place, in a single pass.
+
+    Parameters
+    ----------
+    x, y : Vector or Iterable
+        Vectors, lists or tuples of the same size as z.
+    z : Vector
+        Vector updated in place.
+
+    Returns
+    -------
+    Vector
+        Updated vector z."""
+
+    return z.fma(x, y)
+
+
+def lincomb(
+    coefficients: Iterable[Union[int, float]],
+    vectors: Iterable[Union[Vector, Iterable]],
+) -> Vector:
+    """Computes linear combination of many vectors in a single pass.
+
+    Parameters
+    ----------
+    coefficients : Iterable[int or float]
+        Coefficients of the combination, one per vector.
+    vectors : Iterable[Vector or Iterable]
+        Vectors, lists or tuples of the same size.
+
+    Returns
+    -------
+    Vector
+        New vector: sum of coefficients[i] * vectors[i].
+
+    Raises
+    ------
+    ValueError
+        If numbers of coefficients and vectors differ, or no vector is given.
+    ArithmeticError
+        If vectors have different sizes.
+
+    Example
+    -------
+    >>> lincomb([2, -1], [[1, 2], [1, 1]]).to_list()
+    [1, 3]"""
+
+    coefficients = list(coefficients)
+    data = [item.to_list() if isinstance(item, Vector) else item for item in vectors]
+
+    if len(coefficients) != len(data) or not data:
+        raise ValueError("Linear combination requires the same, non-zero number of coefficients and vectors")
+
+    if any(len(item) != len(data[0]) for item in data):
+        raise ArithmeticError("Cannot combine vectors with different sizes")
+
+    mul = operator.mul
+    result = [sum(map(mul, coefficients, column)) for column in zip(*data)]
+
+    dtype = float if any(isinstance(item, float) for item in result) else int
+
+    return Vector._from_data(result, dtype)
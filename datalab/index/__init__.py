@@ -0,0 +1,26 @@
+from datalab.index.tree import (
+    KDTree,
+    BallTree,
+)
+
+from datalab.index.hash import (
+    HashIndex,
+)
+
+from datalab.index.prefix import (
+    PrefixSumIndex,
+    SummedAreaTable,
+)
+
+from datalab.index.range_query import (
+    RangeQueryIndex,
+)
+
+from datalab.index.lsh import (
+    LSHIndex,
+)
+
+from datalab.index.quantization import (
+    ScalarQuantizedVectors,
+    ProductQuantizedVectors,
+)
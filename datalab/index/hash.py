@@ -0,0 +1,81 @@
+from datalab.Vector import Vector
+
+from datalab.utils import *
+
+
+class HashIndex:
+    """Hash index of a Vector mapping every distinct value to ascending list of its positions.
+
+    Index is attached to the vector and kept up to date incrementally: changing a single element
+    (`Vector.set`) moves one position between two lists, bulk in-place operations rebuild the index.
+    Lookups of a value cost O(1) instead of a linear scan. Usually created by `Vector.create_index`.
+
+    Parameters
+    ----------
+    vector : Vector
+        Indexed vector.
+
+    Example
+    -------
+    >>> index = HashIndex(vector(["a", "b", "a"]))
+    >>> index.positions("a")
+    [0, 2]"""
+
+    def __init__(self, vector: Vector) -> None:
+        self.__vector = vector
+        self._on_reset()
+
+        vector._attach(self)
+
+    def _on_reset(self) -> None:
+        positions = {}
+
+        for i, value in enumerate(self.__vector.to_list()):
+            positions.setdefault(value, []).append(i)
+
+        self.__positions = positions
+
+    def _on_set(self, index: int, old: Any, new: Any) -> None:
+        if old == new:
+            return
+
+        positions = self.__positions[old]
+        del positions[bisect.bisect_left(positions, index)]
+
+        if not positions:
+            del self.__positions[old]
+
+        bisect.insort(self.__positions.setdefault(new, []), index)
+
+    def detach(self) -> None:
+        """Stops updating the index, it is no longer valid after next change of the vector"""
+
+        self.__vector._detach(self)
+
+    def __len__(self) -> int:
+        return len(self.__positions)
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self.__positions
+
+    def positions(self, value: Any) -> list[int]:
+        """Ascending positions of value in the vector, empty list if it is not present"""
+
+        return list(self.__positions.get(value, ()))
+
+    def first(self, value: Any) -> Optional[int]:
+        """Position of the first occurrence of value, None if it is not present"""
+
+        positions = self.__positions.get(value)
+
+        return positions[0] if positions else None
+
+    def count(self, value: Any) -> int:
+        """Number of occurrences of value"""
+
+        return len(self.__positions.get(value, ()))
+
+    def counts(self) -> dict[Any, int]:
+        """Number of occurrences of every distinct value"""
+
+        return {value: len(positions) for value, positions in self.__positions.items()}
@@ -0,0 +1,296 @@
+from datalab.Matrix import Matrix
+from datalab.Vector import Vector
+
+from datalab.utils import *
+
+
+class LSHIndex:
+    """Locality sensitive hashing index for approximate nearest neighbour search
+
+    Every vector is hashed into one bucket in each of the hash tables, query looks only at vectors sharing
+    a bucket with it (candidates) and re-ranks them by the exact distance. More bits make buckets smaller
+    (faster, lower recall), more tables increase recall at the cost of memory and time.
+
+    Hash families:
+
+    - "cosine": signed random projections, every bit is the side of a random hyperplane.
+    - "euclidean": p-stable (Gaussian) projections quantized to buckets of `bucket_width`.
+
+    Parameters
+    ----------
+    dimension : int
+        Dimension of indexed vectors.
+    metric : {"cosine", "euclidean"}, optional
+        Similarity measure, default "cosine". Cosine distance is 1 - cosine similarity.
+    tables : int, optional
+        Number of hash tables, default 8.
+    bits : int, optional
+        Number of hash functions concatenated in every table, default 12.
+    bucket_width : float, optional
+        Quantization width of euclidean hash functions, default 4.0.
+    seed : int, optional
+        Seed for random projections.
+
+    Example
+    -------
+    >>> index = LSHIndex(2, tables=4, bits=4, seed=1)
+    >>> index.extend([[1, 0], [0, 1], [0.9, 0.1]])
+    [0, 1, 2]
+    >>> distances, ids = index.query([1, 0.05], k=1)
+    >>> ids.to_list()
+    [0]"""
+
+    def __init__(
+        self,
+        dimension: int,
+        metric: Literal["cosine", "euclidean"] = "cosine",
+        tables: int = 8,
+        bits: int = 12,
+        bucket_width: float = 4.0,
+        seed: Optional[int] = None,
+    ) -> None:
+        if metric not in ("cosine", "euclidean"):
+            raise ValueError(f'Unknown metric "{metric}", use "cosine" or "euclidean"')
+
+        if not all(isinstance(value, int) and value > 0 for value in (dimension, tables, bits)):
+            raise ValueError("Dimension, number of tables and bits must be positive integers")
+
+        if bucket_width <= 0:
+            raise ValueError("Bucket width must be positive")
+
+        generator = random.Random(seed)
+
+        self.__dimension = dimension
+        self.__metric = metric
+        self.__tables = tables
+        self.__bits = bits
+        self.__width = float(bucket_width)
+
+        # All hash functions of all tables stacked, so hashing is a single matrix-vector product
+        self.__projections = [
+            [generator.gauss(0.0, 1.0) for _ in range(dimension)]
+            for _ in range(tables * bits)
+        ]
+        self.__offsets = [
+            generator.uniform(0.0, self.__width) for _ in range(tables * bits)
+        ]
+
+        self.__buckets = [{} for _ in range(tables)]
+        self.__vectors = {}
+        self.__keys = {}
+        # Magnitudes of stored vectors, computed once on insert for cosine re-ranking.
+        self.__norms = {}
+        self.__next_id = 0
+
+    def _convert(self, vector: Union[Vector, Iterable]) -> Vector:
+        if not isinstance(vector, Vector):
+            vector = Vector._from_data(list(map(float, vector)), float)
+
+        if vector.size != self.__dimension:
+            raise ArithmeticError("Vector has different dimension than the index")
+
+        if vector.dtype not in (int, float, bool):
+            raise TypeError("Only numeric vectors can be indexed")
+
+        return vector
+
+    def _hash(self, vector: Vector) -> list[Hashable]:
+        data = vector.to_list()
+        mul = operator.mul
+        values = [sum(map(mul, projection, data)) for projection in self.__projections]
+        bits = self.__bits
+
+        if self.__metric == "cosine":
+            keys = []
+
+            for table in range(self.__tables):
+                key = 0
+
+                for value in values[table * bits : (table + 1) * bits]:
+                    key = key << 1 | (value >= 0)
+
+                keys.append(key)
+
+            return keys
+
+        width = self.__width
+        codes = [
+            math.floor((value + offset) / width)
+            for value, offset in zip(values, self.__offsets)
+        ]
+
+        return [tuple(codes[table * bits : (table + 1) * bits]) for table in range(self.__tables)]
+
+    def insert(
+        self,
+        vector: Union[Vector, Iterable],
+        id: Optional[int] = None,
+    ) -> int:
+        """Adds vector to the index.
+
+        Parameters
+        ----------
+        vector : Vector or Iterable
+            Vector to insert, it is stored by reference (do not modify it afterwards).
+        id : int, optional
+            Identifier of the vector, by default next free integer.
+
+        Returns
+        -------
+        int
+            Identifier of inserted vector.
+
+        Raises
+        ------
+        KeyError
+            If the identifier is already used.
+        ArithmeticError
+            If vector has different dimension than the index."""
+
+        vector = self._convert(vector)
+
+        if id is None:
+            id = self.__next_id
+
+        if id in self.__vectors:
+            raise KeyError(f"Identifier {id} is already used in the index")
+
+        if isinstance(id, int):
+            self.__next_id = max(self.__next_id, id + 1)
+
+        keys = self._hash(vector)
+
+        for buckets, key in zip(self.__buckets, keys):
+            buckets.setdefault(key, set()).add(id)
+
+        self.__vectors[id] = vector
+        self.__keys[id] = keys
+
+        if self.__metric == "cosine":
+            self.__norms[id] = vector.magnitude
+
+        return id
+
+    def extend(self, vectors: Union[Matrix, Iterable]) -> list[int]:
+        """Adds all vectors (rows of a Matrix) to the index.
+
+        Parameters
+        ----------
+        vectors : Matrix or Iterable
+            Matrix with vectors in rows, or iterable of Vectors (lists).
+
+        Returns
+        -------
+        list[int]
+            Identifiers of inserted vectors."""
+
+        rows = vectors.to_list() if isinstance(vectors, Matrix) else vectors
+
+        return [self.insert(row) for row in rows]
+
+    def delete(self, id: int) -> None:
+        """Removes vector from the index.
+
+        Parameters
+        ----------
+        id : int
+            Identifier of the vector.
+
+        Raises
+        ------
+        KeyError
+            If there is no vector with such identifier."""
+
+        if id not in self.__vectors:
+            raise KeyError(f"There is no vector with identifier {id} in the index")
+
+        for buckets, key in zip(self.__buckets, self.__keys.pop(id)):
+            bucket = buckets[key]
+            bucket.discard(id)
+
+            if not bucket:
+                del buckets[key]
+
+        del self.__vectors[id]
+        self.__norms.pop(id, None)
+
+    def __len__(self) -> int:
+        return len(self.__vectors)
+
+    def __contains__(self, id: int) -> bool:
+        return id in self.__vectors
+
+    def candidates(self, vector: Union[Vector, Iterable]) -> set[int]:
+        """Returns identifiers of vectors sharing at least one bucket with given vector"""
+
+        result = set()
+
+        for buckets, key in zip(self.__buckets, self._hash(self._convert(vector))):
+            result.update(buckets.get(key, ()))
+
+        return result
+
+    def _distance(self, query: Vector, query_norm: float, id: int) -> float:
+        vector = self.__vectors[id]
+
+        if self.__metric == "euclidean":
+            return query.distance_to(vector)
+
+        norm = self.__norms[id]
+
+        if not norm or not query_norm:
+            return 1.0
+
+        return 1.0 - query.dot_product(vector) / (query_norm * norm)
+
+    def query(
+        self,
+        vector: Union[Vector, Iterable, Matrix],
+        k: int = 1,
+    ) -> Union[tuple[Vector, Vector], list[tuple[Vector, Vector]]]:
+        """Finds approximately k nearest vectors.
+
+        Candidates from the buckets of the query are re-ranked by exact distance, so fewer than k
+        vectors are returned if there are not enough candidates.
+
+        Parameters
+        ----------
+        vector : Vector or Iterable or Matrix
+            Query vector, or Matrix with query vectors in rows.
+        k : int, optional
+            Number of neighbours, default 1.
+
+        Returns
+        -------
+        tuple[Vector, Vector] or list
+            Distances (float) and identifiers (int) of neighbours ordered from the nearest.
+            For Matrix of queries, list of such pairs.
+
+        Raises
+        ------
+        ValueError
+            If k is not positive.
+        ArithmeticError
+            If vector has different dimension than the index."""
+
+        if not isinstance(k, int) or k < 1:
+            raise ValueError("Number of neighbours must be a positive integer")
+
+        if isinstance(vector, Matrix):
+            return [self.query(row, k) for row in vector.to_list()]
+
+        query = self._convert(vector)
+        query_norm = query.magnitude if self.__metric == "cosine" else 0.0
+
+        best = heapq.nsmallest(
+            k,
+            (
+                (self._distance(query, query_norm, id), id)
+                for id in self.candidates(query)
+            ),
+        )
+
+        return (
+            Vector._from_data([distance for distance, _ in best], float),
+            Vector._from_data([id for _, id in best], int),
+        )
@@ -0,0 +1,379 @@
+from datalab.Matrix import Matrix
+from datalab.Vector import Vector
+
+from datalab.utils import *
+
+PrefixMode = Literal["auto", "static", "fenwick"]
+
+
+def _check_mode(mode: str) -> None:
+    if mode not in ("auto", "static", "fenwick"):
+        raise ValueError(f'Unknown mode "{mode}", use "auto", "static" or "fenwick"')
+
+
+def _fenwick(values: list) -> list:
+    # Fenwick (binary indexed) tree of values built in O(n), tree[i] holds sum of values[i - (i & -i):i].
+    tree = [0, *values]
+    size = len(values)
+
+    for i in range(1, size + 1):
+        parent = i + (i & -i)
+
+        if parent <= size:
+            tree[parent] += tree[i]
+
+    return tree
+
+
+def _fenwick_add(tree: list, index: int, delta: Union[int, float]) -> None:
+    index += 1
+
+    while index < len(tree):
+        tree[index] += delta
+        index += index & -index
+
+
+def _fenwick_prefix(tree: list, end: int) -> Union[int, float]:
+    total = 0
+
+    while end > 0:
+        total += tree[end]
+        end -= end & -end
+
+    return total
+
+
+def _bounds(start: Optional[int], end: Optional[int], size: int) -> tuple[int, int]:
+    # Slice semantics: negative positions count from the end, bounds are clipped.
+    start, end, _ = slice(start, end).indices(size)
+
+    return start, max(start, end)
+
+
+class PrefixSumIndex:
+    """Prefix-sum index of a numeric Vector answering sums and means of index ranges.
+
+    In "static" mode prefix sums are stored and every query costs O(1), a change of an element
+    updates all following prefix sums (O(n)). In "fenwick" mode a Fenwick tree gives O(log n)
+    queries and updates. "auto" mode starts static and switches to Fenwick tree on the first change
+    of a single element. Bulk changes of the Vector (sorting, dtype) rebuild the index, for a non-numeric
+    dtype queries raise TypeError. Usually created by `Vector.prefix_index`.
+
+    Note that float range sums are computed as differences of prefix sums, so their absolute error
+    is relative to the magnitude of the prefix sums rather than of the range itself.
+
+    Parameters
+    ----------
+    vector : Vector
+        Indexed int, float or bool Vector.
+    mode : {"auto", "static", "fenwick"}, optional
+        Update strategy, default "auto".
+
+    Example
+    -------
+    >>> values = vector([3, 1, 4, 1, 5])
+    >>> index = values.prefix_index()
+    >>> index.sum(1, 4)
+    6
+    >>> values[2] = 0
+    >>> index.sum(1, 4), index.mode
+    (2, 'fenwick')"""
+
+    def __init__(self, vector: Vector, mode: PrefixMode = "auto") -> None:
+        _check_mode(mode)
+
+        if vector.dtype not in (int, float, bool):
+            raise TypeError("Prefix sums are only defined for int, float and bool vectors")
+
+        self.__vector = vector
+        self.__requested_mode = mode
+        self._on_reset()
+
+        vector._attach(self)
+
+    def _on_reset(self) -> None:
+        values = self.__vector.to_list()
+
+        # after conversion to a non-numeric dtype the index is kept empty until the dtype is numeric again
+        if self.__vector.dtype not in (int, float, bool):
+            self.__prefix, self.__tree = None, None
+            return
+
+        if self.__requested_mode == "fenwick":
+            self.__prefix, self.__tree = None, _fenwick(values)
+        else:
+            self.__prefix, self.__tree = list(itertools.accumulate(values, initial=0)), None
+
+    def _on_set(self, index: int, old: Any, new: Any) -> None:
+        if self.__prefix is None and self.__tree is None:
+            return
+
+        delta = new - old
+
+        if not delta:
+            return
+
+        if self.__tree is None and self.__requested_mode == "static":
+            prefix = self.__prefix
+            prefix[index + 1:] = [value + delta for value in itertools.islice(prefix, index + 1, None)]
+
+            return
+
+        if self.__tree is None:
+            self.__prefix, self.__tree = None, _fenwick(self.__vector.to_list())
+        else:
+            _fenwick_add(self.__tree, index, delta)
+
+    def detach(self) -> None:
+        """Stops updating the index, it is no longer valid after next change of the vector"""
+
+        self.__vector._detach(self)
+
+    @property
+    def requested_mode(self) -> str:
+        """Update strategy the index was created with"""
+
+        return self.__requested_mode
+
+    @property
+    def mode(self) -> str:
+        """Current representation, "static" (prefix sums) or "fenwick" (Fenwick tree)"""
+
+        return "static" if self.__tree is None else "fenwick"
+
+    def __len__(self) -> int:
+        return len(self.__vector)
+
+    def _check_numeric(self) -> None:
+        if self.__prefix is None and self.__tree is None:
+            raise TypeError("Prefix sums are only defined for int, float and bool vectors")
+
+    def _prefix(self, end: int) -> Union[int, float]:
+        if self.__tree is None:
+            return self.__prefix[end]
+
+        return _fenwick_prefix(self.__tree, end)
+
+    def sum(self, start: Optional[int] = None, end: Optional[int] = None) -> Union[int, float]:
+        """Sum of elements with positions in range [start, end).
+
+        Parameters
+        ----------
+        start : int, optional
+            First position, default 0. Negative positions count from the end.
+        end : int, optional
+            Position after the last element, default size of the Vector.
+
+        Returns
+        -------
+        int or float
+            Sum of the range, 0 for an empty range."""
+
+        self._check_numeric()
+        start, end = _bounds(start, end, len(self))
+
+        return self._prefix(end) - self._prefix(start)
+
+    def mean(self, start: Optional[int] = None, end: Optional[int] = None) -> float:
+        """Arithmetic average of elements with positions in range [start, end).
+
+        Raises
+        ------
+        ValueError
+            If the range is empty."""
+
+        self._check_numeric()
+        start, end = _bounds(start, end, len(self))
+
+        if start == end:
+            raise ValueError("Average of an empty range is not defined")
+
+        return (self._prefix(end) - self._prefix(start)) / (end - start)
+
+
+class SummedAreaTable:
+    """Summed-area table of a numeric Matrix answering sums and means of rectangular regions.
+
+    In "static" mode table of sums of all upper-left submatrices is stored and every query costs O(1),
+    a change of an element updates all following cells (O(rows * columns)). In "fenwick" mode a 2D Fenwick
+    tree gives O(log(rows) * log(columns)) queries and updates. "auto" mode starts static and switches
+    to Fenwick tree on the first change of a single element. Bulk changes of the Matrix (reshape, sorting
+    rows, dtype) rebuild the table, for a non-numeric dtype queries raise TypeError.
+    Usually created by `Matrix.summed_area_table`.
+
+    Parameters
+    ----------
+    matrix : Matrix
+        Indexed int, float or bool Matrix.
+    mode : {"auto", "static", "fenwick"}, optional
+        Update strategy, default "auto".
+
+    Example
+    -------
+    >>> table = matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]]).summed_area_table()
+    >>> table.sum(1, 3, 0, 2)
+    24"""
+
+    def __init__(self, matrix: Matrix, mode: PrefixMode = "auto") -> None:
+        _check_mode(mode)
+
+        if matrix.dtype not in (int, float, bool):
+            raise TypeError("Summed-area table is only defined for int, float and bool matrices")
+
+        self.__matrix = matrix
+        self.__requested_mode = mode
+        self._on_reset()
+
+        matrix._attach(self)
+
+    def _on_reset(self) -> None:
+        rows = self.__matrix.to_list()
+
+        # after conversion to a non-numeric dtype the table is kept empty until the dtype is numeric again
+        if self.__matrix.dtype not in (int, float, bool):
+            self.__table, self.__tree = None, None
+            return
+
+        if self.__requested_mode == "fenwick":
+            self.__table, self.__tree = None, self._build_tree(rows)
+            return
+
+        table = [[0] * (self.__matrix.columns + 1)]
+
+        for row in rows:
+            table.append([a + b for a, b in zip(table[-1], itertools.accumulate(row, initial=0))])
+
+        self.__table, self.__tree = table, None
+
+    def _build_tree(self, rows: list) -> list:
+        # 2D Fenwick tree is separable, so 1D linear-time build is applied along rows and then along columns.
+        tree = [[0] * (self.__matrix.columns + 1)] + [_fenwick(row) for row in rows]
+        size = len(rows)
+
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+
+            if parent <= size:
+                tree[parent] = [a + b for a, b in zip(tree[parent], tree[i])]
+
+        return tree
+
+    def _on_set(self, position: tuple[int, int], old: Any, new: Any) -> None:
+        if self.__table is None and self.__tree is None:
+            return
+
+        delta = new - old
+
+        if not delta:
+            return
+
+        row, column = position
+
+        if self.__tree is None and self.__requested_mode == "static":
+            for line in itertools.islice(self.__table, row + 1, None):
+                line[column + 1:] = [value + delta for value in itertools.islice(line, column + 1, None)]
+
+            return
+
+        if self.__tree is None:
+            self.__table, self.__tree = None, self._build_tree(self.__matrix.to_list())
+            return
+
+        tree = self.__tree
+        i = row + 1
+
+        while i < len(tree):
+            _fenwick_add(tree[i], column, delta)
+            i += i & -i
+
+    def detach(self) -> None:
+        """Stops updating the table, it is no longer valid after next change of the matrix"""
+
+        self.__matrix._detach(self)
+
+    @property
+    def requested_mode(self) -> str:
+        """Update strategy the table was created with"""
+
+        return self.__requested_mode
+
+    @property
+    def mode(self) -> str:
+        """Current representation, "static" (summed-area table) or "fenwick" (2D Fenwick tree)"""
+
+        return "static" if self.__tree is None else "fenwick"
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Shape of the indexed matrix"""
+
+        return self.__matrix.shape
+
+    def _check_numeric(self) -> None:
+        if self.__table is None and self.__tree is None:
+            raise TypeError("Summed-area table is only defined for int, float and bool matrices")
+
+    def _prefix(self, row: int, column: int) -> Union[int, float]:
+        if self.__tree is None:
+            return self.__table[row][column]
+
+        total = 0
+
+        while row > 0:
+            total += _fenwick_prefix(self.__tree[row], column)
+            row -= row & -row
+
+        return total
+
+    def _region(self, bounds: tuple) -> tuple[int, int, int, int]:
+        rows, columns = self.__matrix.shape
+        row_start, row_end, column_start, column_end = bounds
+
+        return (*_bounds(row_start, row_end, rows), *_bounds(column_start, column_end, columns))
+
+    def sum(
+        self,
+        row_start: Optional[int] = None,
+        row_end: Optional[int] = None,
+        column_start: Optional[int] = None,
+        column_end: Optional[int] = None,
+    ) -> Union[int, float]:
+        """Sum of elements in rows [row_start, row_end) and columns [column_start, column_end).
+
+        Omitted bounds cover the whole dimension, negative positions count from the end.
+
+        Returns
+        -------
+        int or float
+            Sum of the region, 0 for an empty region."""
+
+        self._check_numeric()
+        top, bottom, left, right = self._region((row_start, row_end, column_start, column_end))
+
+        return (
+            self._prefix(bottom, right) - self._prefix(top, right)
+            - self._prefix(bottom, left) + self._prefix(top, left)
+        )
+
+    def mean(
+        self,
+        row_start: Optional[int] = None,
+        row_end: Optional[int] = None,
+        column_start: Optional[int] = None,
+        column_end: Optional[int] = None,
+    ) -> float:
+        """Arithmetic average of elements in rows [row_start, row_end) and columns [column_start, column_end).
+
+        Raises
+        ------
+        ValueError
+            If the region is empty."""
+
+        self._check_numeric()
+        top, bottom, left, right = self._region((row_start, row_end, column_start, column_end))
+        size = (bottom - top) * (right - left)
+
+        if not size:
+            raise ValueError("Average of an empty region is not defined")
+
+        return self.sum(top, bottom, left, right) / size
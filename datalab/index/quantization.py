@@ -0,0 +1,374 @@
+from abc import ABC, abstractmethod
+from array import array
+
+from datalab.Matrix import Matrix
+from datalab.Vector import Vector
+
+from datalab.utils import *
+
+
+class _QuantizedVectors(ABC):
+    """Base of the compressed vector containers
+
+    Subclasses store codes of the vectors and implement `_scores` which computes, directly on the codes,
+    squared euclidean distances or dot products between a query and all stored vectors."""
+
+    def __init__(self, dimension: int) -> None:
+        if not isinstance(dimension, int) or dimension < 1:
+            raise ValueError("Dimension must be a positive integer")
+
+        self._dimension = dimension
+        self._count = 0
+
+    @property
+    def dimension(self) -> int:
+        """Dimension of stored vectors"""
+
+        return self._dimension
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _rows(self, vectors: Union[Matrix, Iterable]) -> list[list[float]]:
+        if isinstance(vectors, (Vector, list, tuple)) and vectors and not isinstance(
+            vectors[0], (Vector, list, tuple)
+        ):
+            vectors = [vectors]
+
+        rows = [list(map(float, row)) for row in as_rows(vectors, "Vector quantization")]
+
+        if any(len(row) != self._dimension for row in rows):
+            raise ArithmeticError("Vector has different dimension than the container")
+
+        return rows
+
+    def _query(self, query: Union[Vector, Iterable]) -> list[float]:
+        return self._rows([query])[0]
+
+    @abstractmethod
+    def _scores(self, query: list[float], metric: str) -> list[float]:
+        """Squared euclidean distances or dot products between query and all stored vectors"""
+
+    def __getitem__(self, index: int) -> Vector:
+        return self.get(index)
+
+    def get(self, index: int) -> Vector:
+        """Returns decoded (approximate) vector stored at given position"""
+
+        if not isinstance(index, int):
+            raise TypeError("Index value must be an int")
+
+        if not 0 <= index < self._count:
+            raise IndexError(
+                f"Container has {self._count} vectors, you cannot appeal to {index} vector"
+            )
+
+        return Vector._from_data(self._decode(index), float)
+
+    @abstractmethod
+    def _decode(self, index: int) -> list[float]:
+        """Approximate vector stored at given position"""
+
+    def distances(self, query: Union[Vector, Iterable]) -> Vector:
+        """Approximate euclidean distances between query and every stored vector"""
+
+        return Vector._from_data(
+            [math.sqrt(max(score, 0.0)) for score in self._scores(self._query(query), "euclidean")],
+            float,
+        )
+
+    def dot_products(self, query: Union[Vector, Iterable]) -> Vector:
+        """Approximate dot products between query and every stored vector"""
+
+        return Vector._from_data(self._scores(self._query(query), "dot"), float)
+
+    def search(
+        self,
+        query: Union[Vector, Iterable],
+        k: int = 1,
+        metric: Literal["euclidean", "dot"] = "euclidean",
+    ) -> tuple[Vector, Vector]:
+        """Finds k stored vectors nearest to the query (or with the largest dot product).
+
+        Parameters
+        ----------
+        query : Vector or Iterable
+            Query vector, it is not quantized (asymmetric distance).
+        k : int, optional
+            Number of results, default 1.
+        metric : {"euclidean", "dot"}, optional
+            Euclidean distance (ascending) or dot product (descending), default "euclidean".
+
+        Returns
+        -------
+        tuple[Vector, Vector]
+            Approximate distances or dot products (float), and positions (int) of found vectors."""
+
+        if metric not in ("euclidean", "dot"):
+            raise ValueError(f'Unknown metric "{metric}", use "euclidean" or "dot"')
+
+        scores = self._scores(self._query(query), metric)
+
+        if metric == "euclidean":
+            best = heapq.nsmallest(k, zip(scores, range(self._count)))
+            values = [math.sqrt(max(score, 0.0)) for score, _ in best]
+        else:
+            best = heapq.nlargest(k, zip(scores, range(self._count)))
+            values = [score for score, _ in best]
+
+        return (
+            Vector._from_data(values, float),
+            Vector._from_data([index for _, index in best], int),
+        )
+
+
+class ScalarQuantizedVectors(_QuantizedVectors):
+    """Vectors compressed to one signed byte (int8) per element
+
+    Every vector keeps its own offset and scale, element x is stored as code c in range [-127, 127]
+    so that x ≈ offset + scale * c. Dot product with a float query q is computed on the codes as
+    offset * sum(q) + scale * (q · c), squared distance uses additionally stored squared norms.
+    Every element takes 1 byte instead of 8 bytes of a float (plus 24 bytes of parameters per vector).
+
+    Parameters
+    ----------
+    dimension : int
+        Dimension of stored vectors.
+
+    Example
+    -------
+    >>> storage = ScalarQuantizedVectors(3)
+    >>> storage.add([[0.0, 0.5, 1.0], [1.0, 1.0, 1.0]])
+    >>> storage.search([0.0, 0.5, 1.0], k=1)[1].to_list()
+    [0]"""
+
+    def __init__(self, dimension: int) -> None:
+        super().__init__(dimension)
+
+        self._codes = array("b")
+        self._offsets = array("d")
+        self._scales = array("d")
+        self._norms = array("d")
+
+    def add(self, vectors: Union[Matrix, Iterable]) -> None:
+        """Quantizes and appends vector (Vector, list) or all vectors (rows of a Matrix, iterable of Vectors)"""
+
+        for row in self._rows(vectors):
+            low, high = min(row), max(row)
+            offset = (high + low) / 2
+            scale = (high - low) / 254 or 1.0
+
+            codes = [round((item - offset) / scale) for item in row]
+
+            self._codes.extend(codes)
+            self._offsets.append(offset)
+            self._scales.append(scale)
+            self._norms.append(math.fsum((offset + scale * code) ** 2 for code in codes))
+
+            self._count += 1
+
+    def _decode(self, index: int) -> list[float]:
+        start = index * self._dimension
+        offset, scale = self._offsets[index], self._scales[index]
+
+        return [offset + scale * code for code in self._codes[start : start + self._dimension]]
+
+    def _scores(self, query: list[float], metric: str) -> list[float]:
+        mul = operator.mul
+        codes, dimension = self._codes, self._dimension
+        total = sum(query)
+
+        dots = [
+            offset * total + scale * sum(map(mul, query, codes[start : start + dimension]))
+            for offset, scale, start in zip(
+                self._offsets, self._scales, range(0, len(codes), dimension)
+            )
+        ]
+
+        if metric == "dot":
+            return dots
+
+        query_norm = sum(map(mul, query, query))
+
+        return [query_norm - 2 * dot + norm for dot, norm in zip(dots, self._norms)]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by codes and per-vector parameters"""
+
+        return sum(
+            item.itemsize * len(item)
+            for item in (self._codes, self._offsets, self._scales, self._norms)
+        )
+
+
+class ProductQuantizedVectors(_QuantizedVectors):
+    """Vectors compressed by product quantization
+
+    Vector is split into `subspaces` equal parts and every part is replaced by the index (one byte) of the
+    nearest centroid from the codebook trained for that subspace with k-means. Distances and dot products
+    with a float query are sums of values from per-query lookup tables (asymmetric distance computation),
+    so they need `subspaces` table lookups per stored vector.
+
+    Parameters
+    ----------
+    dimension : int
+        Dimension of stored vectors, must be divisible by number of subspaces.
+    subspaces : int, optional
+        Number of parts (bytes per vector), default 8.
+    centroids : int, optional
+        Size of every codebook, at most 256, default 256.
+    seed : int, optional
+        Seed for codebook training.
+
+    Example
+    -------
+    >>> storage = ProductQuantizedVectors(4, subspaces=2, centroids=2, seed=0)
+    >>> storage.train([[0, 0, 0, 0], [1, 1, 1, 1], [0, 0, 1, 1]])
+    >>> storage.add([[1, 1, 1, 1], [0, 0, 0, 0]])
+    >>> storage.search([0.9, 0.9, 0.9, 0.9])[1].to_list()
+    [0]"""
+
+    def __init__(
+        self,
+        dimension: int,
+        subspaces: int = 8,
+        centroids: int = 256,
+        seed: Optional[int] = None,
+    ) -> None:
+        super().__init__(dimension)
+
+        if not isinstance(subspaces, int) or subspaces < 1 or dimension % subspaces:
+            raise ValueError("Dimension must be divisible by a positive number of subspaces")
+
+        if not isinstance(centroids, int) or not 0 < centroids <= 256:
+            raise ValueError("Number of centroids must be in range from 1 to 256")
+
+        self._subspaces = subspaces
+        self._width = dimension // subspaces
+        self._centroids = centroids
+        self._generator = random.Random(seed)
+        self._codebooks = []
+        self._codes = bytearray()
+
+    @property
+    def is_trained(self) -> bool:
+        """True if codebooks are trained"""
+
+        return bool(self._codebooks)
+
+    def train(self, vectors: Union[Matrix, Iterable], iterations: int = 20) -> None:
+        """Trains codebooks with k-means in every subspace.
+
+        Codes of stored vectors depend on the codebooks, so training is only possible while the container
+        is empty; retraining an already trained empty container replaces its codebooks.
+
+        Parameters
+        ----------
+        vectors : Matrix or Iterable
+            Training vectors (rows of a Matrix or iterable of Vectors).
+        iterations : int, optional
+            Number of Lloyd iterations, default 20.
+
+        Raises
+        ------
+        ArithmeticError
+            If vectors were already added to the container.
+        ValueError
+            If there are less training vectors than centroids."""
+
+        if self._count:
+            raise ArithmeticError("Codebooks cannot be trained after vectors were added")
+
+        rows = self._rows(vectors)
+
+        if len(rows) < self._centroids:
+            raise ValueError("Number of training vectors must not be lower than number of centroids")
+
+        width = self._width
+        self._codebooks = []
+
+        for part in range(self._subspaces):
+            points = [row[part * width : (part + 1) * width] for row in rows]
+            codebook = [list(point) for point in self._generator.sample(points, self._centroids)]
+
+            for _ in range(iterations):
+                sums = [[0.0] * width for _ in codebook]
+                counts = [0] * len(codebook)
+
+                for point in points:
+                    nearest = min(range(len(codebook)), key=lambda c: math.dist(point, codebook[c]))
+                    counts[nearest] += 1
+                    sums[nearest] = list(map(operator.add, sums[nearest], point))
+
+                moved = False
+
+                for c, (total, count) in enumerate(zip(sums, counts)):
+                    if count:
+                        centroid = [item / count for item in total]
+                        moved = moved or centroid != codebook[c]
+                        codebook[c] = centroid
+
+                if not moved:
+                    break
+
+            self._codebooks.append(codebook)
+
+    def add(self, vectors: Union[Matrix, Iterable]) -> None:
+        """Encodes and appends vector (Vector, list) or all vectors (rows of a Matrix, iterable of Vectors)
+
+        Raises
+        ------
+        ArithmeticError
+            If codebooks are not trained."""
+
+        if not self.is_trained:
+            raise ArithmeticError("Codebooks must be trained before adding vectors")
+
+        width = self._width
+
+        for row in self._rows(vectors):
+            for part, codebook in enumerate(self._codebooks):
+                point = row[part * width : (part + 1) * width]
+                self._codes.append(
+                    min(range(len(codebook)), key=lambda c: math.dist(point, codebook[c]))
+                )
+
+            self._count += 1
+
+    def _decode(self, index: int) -> list[float]:
+        start = index * self._subspaces
+        codes = self._codes[start : start + self._subspaces]
+
+        return [
+            item
+            for codebook, code in zip(self._codebooks, codes)
+            for item in codebook[code]
+        ]
+
+    def _scores(self, query: list[float], metric: str) -> list[float]:
+        width, subspaces = self._width, self._subspaces
+        mul = operator.mul
+
+        tables = []
+
+        for part, codebook in enumerate(self._codebooks):
+            point = query[part * width : (part + 1) * width]
+
+            if metric == "dot":
+                tables.append([sum(map(mul, point, centroid)) for centroid in codebook])
+            else:
+                tables.append([math.dist(point, centroid) ** 2 for centroid in codebook])
+
+        codes = self._codes
+
+        return [
+            sum(map(list.__getitem__, tables, codes[start : start + subspaces]))
+            for start in range(0, len(codes), subspaces)
+        ]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by codes and codebooks"""
+
+        return len(self._codes) + 8 * self._dimension * self._centroids
@@ -0,0 +1,172 @@
+from datalab.Vector import Vector
+
+from datalab.utils import *
+
+RangeMode = Literal["auto", "sparse", "segment"]
+
+
+def _bounds(start: Optional[int], end: Optional[int], size: int) -> tuple[int, int]:
+    start, end, _ = slice(start, end).indices(size)
+
+    if start >= end:
+        raise ValueError("Minimum and maximum of an empty range are not defined")
+
+    return start, end
+
+
+class _SparseTable:
+    # levels[k][i] is the extreme of values[i:i + 2**k], a query covers the range by two overlapping blocks.
+
+    def __init__(self, values: list, select: Callable) -> None:
+        self.select = select
+        self.levels = [list(values)]
+        width = 1
+
+        while 2 * width <= len(values):
+            previous = self.levels[-1]
+            self.levels.append(list(map(select, previous, itertools.islice(previous, width, None))))
+            width *= 2
+
+    def query(self, start: int, end: int) -> Any:
+        level = (end - start).bit_length() - 1
+        row = self.levels[level]
+
+        return self.select(row[start], row[end - (1 << level)])
+
+
+class _SegmentTree:
+    # Iterative (bottom-up) segment tree in a flat array, leaves are nodes[size:2 * size].
+
+    def __init__(self, values: list, select: Callable) -> None:
+        self.select = select
+        self.size = len(values)
+        self.nodes = [None] * self.size + list(values)
+
+        for i in range(self.size - 1, 0, -1):
+            self.nodes[i] = select(self.nodes[2 * i], self.nodes[2 * i + 1])
+
+    def update(self, index: int, value: Any) -> None:
+        nodes, select = self.nodes, self.select
+        i = index + self.size
+        nodes[i] = value
+
+        while i > 1:
+            i //= 2
+            nodes[i] = select(nodes[2 * i], nodes[2 * i + 1])
+
+    def query(self, start: int, end: int) -> Any:
+        nodes, select = self.nodes, self.select
+        left, right = start + self.size, end + self.size
+        result = None
+
+        while left < right:
+            if left & 1:
+                result = nodes[left] if result is None else select(result, nodes[left])
+                left += 1
+
+            if right & 1:
+                right -= 1
+                result = nodes[right] if result is None else select(result, nodes[right])
+
+            left //= 2
+            right //= 2
+
+        return result
+
+
+class RangeQueryIndex:
+    """Index of a Vector answering minimum and maximum of index ranges.
+
+    Two array-backed structures are available: a sparse table (O(n log n) memory and build, O(1) query,
+    rebuilt on every change) and a segment tree (O(n) memory, O(log n) query and point update hooked into
+    `Vector.set`). "auto" mode starts with sparse tables and switches to segment trees on the first change
+    of a single element. Bulk changes of the Vector rebuild the index.
+
+    Parameters
+    ----------
+    vector : Vector
+        Indexed Vector with comparable elements.
+    mode : {"auto", "sparse", "segment"}, optional
+        Structure used, default "auto".
+
+    Example
+    -------
+    >>> values = vector([5, 2, 8, 1, 9])
+    >>> index = values.range_index()
+    >>> index.min(0, 3), index.max(1, 4)
+    (2, 8)
+    >>> values[2] = 0
+    >>> index.min(0, 3), index.mode
+    (0, 'segment')"""
+
+    def __init__(self, vector: Vector, mode: RangeMode = "auto") -> None:
+        if mode not in ("auto", "sparse", "segment"):
+            raise ValueError(f'Unknown mode "{mode}", use "auto", "sparse" or "segment"')
+
+        self.__vector = vector
+        self.__requested_mode = mode
+        self._on_reset()
+
+        vector._attach(self)
+
+    def _build(self, structure: type) -> None:
+        values = self.__vector.to_list()
+
+        self.__structure = structure
+        self.__minimum = structure(values, min)
+        self.__maximum = structure(values, max)
+
+    def _on_reset(self) -> None:
+        self._build(_SegmentTree if self.__requested_mode == "segment" else _SparseTable)
+
+    def _on_set(self, index: int, old: Any, new: Any) -> None:
+        if self.__structure is _SegmentTree:
+            self.__minimum.update(index, new)
+            self.__maximum.update(index, new)
+
+        else:
+            self._build(_SparseTable if self.__requested_mode == "sparse" else _SegmentTree)
+
+    def detach(self) -> None:
+        """Stops updating the index, it is no longer valid after next change of the vector"""
+
+        self.__vector._detach(self)
+
+    @property
+    def requested_mode(self) -> str:
+        """Structure the index was created with"""
+
+        return self.__requested_mode
+
+    @property
+    def mode(self) -> str:
+        """Current structure, "sparse" (sparse table) or "segment" (segment tree)"""
+
+        return "segment" if self.__structure is _SegmentTree else "sparse"
+
+    def __len__(self) -> int:
+        return len(self.__vector)
+
+    def min(self, start: Optional[int] = None, end: Optional[int] = None) -> Union[int, float, str, bool]:
+        """Minimal element with position in range [start, end).
+
+        Omitted bounds cover the whole Vector, negative positions count from the end.
+
+        Raises
+        ------
+        ValueError
+            If the range is empty."""
+
+        return self.__minimum.query(*_bounds(start, end, len(self)))
+
+    def max(self, start: Optional[int] = None, end: Optional[int] = None) -> Union[int, float, str, bool]:
+        """Maximal element with position in range [start, end).
+
+        Omitted bounds cover the whole Vector, negative positions count from the end.
+
+        Raises
+        ------
+        ValueError
+            If the range is empty."""
+
+        return self.__maximum.query(*_bounds(start, end, len(self)))
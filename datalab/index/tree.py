@@ -0,0 +1,451 @@
+import json
+from abc import ABC, abstractmethod
+
+from datalab.Matrix import Matrix
+from datalab.Vector import Vector
+
+from datalab.utils import *
+
+
+def _euclidean(a: Iterable, b: Iterable) -> float:
+    return math.dist(a, b)
+
+
+def _manhattan(a: Iterable, b: Iterable) -> float:
+    return sum(map(abs, map(operator.sub, a, b)))
+
+
+def _chebyshev(a: Iterable, b: Iterable) -> float:
+    return max(map(abs, map(operator.sub, a, b)), default=0.0)
+
+
+_METRICS = {
+    "euclidean": _euclidean,
+    "manhattan": _manhattan,
+    "chebyshev": _chebyshev,
+}
+
+
+class _SpaceTree(ABC):
+    """Base of the space partitioning trees
+
+    Nodes are kept in flat parallel lists (node id is a position in every list). Every node covers
+    a contiguous range of the permuted `_indices` list, children of node are stored at `_left` and `_right`
+    positions (-1 for leaves). Subclasses keep their own node description in lists named in `_node_fields`."""
+
+    _node_fields: tuple[str, ...] = ()
+
+    def __init__(
+        self,
+        points: Union[Matrix, Iterable],
+        leaf_size: int = 40,
+        metric: Literal["euclidean", "manhattan", "chebyshev"] = "euclidean",
+    ) -> None:
+        if metric not in _METRICS:
+            raise ValueError(
+                f'Unknown metric "{metric}", use "euclidean", "manhattan" or "chebyshev"'
+            )
+
+        if not isinstance(leaf_size, int) or leaf_size < 1:
+            raise ValueError("Leaf size must be a positive integer")
+
+        self._points = self._convert_points(points)
+
+        if not self._points:
+            raise ValueError("Cannot build an index without points")
+
+        self._leaf_size = leaf_size
+        self._metric = metric
+        self._indices = list(range(len(self._points)))
+
+        self._start, self._end = [], []
+        self._left, self._right = [], []
+        self._initialize_nodes()
+
+        self._build(0, len(self._points))
+
+    @staticmethod
+    def _convert_points(points: Union[Matrix, Iterable]) -> list[list[float]]:
+        data = [list(map(float, row)) for row in as_rows(points, "Space partitioning index")]
+
+        if any(len(row) != len(data[0]) for row in data):
+            raise ValueError("All points must have the same dimension")
+
+        return data
+
+    def _initialize_nodes(self) -> None:
+        pass
+
+    def _add_node(self, start: int, end: int) -> int:
+        self._start.append(start)
+        self._end.append(end)
+        self._left.append(-1)
+        self._right.append(-1)
+
+        return len(self._start) - 1
+
+    def _build(self, start: int, end: int) -> int:
+        node = self._add_node(start, end)
+        indices = self._indices[start:end]
+        points = self._points
+
+        self._describe_node(node, indices)
+
+        if end - start <= self._leaf_size:
+            return node
+
+        dimension = max(
+            range(len(points[0])),
+            key=lambda d: max(points[i][d] for i in indices) - min(points[i][d] for i in indices),
+        )
+        indices.sort(key=lambda i: points[i][dimension])
+        self._indices[start:end] = indices
+
+        middle = (start + end) // 2
+
+        self._left[node] = self._build(start, middle)
+        self._right[node] = self._build(middle, end)
+
+        return node
+
+    @abstractmethod
+    def _describe_node(self, node: int, indices: list[int]) -> None:
+        """Stores bounding region of the node containing given points"""
+
+    @abstractmethod
+    def _min_distance(self, node: int, point: list[float]) -> float:
+        """Lower bound of distance between point and any point in the node"""
+
+    @property
+    def size(self) -> int:
+        """Number of indexed points"""
+
+        return len(self._points)
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    @property
+    def metric(self) -> str:
+        """Name of the distance metric"""
+
+        return self._metric
+
+    def _convert_query(self, point: Union[Vector, Iterable]) -> list[float]:
+        query = list(map(float, point.to_list() if isinstance(point, Vector) else point))
+
+        if len(query) != len(self._points[0]):
+            raise ArithmeticError("Query point has different dimension than indexed points")
+
+        return query
+
+    @staticmethod
+    def _is_batch(points: Any) -> bool:
+        if isinstance(points, Matrix):
+            return True
+
+        return (
+            isinstance(points, (list, tuple))
+            and bool(points)
+            and isinstance(points[0], (list, tuple, Vector))
+        )
+
+    def _query_one(self, point: list[float], k: int) -> list[tuple[float, int]]:
+        distance = _METRICS[self._metric]
+        points, indices = self._points, self._indices
+        start, end, left, right = self._start, self._end, self._left, self._right
+
+        heap = []  # max-heap of (-distance, index) with k best candidates
+
+        def search(node: int) -> None:
+            if left[node] < 0:
+                for i in indices[start[node] : end[node]]:
+                    d = distance(point, points[i])
+
+                    if len(heap) < k:
+                        heapq.heappush(heap, (-d, i))
+                    elif d < -heap[0][0]:
+                        heapq.heapreplace(heap, (-d, i))
+                return
+
+            children = sorted(
+                ((self._min_distance(child, point), child) for child in (left[node], right[node]))
+            )
+
+            for bound, child in children:
+                if len(heap) == k and bound >= -heap[0][0]:
+                    break
+                search(child)
+
+        search(0)
+
+        return sorted((-d, i) for d, i in heap)
+
+    def query(
+        self,
+        point: Union[Vector, Iterable, Matrix],
+        k: int = 1,
+    ) -> Union[tuple[Vector, Vector], tuple[Matrix, Matrix]]:
+        """Finds k nearest indexed points.
+
+        Parameters
+        ----------
+        point : Vector or Iterable or Matrix
+            Query point, or Matrix (list of points) for a batch query.
+        k : int, optional
+            Number of neighbours, default 1.
+
+        Returns
+        -------
+        tuple[Vector, Vector] or tuple[Matrix, Matrix]
+            Distances (float) and indices (int) of the neighbours, ordered from the nearest.
+            For batch query, matrices with one row per query point.
+
+        Raises
+        ------
+        ValueError
+            If k is not in range from 1 to number of indexed points.
+        ArithmeticError
+            If query point has different dimension than indexed points."""
+
+        if not isinstance(k, int) or not 0 < k <= self.size:
+            raise ValueError("Number of neighbours must be in range from 1 to number of points")
+
+        if self._is_batch(point):
+            rows = point.to_list() if isinstance(point, Matrix) else point
+            results = [self._query_one(self._convert_query(row), k) for row in rows]
+
+            return (
+                Matrix._from_data([[d for d, _ in row] for row in results], float, columns=k),
+                Matrix._from_data([[i for _, i in row] for row in results], int, columns=k),
+            )
+
+        result = self._query_one(self._convert_query(point), k)
+
+        return (
+            Vector._from_data([d for d, _ in result], float),
+            Vector._from_data([i for _, i in result], int),
+        )
+
+    def _query_radius_one(self, point: list[float], radius: float) -> list[tuple[float, int]]:
+        distance = _METRICS[self._metric]
+        points, indices = self._points, self._indices
+        start, end, left, right = self._start, self._end, self._left, self._right
+
+        result = []
+        stack = [0]
+
+        while stack:
+            node = stack.pop()
+
+            if self._min_distance(node, point) > radius:
+                continue
+
+            if left[node] >= 0:
+                stack.append(left[node])
+                stack.append(right[node])
+                continue
+
+            for i in indices[start[node] : end[node]]:
+                d = distance(point, points[i])
+
+                if d <= radius:
+                    result.append((d, i))
+
+        return sorted(result)
+
+    def query_radius(
+        self,
+        point: Union[Vector, Iterable, Matrix],
+        radius: Union[int, float],
+        return_distance: bool = False,
+    ) -> Union[Vector, tuple[Vector, Vector], list]:
+        """Finds all indexed points within given distance.
+
+        Parameters
+        ----------
+        point : Vector or Iterable or Matrix
+            Query point, or Matrix (list of points) for a batch query.
+        radius : int or float
+            Maximal distance (inclusive).
+        return_distance : bool, optional
+            If True, distances are returned together with indices. Default False.
+
+        Returns
+        -------
+        Vector or tuple[Vector, Vector] or list
+            Indices (int) of the points ordered from the nearest, preceded by distances (float) if requested.
+            For batch query, list of results for every query point.
+
+        Raises
+        ------
+        ArithmeticError
+            If query point has different dimension than indexed points."""
+
+        def convert(result: list[tuple[float, int]]) -> Union[Vector, tuple[Vector, Vector]]:
+            indices = Vector._from_data([i for _, i in result], int)
+
+            if return_distance:
+                return Vector._from_data([d for d, _ in result], float), indices
+
+            return indices
+
+        if self._is_batch(point):
+            rows = point.to_list() if isinstance(point, Matrix) else point
+
+            return [
+                convert(self._query_radius_one(self._convert_query(row), radius))
+                for row in rows
+            ]
+
+        return convert(self._query_radius_one(self._convert_query(point), radius))
+
+    def save(self, file: Union[str, TextIO]) -> None:
+        """Saves the built index as JSON.
+
+        Parameters
+        ----------
+        file : str or TextIO
+            Path or opened text file."""
+
+        content = {
+            "type": type(self).__name__,
+            "metric": self._metric,
+            "leaf_size": self._leaf_size,
+            "points": self._points,
+            "indices": self._indices,
+            "start": self._start,
+            "end": self._end,
+            "left": self._left,
+            "right": self._right,
+            **{name: getattr(self, f"_{name}") for name in self._node_fields},
+        }
+
+        if isinstance(file, str):
+            with open(file, "w") as stream:
+                json.dump(content, stream)
+        else:
+            json.dump(content, file)
+
+    @classmethod
+    def load(cls, file: Union[str, TextIO]) -> Self:
+        """Loads index saved by `save` without rebuilding it.
+
+        Parameters
+        ----------
+        file : str or TextIO
+            Path or opened text file.
+
+        Raises
+        ------
+        ValueError
+            If the file contains index of different type."""
+
+        if isinstance(file, str):
+            with open(file) as stream:
+                content = json.load(stream)
+        else:
+            content = json.load(file)
+
+        if content.get("type") != cls.__name__:
+            raise ValueError(f'File does not contain {cls.__name__} index')
+
+        tree = cls.__new__(cls)
+
+        tree._metric = content["metric"]
+        tree._leaf_size = content["leaf_size"]
+
+        for name in ("points", "indices", "start", "end", "left", "right", *cls._node_fields):
+            setattr(tree, f"_{name}", content[name])
+
+        return tree
+
+
+class KDTree(_SpaceTree):
+    """KD-tree nearest neighbour index over rows of a Matrix
+
+    Space is recursively split at the median of the dimension with largest spread. Every node stores the
+    bounding box of its points, which gives lower bound of the distance used to prune the search.
+    Efficient for low dimensional data.
+
+    Parameters
+    ----------
+    points : Matrix or Iterable
+        Indexed points, rows of a Matrix, or Vectors (lists).
+    leaf_size : int, optional
+        Maximal number of points in a leaf, default 40.
+    metric : {"euclidean", "manhattan", "chebyshev"}, optional
+        Distance metric, default "euclidean".
+
+    Example
+    -------
+    >>> tree = KDTree(matrix([[0, 0], [1, 1], [5, 5]]))
+    >>> distances, indices = tree.query([0.9, 0.9], k=2)
+    >>> indices.to_list()
+    [1, 0]"""
+
+    _node_fields = ("lower", "upper")
+
+    def _initialize_nodes(self) -> None:
+        self._lower, self._upper = [], []
+
+    def _describe_node(self, node: int, indices: list[int]) -> None:
+        points = self._points
+
+        self._lower.append([min(points[i][d] for i in indices) for d in range(len(points[0]))])
+        self._upper.append([max(points[i][d] for i in indices) for d in range(len(points[0]))])
+
+    def _min_distance(self, node: int, point: list[float]) -> float:
+        gaps = [
+            lower - item if item < lower else item - upper if item > upper else 0.0
+            for item, lower, upper in zip(point, self._lower[node], self._upper[node])
+        ]
+
+        if self._metric == "euclidean":
+            return math.hypot(*gaps)
+
+        if self._metric == "manhattan":
+            return sum(gaps)
+
+        return max(gaps, default=0.0)
+
+
+class BallTree(_SpaceTree):
+    """Ball tree nearest neighbour index over rows of a Matrix
+
+    Every node stores centroid of its points and radius of the ball containing them, distance to the ball
+    is the lower bound used to prune the search. Degrades slower than KD-tree with growing dimension.
+
+    Parameters
+    ----------
+    points : Matrix or Iterable
+        Indexed points, rows of a Matrix, or Vectors (lists).
+    leaf_size : int, optional
+        Maximal number of points in a leaf, default 40.
+    metric : {"euclidean", "manhattan", "chebyshev"}, optional
+        Distance metric, default "euclidean".
+
+    Example
+    -------
+    >>> tree = BallTree(matrix([[0, 0], [1, 1], [5, 5]]))
+    >>> tree.query_radius([0, 0], 2).to_list()
+    [0, 1]"""
+
+    _node_fields = ("centroid", "radius")
+
+    def _initialize_nodes(self) -> None:
+        self._centroid, self._radius = [], []
+
+    def _describe_node(self, node: int, indices: list[int]) -> None:
+        points = self._points
+        distance = _METRICS[self._metric]
+
+        centroid = [
+            sum(points[i][d] for i in indices) / len(indices) for d in range(len(points[0]))
+        ]
+
+        self._centroid.append(centroid)
+        self._radius.append(max(distance(centroid, points[i]) for i in indices))
+
+    def _min_distance(self, node: int, point: list[float]) -> float:
+        return max(_METRICS[self._metric](point, self._centroid[node]) - self._radius[node], 0.0)
@@ -0,0 +1,3 @@
+from datalab.metrics.distance import (
+    pairwise,
+)
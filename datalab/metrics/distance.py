@@ -0,0 +1,200 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from datalab.Matrix import Matrix
+
+from datalab.utils import *
+
+Metric = Literal["euclidean", "cosine", "manhattan", "chebyshev"]
+
+_worker_arguments: tuple = ()
+
+
+def _norms(rows: list) -> list[float]:
+    mul = operator.mul
+
+    return [sum(map(mul, row, row)) for row in rows]
+
+
+def _distance_block(
+    block: list,
+    block_norms: list,
+    Y: list,
+    y_norms: list,
+    metric: str,
+    top_k: Optional[int],
+    block_size: int,
+) -> list:
+    # Distances from every row of `block` to all rows of Y, computed tile by tile.
+    # With top_k only the k nearest (distance, index) pairs of each row are kept between tiles.
+    mul, sub = operator.mul, operator.sub
+    result = [[] for _ in block]
+
+    for start in range(0, len(Y), block_size):
+        tile = Y[start : start + block_size]
+        tile_norms = y_norms[start : start + block_size]
+
+        for x, x_norm, output in zip(block, block_norms, result):
+            if metric == "euclidean":
+                distances = [
+                    math.sqrt(max(x_norm + y_norm - 2 * sum(map(mul, x, y)), 0.0))
+                    for y, y_norm in zip(tile, tile_norms)
+                ]
+
+            elif metric == "cosine":
+                distances = [
+                    1.0 - sum(map(mul, x, y)) / math.sqrt(x_norm * y_norm)
+                    if x_norm and y_norm
+                    else 1.0
+                    for y, y_norm in zip(tile, tile_norms)
+                ]
+
+            elif metric == "manhattan":
+                distances = [float(sum(map(abs, map(sub, x, y)))) for y in tile]
+
+            else:
+                distances = [float(max(map(abs, map(sub, x, y)), default=0)) for y in tile]
+
+            if top_k is None:
+                output.extend(distances)
+            else:
+                output.extend(zip(distances, range(start, start + len(tile))))
+                output[:] = heapq.nsmallest(top_k, output)
+
+    return result
+
+
+def _initialize_worker(*arguments: Any) -> None:
+    global _worker_arguments
+
+    _worker_arguments = arguments
+
+
+def _worker_block(block: tuple[list, list]) -> list:
+    return _distance_block(*block, *_worker_arguments)
+
+
+@overload
+def pairwise(
+    X: Matrix,
+    Y: Optional[Matrix] = None,
+    metric: Metric = "euclidean",
+    block_size: int = 256,
+    workers: Optional[int] = None,
+) -> Matrix:
+    """Calculates distances between all pairs of rows of X and Y.
+
+    Parameters
+    ----------
+    X : Matrix
+        Matrix with points in rows (a list of Vectors or lists is also accepted).
+    Y : Matrix, optional
+        Second set of points, by default X.
+    metric : {"euclidean", "cosine", "manhattan", "chebyshev"}, optional
+        Distance metric, default "euclidean". Cosine distance is 1 - cosine similarity.
+    block_size : int, optional
+        Number of rows in processed tiles, default 256.
+    workers : int, optional
+        Number of processes splitting rows of X between them, by default computed in the current process.
+
+    Returns
+    -------
+    Matrix
+        Float matrix (X rows x Y rows) with distances."""
+
+    pass
+
+
+@overload
+def pairwise(
+    X: Matrix,
+    Y: Optional[Matrix] = None,
+    metric: Metric = "euclidean",
+    block_size: int = 256,
+    workers: Optional[int] = None,
+    top_k: int = ...,
+) -> tuple[Matrix, Matrix]:
+    """Finds k nearest rows of Y for every row of X, without materializing the full distance matrix.
+
+    Parameters
+    ----------
+    X : Matrix
+        Matrix with points in rows (a list of Vectors or lists is also accepted).
+    Y : Matrix, optional
+        Second set of points, by default X.
+    metric : {"euclidean", "cosine", "manhattan", "chebyshev"}, optional
+        Distance metric, default "euclidean". Cosine distance is 1 - cosine similarity.
+    block_size : int, optional
+        Number of rows in processed tiles, default 256.
+    workers : int, optional
+        Number of processes splitting rows of X between them, by default computed in the current process.
+    top_k : int
+        Number of nearest neighbours kept for every row of X.
+
+    Returns
+    -------
+    tuple[Matrix, Matrix]
+        Float matrix with distances and int matrix with indices of rows of Y (both X rows x top_k),
+        ordered from the nearest."""
+
+    pass
+
+
+def pairwise(
+    X: Union[Matrix, Iterable],
+    Y: Optional[Union[Matrix, Iterable]] = None,
+    metric: Metric = "euclidean",
+    block_size: int = 256,
+    workers: Optional[int] = None,
+    top_k: Optional[int] = None,
+) -> Union[Matrix, tuple[Matrix, Matrix]]:
+    if metric not in ("euclidean", "cosine", "manhattan", "chebyshev"):
+        raise ValueError(
+            f'Unknown metric "{metric}", use "euclidean", "cosine", "manhattan" or "chebyshev"'
+        )
+
+    X = as_rows(X, "Distance")
+    Y = X if Y is None else as_rows(Y, "Distance")
+
+    if X and Y and len(X[0]) != len(Y[0]):
+        raise ArithmeticError("Cannot compare points with different dimensions")
+
+    if top_k is not None:
+        if not isinstance(top_k, int) or top_k < 1:
+            raise ValueError("top_k must be a positive integer")
+
+        top_k = min(top_k, len(Y))
+
+    block_size = max(block_size, 1)
+
+    x_norms = _norms(X) if metric in ("euclidean", "cosine") else [0] * len(X)
+    y_norms = (x_norms if Y is X else _norms(Y)) if metric in ("euclidean", "cosine") else [0] * len(Y)
+
+    blocks = [
+        (X[start : start + block_size], x_norms[start : start + block_size])
+        for start in range(0, len(X), block_size)
+    ]
+    arguments = (Y, y_norms, metric, top_k, block_size)
+
+    if workers is not None and workers > 1 and len(blocks) > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_initialize_worker,
+            initargs=arguments,
+        ) as executor:
+            results = list(executor.map(_worker_block, blocks))
+    else:
+        results = [_distance_block(*block, *arguments) for block in blocks]
+
+    rows = [row for result in results for row in result]
+
+    if top_k is None:
+        return Matrix._from_data(rows, float, columns=len(Y))
+
+    return (
+        Matrix._from_data(
+            [[distance for distance, _ in row] for row in rows], float, columns=top_k
+        ),
+        Matrix._from_data(
+            [[index for _, index in row] for row in rows], int, columns=top_k
+        ),
+    )
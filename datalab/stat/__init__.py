@@ -4,5 +4,32 @@
 )
 
 from datalab.stat.func.average import (
-    arithmetic
+    arithmetic,
+    weighted,
+    geometric,
+    harmonic,
+    trimmed,
+    median,
+)
+
+from datalab.stat.func.quantile import (
+    quantile,
+    percentile,
+    nth_element,
+)
+
+from datalab.stat.func.histogram import (
+    Histogram,
+    histogram,
+    digitize,
+)
+
+from datalab.stat.func.rolling import (
+    Rolling,
+    rolling,
+    ewma,
+)
+
+from datalab.stat.func.covariance import (
+    RunningCovariance,
 )
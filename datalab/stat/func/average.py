@@ -1,5 +1,61 @@
 from datalab.utils import *
-from datalab.stat import sum, count
+from datalab.stat.func.quantile import _order_statistics, _quantiles
+
+Number = Union[int, float, bool]
+
+
+def _dispatch(
+    arg: tuple,
+    kernel: Callable[[Iterable], float],
+    axis: Optional[int] = None,
+) -> Union[float, "Vector"]:
+    # Resolves the accepted argument forms: varargs of numbers, a single iterable (list, tuple, set, generator),
+    # a Vector, or a Matrix reduced as a whole (axis None), per column (axis 0) or per row (axis 1).
+    # Internal lists of Vector and Matrix are passed to the kernel directly, without copying.
+    from datalab.Matrix import Matrix
+    from datalab.Vector import Vector
+
+    object = arg[0] if len(arg) == 1 and not isinstance(arg[0], (int, float, bool)) else arg
+
+    if isinstance(object, Matrix):
+        rows = object.to_list()
+
+        if axis is None:
+            return kernel(itertools.chain.from_iterable(rows))
+
+        if axis == 0:
+            return Vector([kernel(column) for column in zip(*rows)], dtype=float)
+
+        if axis == 1:
+            return Vector([kernel(row) for row in rows], dtype=float)
+
+        raise ValueError("Axis must be None, 0 or 1")
+
+    if axis is not None:
+        raise ValueError("Axis can only be used with a Matrix")
+
+    if isinstance(object, Vector):
+        return kernel(object.to_list())
+
+    return kernel(object)
+
+
+def _total(values: Iterable) -> tuple[float, int]:
+    # Accurate sum and number of values in a single pass over any iterable.
+    counter = itertools.count()
+    total = math.fsum(value for value, _ in zip(values, counter))
+
+    return total, next(counter)
+
+
+def _mean(values: Iterable) -> float:
+    total, size = _total(values)
+
+    if not size:
+        raise ValueError("Average of an empty sequence is not defined")
+
+    return total / size
+
 
 @overload
 def arithmetic(*values: Union[int, float, bool]) -> float:
@@ -16,12 +72,12 @@ def arithmetic(*values: Union[int, float, bool]) -> float:
     Returns
     -------
     float
-        The arithmetic average of the input values.
+        The arithmetic average of the input values, 0.0 if no values are provided.
 
     Raises
     ------
-    ZeroDivisionError
-        If no values are provided, a ZeroDivisionError is raised.
+    TypeError
+        If any of the values is not a number.
 
     Examples
     --------
@@ -73,11 +129,271 @@ def arithmetic(object: Iterable[Union[int, float, bool]]) -> float:
     pass
 
 
-def arithmetic(*arg: Iterable[Union[int, float, bool]]) -> float:
+def arithmetic(*arg: Iterable[Union[int, float, bool]], axis: Optional[int] = None) -> float:
     if not arg:
         return 0.0
-    
-    try:
-        return sum(arg) / count(arg)
-    except TypeError:
-        return sum(arg[0]) / count(arg[0])
+
+    return _dispatch(arg, _mean, axis)
+
+
+def weighted(
+    values: Iterable[Number],
+    weights: Iterable[Number],
+    axis: Optional[int] = None,
+) -> Union[float, "Vector"]:
+    """Calculate the weighted arithmetic average of values.
+
+    Values and weights are consumed together in a single pass.
+
+    Parameters
+    ----------
+    values : Iterable[Union[int, float, bool]]
+        Sequence, Vector or Matrix of values.
+    weights : Iterable[Union[int, float, bool]]
+        Weights of values. For a Matrix with axis, weights of elements in every column (axis 0) or row (axis 1).
+    axis : int, optional
+        For a Matrix: None for all elements, 0 for every column, 1 for every row.
+
+    Returns
+    -------
+    float or Vector
+        The weighted average, or Vector of averages with axis.
+
+    Raises
+    ------
+    ValueError
+        If values and weights have different lengths or weights sum to zero.
+
+    Examples
+    --------
+    >>> weighted([1, 2, 3], [3, 1, 0])
+    1.25"""
+
+    weights = weights.to_list() if hasattr(weights, "to_list") else list(weights)
+    norm = math.fsum(weights)
+
+    def kernel(values: Iterable) -> float:
+        pairs = zip(values, weights, strict=True)
+        total = math.fsum(value * weight for value, weight in pairs)
+
+        if not norm:
+            raise ValueError("Weights must not sum to zero")
+
+        return total / norm
+
+    return _dispatch((values,), kernel, axis)
+
+
+def geometric(*values: Number, axis: Optional[int] = None) -> Union[float, "Vector"]:
+    """Calculate the geometric average of non-negative values.
+
+    Average is computed from the sum of logarithms, so products of many large or small values
+    do not overflow or underflow. Accepts numbers as arguments, a sequence, a Vector or a Matrix.
+
+    Parameters
+    ----------
+    *values : Union[int, float, bool] or Iterable
+        The input values.
+    axis : int, optional
+        For a Matrix: None for all elements, 0 for every column, 1 for every row.
+
+    Returns
+    -------
+    float or Vector
+        The geometric average (0.0 if any value is zero), or Vector of averages with axis.
+
+    Raises
+    ------
+    ValueError
+        If there are no values or some value is negative.
+
+    Examples
+    --------
+    >>> geometric(1, 4, 16)
+    4.0
+
+    >>> geometric([1e300, 1e300, 1e-300])  # product overflows float
+    9.999999999999825e+99"""
+
+    def kernel(values: Iterable) -> float:
+        zeros = False
+
+        def logarithms() -> Iterator[float]:
+            nonlocal zeros
+
+            for value in values:
+                if value > 0:
+                    yield math.log(value)
+
+                elif value == 0:
+                    zeros = True
+                    yield 0.0
+
+                else:
+                    raise ValueError("Geometric average is only defined for non-negative values")
+
+        mean = _mean(logarithms())
+
+        return 0.0 if zeros else math.exp(mean)
+
+    return _dispatch(values, kernel, axis)
+
+
+def harmonic(*values: Number, axis: Optional[int] = None) -> Union[float, "Vector"]:
+    """Calculate the harmonic average of non-negative values.
+
+    Accepts numbers as arguments, a sequence, a Vector or a Matrix.
+
+    Parameters
+    ----------
+    *values : Union[int, float, bool] or Iterable
+        The input values.
+    axis : int, optional
+        For a Matrix: None for all elements, 0 for every column, 1 for every row.
+
+    Returns
+    -------
+    float or Vector
+        The harmonic average (0.0 if any value is zero), or Vector of averages with axis.
+
+    Raises
+    ------
+    ValueError
+        If there are no values or some value is negative.
+
+    Examples
+    --------
+    >>> harmonic(1, 2, 4)
+    1.7142857142857142"""
+
+    def kernel(values: Iterable) -> float:
+        zeros = False
+
+        def reciprocals() -> Iterator[float]:
+            nonlocal zeros
+
+            for value in values:
+                if value > 0:
+                    yield 1 / value
+
+                elif value == 0:
+                    zeros = True
+                    yield 0.0
+
+                else:
+                    raise ValueError("Harmonic average is only defined for non-negative values")
+
+        mean = _mean(reciprocals())
+
+        return 0.0 if zeros else 1 / mean
+
+    return _dispatch(values, kernel, axis)
+
+
+def trimmed(
+    *values: Number,
+    proportion: float = 0.1,
+    axis: Optional[int] = None,
+) -> Union[float, "Vector"]:
+    """Calculate the trimmed (truncated) arithmetic average.
+
+    The given proportion of the smallest and of the largest values is discarded. Instead of sorting,
+    only the two boundary values are found by selection, so the average costs expected O(n).
+
+    Parameters
+    ----------
+    *values : Union[int, float, bool] or Iterable
+        The input values.
+    proportion : float, optional
+        Fraction of values cut from each end, in range [0, 0.5). Default 0.1.
+    axis : int, optional
+        For a Matrix: None for all elements, 0 for every column, 1 for every row.
+
+    Returns
+    -------
+    float or Vector
+        The trimmed average, or Vector of averages with axis.
+
+    Raises
+    ------
+    ValueError
+        If there are no values or proportion is out of range.
+
+    Examples
+    --------
+    >>> trimmed([1, 2, 3, 4, 100], proportion=0.2)
+    3.0"""
+
+    if not 0 <= proportion < 0.5:
+        raise ValueError("Proportion must be in range [0, 0.5)")
+
+    def kernel(values: Iterable) -> float:
+        values = values if isinstance(values, list) else list(values)
+        size = len(values)
+
+        if not size:
+            raise ValueError("Average of an empty sequence is not defined")
+
+        cut = int(proportion * size)
+        kept = size - 2 * cut
+        low, high = _order_statistics(values, [cut, size - cut - 1])
+
+        if low == high:
+            return float(low)
+
+        below_high = 0
+        inner = []
+
+        for value in values:
+            if value < high:
+                below_high += 1
+
+                if value > low:
+                    inner.append(value)
+
+        # copies of boundary values which fall into the kept ranks [cut, size - cut)
+        low_count = below_high - len(inner) - cut
+        high_count = size - cut - below_high
+
+        return (math.fsum(inner) + low * low_count + high * high_count) / kept
+
+    return _dispatch(values, kernel, axis)
+
+
+def median(*values: Number, axis: Optional[int] = None) -> Union[int, float, "Vector"]:
+    """Calculate median of values in expected linear time.
+
+    Middle element is found by selection (see `nth_element`), for an even number of values the average
+    of the two middle values is returned. Accepts numbers as arguments, a sequence, a Vector or a Matrix.
+
+    Parameters
+    ----------
+    *values : Union[int, float, bool] or Iterable
+        The input values.
+    axis : int, optional
+        For a Matrix: None for all elements, 0 for every column, 1 for every row.
+
+    Returns
+    -------
+    int, float or Vector
+        Median, or Vector of medians with axis.
+
+    Raises
+    ------
+    ValueError
+        If there are no values.
+
+    Examples
+    --------
+    >>> median([3, 1, 2])
+    2
+
+    >>> median(4, 1, 3, 2)
+    2.5"""
+
+    def kernel(values: Iterable) -> Union[int, float]:
+        values = values if isinstance(values, list) else list(values)
+
+        return _quantiles(values, [0.5], "midpoint")[0]
+
+    return _dispatch(values, kernel, axis)
@@ -0,0 +1,200 @@
+from datalab.utils import *
+
+
+class RunningCovariance:
+    """Streaming accumulator of means and covariance of variables (columns) over observations (rows)
+
+    Rows can be added chunk by chunk, every chunk is reduced to its mean and co-moment matrix and merged
+    with the current state (Chan, Golub, LeVeque pairwise update), so data never has to fit in memory at once.
+    Accumulators built on separate parts of data can be merged as well. Only lower triangle of the
+    co-moment matrix is computed.
+
+    Parameters
+    ----------
+    dimension : int, optional
+        Number of variables, by default taken from the first added chunk.
+
+    Example
+    -------
+    >>> accumulator = RunningCovariance()
+    >>> accumulator = accumulator.update([[1, 2], [2, 4]]).update([[3, 6]])
+    >>> accumulator.covariance().to_list()
+    [[1.0, 2.0], [2.0, 4.0]]"""
+
+    def __init__(self, dimension: Optional[int] = None) -> None:
+        self.__count = 0
+        self.__dimension = dimension
+        self.__mean = [0.0] * dimension if dimension else []
+        self.__comoment = [[0.0] * (i + 1) for i in range(dimension or 0)]
+
+    @property
+    def count(self) -> int:
+        """Number of accumulated observations"""
+
+        return self.__count
+
+    @property
+    def dimension(self) -> Optional[int]:
+        """Number of variables"""
+
+        return self.__dimension
+
+    def _merge(self, count: int, mean: list[float], comoment: list[list[float]]) -> None:
+        if not count:
+            return
+
+        if self.__dimension is None:
+            self.__dimension = len(mean)
+            self.__mean = [0.0] * len(mean)
+            self.__comoment = [[0.0] * (i + 1) for i in range(len(mean))]
+
+        if len(mean) != self.__dimension:
+            raise ArithmeticError("Cannot accumulate observations with different number of variables")
+
+        total = self.__count + count
+        delta = [b - a for a, b in zip(self.__mean, mean)]
+        factor = self.__count * count / total
+
+        self.__comoment = [
+            [
+                own + other + factor * delta[i] * delta_j
+                for own, other, delta_j in zip(row, other_row, delta)
+            ]
+            for i, (row, other_row) in enumerate(zip(self.__comoment, comoment))
+        ]
+        self.__mean = [a + d * count / total for a, d in zip(self.__mean, delta)]
+        self.__count = total
+
+    def update(self, rows: Iterable) -> Self:
+        """Adds chunk of observations.
+
+        Parameters
+        ----------
+        rows : Matrix or Iterable
+            Observations in rows: Matrix, or iterable of Vectors, lists or tuples.
+
+        Returns
+        -------
+        RunningCovariance
+            This accumulator.
+
+        Raises
+        ------
+        ArithmeticError
+            If rows have different lengths or different number of variables than already accumulated."""
+
+        from datalab.Matrix import Matrix
+        from datalab.Vector import Vector
+
+        rows = rows.to_list() if isinstance(rows, Matrix) else rows
+        rows = [row.to_list() if isinstance(row, Vector) else row for row in rows]
+
+        if not rows:
+            return self
+
+        dimension = len(rows[0]) if self.__dimension is None else self.__dimension
+
+        if any(len(row) != dimension for row in rows):
+            raise ArithmeticError("Cannot accumulate observations with different number of variables")
+
+        count = len(rows)
+        columns = [list(map(float, column)) for column in zip(*rows)]
+        mean = [math.fsum(column) / count for column in columns]
+        centered = [[item - m for item in column] for column, m in zip(columns, mean)]
+
+        mul = operator.mul
+        comoment = [
+            [sum(map(mul, centered[i], centered[j])) for j in range(i + 1)]
+            for i in range(len(centered))
+        ]
+
+        self._merge(count, mean, comoment)
+
+        return self
+
+    def merge(self, other: Self) -> Self:
+        """Merges state of another accumulator (e.g. computed on other part of data) into this one.
+
+        Returns
+        -------
+        RunningCovariance
+            This accumulator."""
+
+        self._merge(other.__count, other.__mean, other.__comoment)
+
+        return self
+
+    @property
+    def mean(self) -> "Vector":
+        """Means of the variables"""
+
+        from datalab.Vector import Vector
+
+        return Vector._from_data(list(self.__mean), float)
+
+    def covariance(self, ddof: int = 1) -> "Matrix":
+        """Returns covariance matrix of the variables.
+
+        Parameters
+        ----------
+        ddof : int, optional
+            Delta degrees of freedom, divisor is count - ddof. Default 1 (sample covariance).
+
+        Raises
+        ------
+        ArithmeticError
+            If there are not more observations than ddof."""
+
+        from datalab.Matrix import Matrix
+
+        if self.__count <= ddof:
+            raise ArithmeticError("Not enough observations to calculate covariance")
+
+        divisor = self.__count - ddof
+        size = self.__dimension
+        lower = self.__comoment
+
+        return Matrix._from_data(
+            [
+                [(lower[i][j] if j <= i else lower[j][i]) / divisor for j in range(size)]
+                for i in range(size)
+            ],
+            float,
+            columns=size,
+        )
+
+    def correlation(self) -> "Matrix":
+        """Returns Pearson correlation matrix of the variables.
+
+        Correlations with a constant variable are NaN.
+
+        Raises
+        ------
+        ArithmeticError
+            If there are less than two observations."""
+
+        from datalab.Matrix import Matrix
+
+        if self.__count < 2:
+            raise ArithmeticError("Not enough observations to calculate correlation")
+
+        size = self.__dimension
+        lower = self.__comoment
+        deviations = [math.sqrt(lower[i][i]) for i in range(size)]
+
+        def coefficient(i: int, j: int) -> float:
+            scale = deviations[i] * deviations[j]
+
+            if not scale:
+                return math.nan
+
+            if i == j:
+                return 1.0
+
+            return max(-1.0, min(1.0, (lower[i][j] if j <= i else lower[j][i]) / scale))
+
+        return Matrix._from_data(
+            [[coefficient(i, j) for j in range(size)] for i in range(size)],
+            float,
+            columns=size,
+        )
@@ -0,0 +1,281 @@
+from datalab.utils import *
+
+
+def _values(data: Iterable) -> list:
+    from datalab.Matrix import Matrix
+    from datalab.Vector import Vector
+
+    if isinstance(data, Matrix):
+        return list(itertools.chain.from_iterable(data.to_list()))
+
+    if isinstance(data, Vector):
+        return data.to_list()
+
+    return data if isinstance(data, list) else list(data)
+
+
+def _check_edges(edges: Iterable[Union[int, float]]) -> list[float]:
+    edges = [float(edge) for edge in (edges.to_list() if hasattr(edges, "to_list") else edges)]
+
+    if len(edges) < 2:
+        raise ValueError("At least two bin edges are required")
+
+    if any(a >= b for a, b in zip(edges, edges[1:])):
+        raise ValueError("Bin edges must be strictly increasing")
+
+    return edges
+
+
+def _uniform_edges(bins: int, low: float, high: float) -> list[float]:
+    width = (high - low) / bins
+
+    return [low + i * width for i in range(bins)] + [high]
+
+
+class Histogram:
+    """Histogram accumulated over chunks of data.
+
+    Bins are half-open intervals [edges[i], edges[i + 1]), the last one also includes the right edge.
+    Values outside of the edges are only counted in `outside`. For uniform bins (given by `bins` and `range`)
+    bin of a value is computed arithmetically in O(1), for custom edges it is found by binary search.
+    Histograms with the same edges, e.g. computed on parts of data in different processes, can be merged.
+
+    Parameters
+    ----------
+    bins : int, optional
+        Number of uniform bins, default 10. Requires `range`.
+    range : tuple[float, float], optional
+        Lower and upper edge of uniform bins.
+    edges : Iterable[float], optional
+        Strictly increasing custom bin edges, used instead of bins and range.
+
+    Example
+    -------
+    >>> histogram = Histogram(bins=2, range=(0, 10))
+    >>> histogram.update([1, 2, 7]).update([10, 11]).counts.to_list()
+    [2, 2]"""
+
+    def __init__(
+        self,
+        bins: int = 10,
+        range: Optional[tuple[float, float]] = None,
+        edges: Optional[Iterable[float]] = None,
+    ) -> None:
+        if edges is not None:
+            self.__edges = _check_edges(edges)
+            self.__uniform = False
+
+        else:
+            if range is None:
+                raise ValueError("Range of uniform bins must be given")
+
+            if not isinstance(bins, int) or bins < 1:
+                raise ValueError("Number of bins must be a positive integer")
+
+            low, high = map(float, range)
+
+            if not low < high:
+                raise ValueError("Lower edge of range must be less than upper edge")
+
+            self.__edges = _uniform_edges(bins, low, high)
+            self.__uniform = True
+
+        self.__counts = [0] * (len(self.__edges) - 1)
+        self.__outside = 0
+
+    @property
+    def edges(self) -> "Vector":
+        """Float Vector with bin edges"""
+
+        from datalab.Vector import Vector
+
+        return Vector._from_data(list(self.__edges), float)
+
+    @property
+    def counts(self) -> "Vector":
+        """Int Vector with number of values in every bin"""
+
+        from datalab.Vector import Vector
+
+        return Vector._from_data(list(self.__counts), int)
+
+    @property
+    def outside(self) -> int:
+        """Number of values outside of the edges (including NaN)"""
+
+        return self.__outside
+
+    @property
+    def total(self) -> int:
+        """Number of values in bins"""
+
+        return sum(self.__counts)
+
+    def update(self, data: Iterable[Union[int, float, bool]]) -> Self:
+        """Adds chunk of values.
+
+        Parameters
+        ----------
+        data : Iterable[Union[int, float, bool]]
+            Vector, Matrix (all elements), list or another iterable of numbers.
+
+        Returns
+        -------
+        Histogram
+            This histogram."""
+
+        values = _values(data)
+        edges = self.__edges
+        bins = len(self.__counts)
+        low, high = edges[0], edges[-1]
+
+        if self.__uniform:
+            scale = bins / (high - low)
+            indices = [int((value - low) * scale) for value in values if low <= value <= high]
+            found = collections.Counter(indices)
+            inside = len(indices)
+
+            # the right edge and rounding just below it fall behind the last bin
+            found[bins - 1] += found.pop(bins, 0)
+
+            for i, count in found.items():
+                self.__counts[i] += count
+
+        else:
+            found = collections.Counter(map(functools.partial(bisect.bisect_right, edges), values))
+            on_right_edge = values.count(high)
+            inside = len(values) - found[0] - found[len(edges)] + on_right_edge
+
+            self.__counts[-1] += on_right_edge
+
+            for i in range(1, len(edges)):
+                self.__counts[i - 1] += found[i]
+
+        self.__outside += len(values) - inside
+
+        return self
+
+    def merge(self, other: Self) -> Self:
+        """Adds counts of another histogram with the same edges.
+
+        Returns
+        -------
+        Histogram
+            This histogram.
+
+        Raises
+        ------
+        ValueError
+            If histograms have different edges."""
+
+        if self.__edges != other.__edges:
+            raise ValueError("Only histograms with the same edges can be merged")
+
+        self.__counts = [a + b for a, b in zip(self.__counts, other.__counts)]
+        self.__outside += other.__outside
+
+        return self
+
+
+def histogram(
+    data: Iterable[Union[int, float, bool]],
+    bins: int = 10,
+    range: Optional[tuple[float, float]] = None,
+    edges: Optional[Iterable[float]] = None,
+) -> tuple["Vector", "Vector"]:
+    """Compute histogram of values.
+
+    Bins are half-open intervals [edges[i], edges[i + 1]), the last one also includes the right edge,
+    values outside of the edges are ignored. See `Histogram` for accumulation over chunks of a stream.
+
+    Parameters
+    ----------
+    data : Iterable[Union[int, float, bool]]
+        Vector, Matrix (all elements), list or another iterable of numbers.
+    bins : int, optional
+        Number of uniform bins, default 10.
+    range : tuple[float, float], optional
+        Lower and upper edge of uniform bins, by default minimum and maximum of data.
+    edges : Iterable[float], optional
+        Strictly increasing custom bin edges, used instead of bins and range.
+
+    Returns
+    -------
+    tuple[Vector, Vector]
+        Int Vector with counts of values in bins and float Vector with bin edges.
+
+    Raises
+    ------
+    ValueError
+        If bins or edges are invalid, or range is not given for empty data.
+
+    Examples
+    --------
+    >>> counts, edges = histogram([1, 2, 2, 3, 4], bins=3)
+    >>> counts.to_list(), edges.to_list()
+    ([1, 2, 2], [1.0, 2.0, 3.0, 4.0])
+
+    >>> histogram([0.5, 5, 50], edges=[0, 1, 10, 100])[0].to_list()
+    [1, 1, 1]"""
+
+    values = _values(data)
+
+    if edges is None and range is None:
+        if not values:
+            raise ValueError("Range of bins must be given for empty data")
+
+        low, high = min(values), max(values)
+        range = (low, high) if low < high else (low - 0.5, high + 0.5)
+
+    accumulator = Histogram(bins, range, edges).update(values)
+
+    return accumulator.counts, accumulator.edges
+
+
+def digitize(
+    data: Iterable[Union[int, float, bool]],
+    edges: Iterable[float],
+    right: bool = False,
+) -> Union["Vector", "Matrix"]:
+    """Find indices of bins to which values belong.
+
+    For right=False the index i satisfies edges[i - 1] <= value < edges[i], for right=True
+    edges[i - 1] < value <= edges[i]. Values below the first edge get 0, above the last edge len(edges).
+    Every lookup is a binary search in the edges.
+
+    Parameters
+    ----------
+    data : Iterable[Union[int, float, bool]]
+        Vector, Matrix, list or another iterable of numbers.
+    edges : Iterable[float]
+        Strictly increasing bin edges.
+    right : bool, optional
+        Whether bins include their right edge instead of the left one. Default False.
+
+    Returns
+    -------
+    Vector or Matrix
+        Int Vector with bin indices, or Matrix of the same shape for Matrix data.
+
+    Raises
+    ------
+    ValueError
+        If edges are not strictly increasing.
+
+    Examples
+    --------
+    >>> digitize([0.2, 6.4, 3.0, 1.6], [0.0, 1.0, 2.5, 4.0, 10.0]).to_list()
+    [1, 4, 3, 2]"""
+
+    from datalab.Matrix import Matrix
+    from datalab.Vector import Vector
+
+    edges = _check_edges(edges)
+    locate = functools.partial(bisect.bisect_left if right else bisect.bisect_right, edges)
+
+    if isinstance(data, Matrix):
+        return Matrix._from_data(
+            [list(map(locate, row)) for row in data.to_list()], int, columns=data.columns
+        )
+
+    return Vector._from_data(list(map(locate, _values(data))), int)
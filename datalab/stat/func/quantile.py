@@ -0,0 +1,255 @@
+from datalab.utils import *
+
+QuantileMethod = Literal["linear", "lower", "higher", "nearest", "midpoint"]
+
+# below this size sorting (in C) is faster than another partitioning pass
+_SORT_CUTOFF = 512
+
+
+def _select(data: list, ranks: list[int], generator: random.Random) -> list:
+    # Values with given (ascending) ranks in data, i.e. data sorted at these positions.
+    #
+    # Floyd-Rivest selection: two pivots are taken from a sorted random sample, so that the wanted rank
+    # lies between them with high probability. One partitioning pass then leaves only O(n^(2/3)) elements
+    # in the middle part. Ranks falling to the outer parts (other requested ranks or an unlucky sample)
+    # are resolved recursively, so several ranks cost O(n log(number of ranks)) in total.
+
+    if not ranks:
+        return []
+
+    size = len(data)
+
+    if size <= _SORT_CUTOFF:
+        data = sorted(data)
+
+        return [data[rank] for rank in ranks]
+
+    k = ranks[len(ranks) // 2]
+    samples = int(size ** (2 / 3))
+    gap = int(math.sqrt(samples * math.log(size)) / 2) + 1
+    sample = sorted(generator.sample(data, samples))
+    position = k * samples // size
+    low = sample[max(position - gap, 0)]
+    high = sample[min(position + gap, samples - 1)]
+
+    below = [item for item in data if item < low]
+    above = [item for item in data if item > high]
+
+    if not below and not above:
+        if low == high:
+            return [low] * len(ranks)
+
+        data = sorted(data)
+
+        return [data[rank] for rank in ranks]
+
+    middle = [item for item in data if low <= item <= high]
+    lower_bound = len(below)
+    upper_bound = lower_bound + len(middle)
+
+    first = bisect.bisect_left(ranks, lower_bound)
+    last = bisect.bisect_left(ranks, upper_bound)
+
+    return (
+        _select(below, ranks[:first], generator)
+        + _select(middle, [rank - lower_bound for rank in ranks[first:last]], generator)
+        + _select(above, [rank - upper_bound for rank in ranks[last:]], generator)
+    )
+
+
+def _order_statistics(values: list, ranks: Iterable[int]) -> list:
+    # Selected values for arbitrary (unsorted, repeated) ranks, in the order of ranks.
+    ranks = list(ranks)
+    unique = sorted(set(ranks))
+    selected = dict(zip(unique, _select(values, unique, random.Random(len(values)))))
+
+    return [selected[rank] for rank in ranks]
+
+
+def _quantiles(values: list, qs: list[float], method: QuantileMethod) -> list:
+    size = len(values)
+
+    if not size:
+        raise ValueError("Quantile of an empty sequence is not defined")
+
+    positions = [q * (size - 1) for q in qs]
+
+    if method == "lower":
+        return _order_statistics(values, (math.floor(h) for h in positions))
+
+    if method == "higher":
+        return _order_statistics(values, (math.ceil(h) for h in positions))
+
+    if method == "nearest":
+        return _order_statistics(values, (round(h) for h in positions))
+
+    lower = [math.floor(h) for h in positions]
+    upper = [math.ceil(h) for h in positions]
+    statistics = _order_statistics(values, lower + upper)
+    a, b = statistics[:len(qs)], statistics[len(qs):]
+
+    if method == "midpoint":
+        return [x if i == j else (x + y) / 2 for x, y, i, j in zip(a, b, lower, upper)]
+
+    return [x if i == j else x + (h - i) * (y - x) for x, y, h, i, j in zip(a, b, positions, lower, upper)]
+
+
+def _apply(
+    object: Iterable,
+    reduce: Callable[[list], list],
+    axis: Optional[int],
+) -> list:
+    # Applies reduction (list of values -> list of statistics) to flattened object, or to every
+    # column (axis 0) or row (axis 1) of a Matrix, then results are indexed [statistic][column or row].
+    from datalab.Matrix import Matrix
+    from datalab.Vector import Vector
+
+    if isinstance(object, Matrix):
+        if axis is None:
+            return reduce([item for row in object.to_list() for item in row])
+
+        if axis == 0:
+            lines = [list(column) for column in zip(*object.to_list())]
+        elif axis == 1:
+            lines = object.to_list()
+        else:
+            raise ValueError("Axis must be None, 0 or 1")
+
+        return [Vector(list(statistics)) for statistics in zip(*map(reduce, lines))]
+
+    if axis is not None:
+        raise ValueError("Axis can only be used with a Matrix")
+
+    if isinstance(object, Vector):
+        return reduce(object.to_list())
+
+    return reduce(list(object))
+
+
+def _check_quantiles(q: Union[float, Iterable[float]]) -> tuple[list[float], bool]:
+    scalar = isinstance(q, (int, float))
+    qs = [q] if scalar else list(q)
+
+    if any(not 0 <= value <= 1 for value in qs):
+        raise ValueError("Quantiles must be in range from 0 to 1")
+
+    return qs, scalar
+
+
+def nth_element(
+    object: Iterable[Union[int, float, bool]],
+    n: int,
+) -> Union[int, float, bool]:
+    """Find the n-th smallest element of a sequence without sorting it.
+
+    Selection runs in expected linear time (Floyd-Rivest algorithm) and does not modify the object.
+
+    Parameters
+    ----------
+    object : Iterable[Union[int, float, bool]]
+        Vector, list, tuple or another iterable of comparable values.
+    n : int
+        Zero-based rank of the element, negative ranks count from the largest element.
+
+    Returns
+    -------
+    Union[int, float, bool]
+        Element which would be at index n if the sequence was sorted.
+
+    Raises
+    ------
+    ValueError
+        If n is out of range.
+
+    Examples
+    --------
+    >>> nth_element([7, 1, 5, 3], 1)
+    3
+
+    >>> nth_element(vector([7, 1, 5, 3]), -1)
+    7"""
+
+    values = object.to_list() if hasattr(object, "to_list") else list(object)
+
+    if not -len(values) <= n < len(values):
+        raise ValueError("Rank of element is out of range")
+
+    return _order_statistics(values, [n % len(values)])[0]
+
+
+def quantile(
+    object: Iterable[Union[int, float, bool]],
+    q: Union[float, Iterable[float]],
+    method: QuantileMethod = "linear",
+    axis: Optional[int] = None,
+) -> Union[int, float, list, "Vector", "Matrix"]:
+    """Calculate quantile(s) of values by selection instead of sorting.
+
+    All requested quantiles are computed together in expected O(n log(number of quantiles)) time,
+    so e.g. p50, p95 and p99 of a latency window cost about as much as a single pass.
+
+    Parameters
+    ----------
+    object : Iterable[Union[int, float, bool]]
+        Vector, Matrix, list, tuple or another iterable of numbers.
+    q : float or Iterable[float]
+        Quantile or sequence of quantiles in range from 0 to 1.
+    method : {"linear", "lower", "higher", "nearest", "midpoint"}, optional
+        How to interpolate when quantile lies between two elements i < j (sorted positions):
+        linearly, element i, element j, the nearest one, or their average. Default "linear".
+    axis : int, optional
+        For a Matrix: None for all elements, 0 for every column, 1 for every row.
+
+    Returns
+    -------
+    int, float, list, Vector or Matrix
+        Single value for scalar q, list of values for a sequence of qs. With axis a Vector for
+        scalar q, otherwise a Matrix with a row for every quantile.
+
+    Raises
+    ------
+    ValueError
+        If object is empty, quantile is out of range, method is unknown or axis is invalid.
+
+    Examples
+    --------
+    >>> quantile([1, 2, 3, 4], 0.5)
+    2.5
+
+    >>> quantile(range(101), [0.5, 0.95, 0.99])
+    [50, 95, 99]"""
+
+    if method not in ("linear", "lower", "higher", "nearest", "midpoint"):
+        raise ValueError(f'Unknown method "{method}"')
+
+    qs, scalar = _check_quantiles(q)
+    result = _apply(object, lambda values: _quantiles(values, qs, method), axis)
+
+    if scalar:
+        return result[0]
+
+    if axis is not None:
+        from datalab.Matrix import Matrix
+
+        return Matrix([vector.to_list() for vector in result])
+
+    return result
+
+
+def percentile(
+    object: Iterable[Union[int, float, bool]],
+    p: Union[float, Iterable[float]],
+    method: QuantileMethod = "linear",
+    axis: Optional[int] = None,
+) -> Union[int, float, list, "Vector", "Matrix"]:
+    """Calculate percentile(s) of values, same as `quantile` with p in range from 0 to 100.
+
+    Examples
+    --------
+    >>> percentile([15, 20, 35, 40, 50], 40)
+    29.0"""
+
+    if isinstance(p, (int, float)):
+        return quantile(object, p / 100, method, axis)
+
+    return quantile(object, [value / 100 for value in p], method, axis)
@@ -0,0 +1,280 @@
+from datalab.Vector import Vector
+
+from datalab.utils import *
+
+RollingStatistic = Literal["sum", "mean", "var", "std", "min", "max"]
+
+
+def _check_window(window: int) -> None:
+    if not isinstance(window, int) or window < 1:
+        raise ValueError("Window size must be a positive integer")
+
+
+def _sums(iterable: Iterable, window: int) -> Iterator:
+    # Running sum, float sums are recomputed exactly once per window to stop accumulation of rounding errors.
+    buffer = collections.deque()
+    total = 0
+
+    for i, item in enumerate(iterable):
+        buffer.append(item)
+        total += item
+
+        if len(buffer) > window:
+            total -= buffer.popleft()
+
+        if len(buffer) == window:
+            if isinstance(total, float) and i % window == 0:
+                total = math.fsum(buffer)
+
+            yield total
+
+
+def _moments(iterable: Iterable, window: int) -> Iterator[tuple[float, float]]:
+    # Mean and sum of squared deviations of every window, Welford update for added and removed element,
+    # refreshed exactly once per window.
+    buffer = collections.deque()
+    mean = m2 = 0.0
+
+    for i, item in enumerate(iterable):
+        buffer.append(item)
+
+        if len(buffer) > window:
+            removed = buffer.popleft()
+            previous = mean
+            mean += (item - removed) / window
+            m2 += (item - removed) * (item - mean + removed - previous)
+
+        else:
+            delta = item - mean
+            mean += delta / len(buffer)
+            m2 += delta * (item - mean)
+
+        if len(buffer) == window:
+            if i % window == 0:
+                mean = math.fsum(buffer) / window
+                m2 = math.fsum((value - mean) ** 2 for value in buffer)
+
+            yield mean, max(m2, 0.0)
+
+
+def _extremes(iterable: Iterable, window: int, dominated: Callable) -> Iterator:
+    # Monotonic deque of (index, value) candidates, the front is extreme of the current window.
+    candidates = collections.deque()
+
+    for i, item in enumerate(iterable):
+        while candidates and dominated(candidates[-1][1], item):
+            candidates.pop()
+
+        candidates.append((i, item))
+
+        if candidates[0][0] <= i - window:
+            candidates.popleft()
+
+        if i >= window - 1:
+            yield candidates[0][1]
+
+
+def rolling(
+    iterable: Iterable[Union[int, float, bool]],
+    window: int,
+    statistic: RollingStatistic = "mean",
+    ddof: int = 1,
+) -> Iterator[Union[int, float, bool]]:
+    """Streams statistic of a sliding window over values.
+
+    Values are consumed lazily, one result is yielded for every full window (first one after `window` values),
+    only the window itself is kept in memory. Every step costs amortized O(1).
+
+    Parameters
+    ----------
+    iterable : Iterable[Union[int, float, bool]]
+        Values, e.g. an iterator reading them from a file or socket.
+    window : int
+        Number of values in a window.
+    statistic : {"sum", "mean", "var", "std", "min", "max"}, optional
+        Computed statistic, default "mean".
+    ddof : int, optional
+        Delta degrees of freedom of "var" and "std", divisor is window - ddof. Default 1.
+
+    Yields
+    ------
+    int or float or bool
+        Statistic of the window ending at the current value.
+
+    Raises
+    ------
+    ValueError
+        If window is not a positive integer, statistic is unknown or window - ddof is not positive.
+
+    Examples
+    --------
+    >>> list(rolling([1, 2, 3, 4, 5], 3))
+    [2.0, 3.0, 4.0]
+
+    >>> list(rolling(iter([3, 1, 4, 1, 5]), 2, "max"))
+    [3, 4, 4, 5]"""
+
+    _check_window(window)
+
+    if statistic == "sum":
+        return _sums(iterable, window)
+
+    if statistic == "mean":
+        return (total / window for total in _sums(iterable, window))
+
+    if statistic in ("var", "std"):
+        if window - ddof <= 0:
+            raise ValueError("Window size must be greater than ddof")
+
+        variances = (m2 / (window - ddof) for _, m2 in _moments(iterable, window))
+
+        return variances if statistic == "var" else map(math.sqrt, variances)
+
+    if statistic == "min":
+        return _extremes(iterable, window, operator.ge)
+
+    if statistic == "max":
+        return _extremes(iterable, window, operator.le)
+
+    raise ValueError(f'Unknown statistic "{statistic}"')
+
+
+def ewma(
+    iterable: Iterable[Union[int, float, bool]],
+    alpha: Optional[float] = None,
+    span: Optional[float] = None,
+    halflife: Optional[float] = None,
+    adjust: bool = True,
+) -> Iterator[float]:
+    """Streams exponentially weighted moving average of values.
+
+    Exactly one of alpha, span and halflife has to be given.
+
+    Parameters
+    ----------
+    iterable : Iterable[Union[int, float, bool]]
+        Values, e.g. an iterator reading them from a file or socket.
+    alpha : float, optional
+        Smoothing factor in range (0, 1].
+    span : float, optional
+        Span s >= 1, alpha = 2 / (s + 1).
+    halflife : float, optional
+        Number of values after which weight halves, alpha = 1 - exp(-ln(2) / halflife).
+    adjust : bool, optional
+        If True (default), average is normalized by the sum of weights of values seen so far,
+        which removes bias of the first values. If False, recursion y = alpha * x + (1 - alpha) * y
+        starting with the first value is used.
+
+    Yields
+    ------
+    float
+        Average after every value.
+
+    Raises
+    ------
+    ValueError
+        If not exactly one of alpha, span and halflife is given, or it is out of range.
+
+    Examples
+    --------
+    >>> list(ewma([1, 2, 3], alpha=0.5, adjust=False))
+    [1.0, 1.5, 2.25]"""
+
+    if (alpha, span, halflife).count(None) != 2:
+        raise ValueError("Exactly one of alpha, span and halflife must be given")
+
+    if span is not None:
+        if span < 1:
+            raise ValueError("Span must be at least 1")
+
+        alpha = 2 / (span + 1)
+
+    elif halflife is not None:
+        if halflife <= 0:
+            raise ValueError("Halflife must be positive")
+
+        alpha = 1 - math.exp(-math.log(2) / halflife)
+
+    elif not 0 < alpha <= 1:
+        raise ValueError("Alpha must be in range (0, 1]")
+
+    decay = 1 - alpha
+    average = weights = None
+
+    for item in iterable:
+        if average is None:
+            average, weights = float(item), 1.0
+
+        elif adjust:
+            weights = 1 + decay * weights
+            average += (item - average) / weights
+
+        else:
+            average += alpha * (item - average)
+
+        yield average
+
+
+class Rolling:
+    """Sliding windows over a Vector, created by `Vector.rolling`.
+
+    Every statistic is computed in a single O(n) pass: sums and moments are updated when a value
+    enters and leaves the window, minima and maxima are kept in a monotonic deque. Results are
+    returned for full windows only, so they have size - window + 1 elements.
+    See `datalab.stat.rolling` for a streaming variant over iterators.
+
+    Example
+    -------
+    >>> vector([1, 5, 2, 4]).rolling(2).max().to_list()
+    [5, 5, 4]"""
+
+    def __init__(self, vector: Vector, window: int) -> None:
+        _check_window(window)
+
+        if vector.dtype not in (int, float, bool):
+            raise TypeError("Rolling statistics are only defined for int, float and bool vectors")
+
+        self.__values = vector.to_list()
+        self.__dtype = vector.dtype
+        self.__window = window
+
+    @property
+    def window(self) -> int:
+        """Number of values in a window"""
+
+        return self.__window
+
+    def _compute(self, statistic: RollingStatistic, dtype: type, ddof: int = 1) -> Vector:
+        return Vector._from_data(
+            list(rolling(self.__values, self.__window, statistic, ddof)), dtype
+        )
+
+    def sum(self) -> Vector:
+        """Sums of windows"""
+
+        return self._compute("sum", float if self.__dtype is float else int)
+
+    def mean(self) -> Vector:
+        """Arithmetic averages of windows"""
+
+        return self._compute("mean", float)
+
+    def var(self, ddof: int = 1) -> Vector:
+        """Variances of windows, divisor is window - ddof (default 1, sample variance)"""
+
+        return self._compute("var", float, ddof)
+
+    def std(self, ddof: int = 1) -> Vector:
+        """Standard deviations of windows, divisor of variance is window - ddof (default 1)"""
+
+        return self._compute("std", float, ddof)
+
+    def min(self) -> Vector:
+        """Minimal values of windows"""
+
+        return self._compute("min", self.__dtype)
+
+    def max(self) -> Vector:
+        """Maximal values of windows"""
+
+        return self._compute("max", self.__dtype)
@@ -69,3 +69,35 @@ def has_same_type(*values: type) -> bool:
             return False
 
     return True
+
+
+def as_rows(object: Iterable, name: str) -> list:
+    """Converts points given as rows of a Matrix or as an iterable of Vectors, lists or tuples into a list of rows
+
+    Parameters
+    ----------
+    object : Matrix or Iterable
+        Matrix with points in rows, or iterable of Vectors, lists or tuples.
+    name : str
+        Name of the operation used in the error message.
+
+    Returns
+    -------
+    list
+        Rows as lists. Rows of a Matrix are its internal lists, so they must not be modified.
+
+    Raises
+    ------
+    TypeError
+        If Matrix dtype is not int, float or bool."""
+
+    from datalab.Matrix import Matrix
+    from datalab.Vector import Vector
+
+    if isinstance(object, Matrix):
+        if object.dtype not in (int, float, bool):
+            raise TypeError(f"{name} is only defined for int, float and bool matrices")
+
+        return object.to_list()
+
+    return [row.to_list() if isinstance(row, Vector) else list(row) for row in object]
@@ -1 +1,11 @@
+import bisect
+import collections
 import copy
+import functools
+import heapq
+import itertools
+import math
+import operator
+import random
+import sys
+from fractions import Fraction
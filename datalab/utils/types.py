@@ -3,7 +3,10 @@
 from collections.abc import Sized
 
 from typing import (
+    Callable,
+    Hashable,
     Iterable,
+    Iterator,
     Optional,
     TypeVar,
     TextIO,